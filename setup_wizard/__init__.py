@@ -42,7 +42,8 @@ else:
 
     import setup_wizard.ui.gi_ui_setup_wizard_menu
     from setup_wizard.ui.unified_ui_setup_wizard_menu import \
-        CSW_PT_Unified_Character_Setup_Wizard_UI_Layout
+        CSW_PT_Unified_Character_Setup_Wizard_UI_Layout, \
+        CSW_PT_Setup_Wizard_Run_Report
     from setup_wizard.ui.gi_ui_setup_wizard_menu import \
         UI_Properties, \
         GI_PT_Setup_Wizard_UI_Layout, \
@@ -94,6 +95,7 @@ else:
         CharacterRiggerPropertyManager,
         CharacterSetupWizardAddonPreferences,
         CSW_PT_Unified_Character_Setup_Wizard_UI_Layout,
+        CSW_PT_Setup_Wizard_Run_Report,
         GI_PT_Setup_Wizard_UI_Layout, 
         GI_PT_Basic_Setup_Wizard_UI_Layout,
         GI_PT_Advanced_Setup_Wizard_UI_Layout,
@@ -4,6 +4,7 @@ import bpy
 from bpy.types import Operator
 
 from setup_wizard.import_order import clear_cache
+from setup_wizard.material_data_import_setup.material_data_cache import MaterialDataCache
 from setup_wizard.setup_wizard_operator_base_classes import CustomOperatorProperties
 
 class ClearCacheOperator(Operator, CustomOperatorProperties):
@@ -13,6 +14,7 @@ class ClearCacheOperator(Operator, CustomOperatorProperties):
 
     def execute(self, context):
         clear_cache(self.game_type)
+        MaterialDataCache().clear()
         return {'FINISHED'}
 
 register, unregister = bpy.utils.register_classes_factory(ClearCacheOperator)
@@ -2,6 +2,9 @@
 
 import bpy
 
+from setup_wizard.instrumentation.span_tracer import trace_span
+
+@trace_span('hsr_rig_script.rig_character', 'rig')
 def rig_character(
     file_path, 
     disallow_arm_ik_stretch, 
@@ -3,6 +3,7 @@ import os
 
 from setup_wizard.domain.shader_identifier_service import GenshinImpactShaders, ShaderIdentifierServiceFactory
 from setup_wizard.geometry_nodes_setup.lighting_panel_names import LightingPanelNames
+from setup_wizard.instrumentation.span_tracer import span_tracer
 
 
 class LightingPanelFileNames:
@@ -52,13 +53,14 @@ class LightingPanel:
 
     def import_lighting_panel(self):
         inner_path = 'Collection'
-        bpy.ops.wm.append(
-            filepath=os.path.join(self.lighting_panel_filepath, inner_path, LightingPanelNames.Collections.LIGHTING_PANEL),
-            directory=os.path.join(self.lighting_panel_filepath, inner_path),
-            files=[
-                {'name': LightingPanelNames.Collections.LIGHTING_PANEL},
-            ],
-        )
+        with span_tracer.span('Append Lighting Panel', 'append'):
+            bpy.ops.wm.append(
+                filepath=os.path.join(self.lighting_panel_filepath, inner_path, LightingPanelNames.Collections.LIGHTING_PANEL),
+                directory=os.path.join(self.lighting_panel_filepath, inner_path),
+                files=[
+                    {'name': LightingPanelNames.Collections.LIGHTING_PANEL},
+                ],
+            )
 
     def prevent_lighting_issues_when_scaling_character(self, lighting_panel_armature):
         if not lighting_panel_armature:
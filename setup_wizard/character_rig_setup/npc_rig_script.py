@@ -8,7 +8,9 @@ from math import pi
 import addon_utils
 
 from setup_wizard.geometry_nodes_setup.lighting_panel_names import LightingPanelNames
+from setup_wizard.instrumentation.span_tracer import trace_span
 
+@trace_span('npc_rig_script.rig_character', 'rig')
 def rig_character(
         file_path, 
         disallow_arm_ik_stretch, 
@@ -10,8 +10,10 @@ from math import pi
 
 from setup_wizard.domain.decorators import preserve_context
 from setup_wizard.geometry_nodes_setup.lighting_panel_names import LightingPanelNames
+from setup_wizard.instrumentation.span_tracer import span_tracer, trace_span
 
 
+@trace_span('rig_script.rig_character', 'rig')
 def rig_character(
         file_path,
         lighting_panel_version, 
@@ -23,6 +25,7 @@ def rig_character(
         use_head_tracker,
         meshes_joined=False):
     
+    span_tracer.phase('Prepare Metarig')
     # Firstly, let's make a flag to identify the blender version.
     is_version_4 = False
     version_string = bpy.app.version_string
@@ -614,6 +617,7 @@ def rig_character(
         metarm.edit_bones["upper_arm.L"].tail.y += .003
         metarm.edit_bones["upper_arm.R"].tail.y += .003
 
+    span_tracer.phase('Detach Physics Bones')
     ##########  DETACH PHYSICS BONES,  
 
     metanames = ['eye.L', 'eye.R', 'spine', 'thigh.L', 'shin.L', 'foot.L', 'toe.L', 'thigh.R', 'shin.R', 'foot.R', 'toe.R', 'spine.001', 'spine.002', 'spine.003', 'breast.L', 'breast.R', 'shoulder.L', 'upper_arm.L', 'forearm.L', 'hand.L', 'thumb.01.L', 'thumb.02.L', 'thumb.03.L', 'f_index.01.L', 'f_index.02.L', 'f_index.03.L', 'f_middle.01.L', 'f_middle.02.L', 'f_middle.03.L', 'f_ring.01.L', 'f_ring.02.L', 'f_ring.03.L', 'f_pinky.01.L', 'f_pinky.02.L', 'f_pinky.03.L', 'spine.004', 'spine.006', 'shoulder.R', 'upper_arm.R', 'forearm.R', 'hand.R', 'thumb.01.R', 'thumb.02.R', 'thumb.03.R', 'f_index.01.R', 'f_index.02.R', 'f_index.03.R', 'f_middle.01.R', 'f_middle.02.R', 'f_middle.03.R', 'f_ring.01.R', 'f_ring.02.R', 'f_ring.03.R', 'f_pinky.01.R', 'f_pinky.02.R', 'f_pinky.03.R']
@@ -654,6 +658,7 @@ def rig_character(
             bone.select_head = True
 
     bpy.ops.armature.separate()
+    span_tracer.phase('Generate Rigify Rig')
     # Generates rigify rig and renames it to 'rigify'
     bpy.ops.pose.rigify_generate()
     bpy.data.objects[obj.name].name = "rigify"
@@ -665,6 +670,7 @@ def rig_character(
         if o.name in ("rigify", armature.name):
             o.select_set(True)
             
+    span_tracer.phase('Reattach Physics Bones')
     # THEN REATTACH PHYSICS
 
     bpy.ops.object.mode_set(mode='OBJECT')
@@ -851,6 +857,7 @@ def rig_character(
 
     fix_forearm_twist_bones(armature_object)
 
+    span_tracer.phase('Post Rigify Setup')
     # POST RIGIFY SCRIPT EXECUTION ----------------->
 
     # Delete metarig
@@ -1007,6 +1014,7 @@ def rig_character(
             if bone.layers[0]:  # Check if the bone is on layer face
                 move_bone(bone.name, 25)  # Move the bone to layer 23
             
+    span_tracer.phase('Append Rig Extras')
     # Let's append our root_shape custom bones
     path_to_file = file_path + "/Collection"
 
@@ -1244,6 +1252,7 @@ def rig_character(
         armature.edit_bones['foot_spin_ik.R'].head.z = 0
         armature.edit_bones['foot_spin_ik.R'].tail.z = 0
     
+    span_tracer.phase('Set Up Bone Relationships')
     # SET RELATIONSHIPS as needed after bringing in new bones  
     armature.edit_bones['root'].parent = armature.edit_bones['root-inner']
     
@@ -2835,6 +2844,7 @@ def rig_character(
     for bone in bpy.context.active_object.pose.bones:
         bone.bone.select = False
         
+    span_tracer.phase('Edit Rig UI Script')
     # EDITING ui.py TEXT FILE --------------------------------------------
     rig_file = bpy.data.texts[original_name+'_ui.py'] # Rig script for this char in question
     
@@ -3295,6 +3305,7 @@ def rig_character(
         bpy.context.object.data.collections["Other"].is_visible = False
     
     # Send the given bone to its new location for either version. Adjusted for actual layer num.
+    span_tracer.phase('Move Bones To Layers')
     # MOVING OF BONES BELOW -------------------------------
     def bone_to_layer(bone, layer, collection, second_coll="None"):
         arm = bpy.context.object
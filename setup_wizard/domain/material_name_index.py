@@ -0,0 +1,57 @@
+# Author: michael-gh1
+
+
+class MaterialNameIndex:
+    '''
+    Index of the material and node group names in the scene, used by ShaderIdentifierService to resolve its
+    identification rules.
+
+    * Exact material names and node group names are looked up in a dict/set
+    * Prefix, suffix and substring lookups are direct scans over the material names, which are cheaper than
+      building and keeping a prefix/suffix structure for the handful of rules that need them
+
+    An index is built once per scene generation (material and node group counts and names) and reused until they change.
+    '''
+    indexes = {}
+
+    def __init__(self, materials, node_groups):
+        self.materials = list(materials)
+        self.materials_by_name = {}
+        for material in self.materials:
+            self.materials_by_name.setdefault(material.name, material)
+        self.node_group_names = set(node_group.name for node_group in node_groups)
+
+    @classmethod
+    def get(cls, materials, node_groups):
+        scene_generation = cls.get_scene_generation(materials, node_groups)
+        index = cls.indexes.get(scene_generation)
+        if index is None:
+            cls.indexes.clear()  # Only keep the index of the current scene generation
+            index = cls(materials, node_groups)
+            cls.indexes[scene_generation] = index
+        return index
+
+    @classmethod
+    def clear(cls):
+        cls.indexes.clear()
+
+    def get_material(self, name):
+        return self.materials_by_name.get(name)
+
+    def has_node_group(self, name):
+        return name in self.node_group_names
+
+    def find_materials(self, prefix='', suffix=''):
+        '''
+        Returns the materials whose name starts with prefix and ends with suffix, in scene order
+        '''
+        return [material for material in self.materials if material.name.startswith(prefix) and material.name.endswith(suffix)]
+
+    def has_material_containing(self, text):
+        return any(text in material_name for material_name in self.materials_by_name)
+
+    @staticmethod
+    def get_scene_generation(materials, node_groups):
+        material_names = tuple(materials.keys())
+        node_group_names = tuple(node_groups.keys())
+        return (len(material_names), len(node_group_names), hash(material_names), hash(node_group_names))
@@ -1,3 +1,6 @@
+from setup_wizard.utils.node_input_writer import node_input_writer
+
+
 class ShaderConfigurator:
     v1_node_name_mapping = {}
 
@@ -19,4 +22,4 @@ class ShaderConfigurator:
                 shader_node_input = shader_node_inputs.get(input_name)
 
                 if shader_node_input:
-                    shader_node_input.default_value = value
+                    node_input_writer.write(shader_node_input, value, material.name)
@@ -6,7 +6,10 @@ from enum import Enum, auto
 
 from setup_wizard.domain.shader_node_names import JaredNyts_PunishingGrayRavenNodeNames, ShaderNodeNames, StellarToonShaderNodeNames, V2_GenshinShaderNodeNames, V3_GenshinShaderNodeNames, V1_HoYoToonShaderNodeNames
 from setup_wizard.domain.game_types import GameType
+from setup_wizard.domain.material_name_index import MaterialNameIndex
+from setup_wizard.domain.shader_identity_cache import ShaderIdentityCache
 from setup_wizard.domain.shader_material_names import JaredNytsPunishingGrayRavenShaderMaterialNames, Nya222HonkaiStarRailShaderMaterialNames, StellarToonShaderMaterialNames, V3_BonnyFestivityGenshinImpactMaterialNames, V2_FestivityGenshinImpactMaterialNames, V1_HoYoToonGenshinImpactMaterialNames
+from setup_wizard.instrumentation.span_tracer import trace_span
 from setup_wizard.texture_import_setup.texture_node_names import GenshinImpactTextureNodeNames, JaredNytsPunishingGrayRavenTextureNodeNames, Nya222HonkaiStarRailTextureNodeNames, StellarToonTextureNodeNames, V1_GenshinImpactTextureNodeNames, V2_GenshinImpactTextureNodeNames, V3_GenshinImpactTextureNodeNames, V1_HoYoToonGenshinImpactTextureNodeNames
 
 
@@ -58,13 +61,21 @@ class ShaderIdentifierService:
     def __init__(self):
         pass
 
+    @trace_span()
     def identify_shader(self, materials, node_groups):
+        return ShaderIdentityCache.get(self, materials, node_groups, self.__identify_shader)
+
+    def __identify_shader(self, materials, node_groups):
+        material_name_index = MaterialNameIndex.get(materials, node_groups)
+
         # Check for V4 shader first
         shader_identifier: ShaderIdentifier
         for shader, shader_identifier in self.shader_labels_to_search_through.items():
-            shader_material = materials.get(shader_identifier.material_name)
-            renamed_shader_material = [material for material in materials if 
-                                       material.name.startswith(shader_identifier.material_prefix_after_rename) and material.name.endswith(shader_identifier.material_endswith_after_rename)]
+            shader_material = material_name_index.get_material(shader_identifier.material_name)
+            renamed_shader_material = material_name_index.find_materials(
+                prefix=shader_identifier.material_prefix_after_rename,
+                suffix=shader_identifier.material_endswith_after_rename
+            )
 
             shader_material = shader_material or renamed_shader_material[0] if renamed_shader_material else None
             if shader_material:
@@ -74,23 +85,13 @@ class ShaderIdentifierService:
 
         # Check for V1 shader
         for shader, node_group_list in self.node_groups_to_search_through.items():
-            found_all = True
-            for node_group in node_group_list:
-                if node_group not in node_groups:
-                    found_all = False
-                    break
-            if found_all:
+            if all(material_name_index.has_node_group(node_group) for node_group in node_group_list):
                 return shader
 
         # Check for V2 shader next b/c V1 and V2 have same material names
         # Then check for later versions (V3, etc.)
         for shader, material_list in self.material_lists_to_search_through.items():
-            found_all = True
-            for material in material_list:
-                if not [scene_material for scene_material in materials.values() if material in scene_material.name]:
-                    found_all = False
-                    break
-            if found_all:
+            if all(material_name_index.has_material_containing(material) for material in material_list):
                 return shader
 
     def get_shader_material_names(self, game_type, materials, node_groups):
@@ -0,0 +1,90 @@
+# Author: michael-gh1
+
+import bpy
+
+from setup_wizard.domain.material_name_index import MaterialNameIndex
+
+
+class ShaderIdentityCache:
+    '''
+    Remembers which shader ShaderIdentifierService.identify_shader found, so the factories and importers
+    that call it during a run don't each scan through every material and node group again.
+
+    Results are cached per ShaderIdentifierService (one per game type) and scene fingerprint (material
+    and node group counts and names). The cache is also cleared when materials or node trees are updated
+    in the depsgraph and when a file is loaded, which covers changes the fingerprint can't see (ex. node labels).
+    '''
+    identified_shaders = {}
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def get(cls, shader_identifier_service, materials, node_groups, identify_shader):
+        cache_key = (type(shader_identifier_service), cls.get_scene_fingerprint(materials, node_groups))
+
+        if cache_key in cls.identified_shaders:
+            cls.hits += 1
+            return cls.identified_shaders[cache_key]
+
+        cls.misses += 1
+        shader = identify_shader(materials, node_groups)
+        cls.identified_shaders[cache_key] = shader
+        print(f'INFO: Identified shader: {shader} (Shader identity cache hits: {cls.hits}, misses: {cls.misses})')
+        return shader
+
+    @classmethod
+    def clear(cls):
+        cls.identified_shaders.clear()
+
+    @classmethod
+    def get_statistics(cls):
+        return {
+            'hits': cls.hits,
+            'misses': cls.misses,
+        }
+
+    @classmethod
+    def reset_statistics(cls):
+        cls.hits = 0
+        cls.misses = 0
+
+    @staticmethod
+    def get_scene_fingerprint(materials, node_groups):
+        return MaterialNameIndex.get_scene_generation(materials, node_groups)
+
+
+@bpy.app.handlers.persistent
+def clear_shader_identity_cache_on_depsgraph_update(scene, depsgraph):
+    if not ShaderIdentityCache.identified_shaders and not MaterialNameIndex.indexes:
+        return
+    if depsgraph.id_type_updated('MATERIAL') or depsgraph.id_type_updated('NODETREE'):
+        ShaderIdentityCache.clear()
+        MaterialNameIndex.clear()  # Holds references to the materials
+
+
+@bpy.app.handlers.persistent
+def clear_shader_identity_cache_on_load_post(*args):
+    ShaderIdentityCache.clear()
+    MaterialNameIndex.clear()
+    ShaderIdentityCache.reset_statistics()
+
+
+HANDLERS = [
+    ('depsgraph_update_post', clear_shader_identity_cache_on_depsgraph_update),
+    ('load_post', clear_shader_identity_cache_on_load_post),
+]
+
+
+def register():
+    unregister()
+    for handler_list_name, handler in HANDLERS:
+        getattr(bpy.app.handlers, handler_list_name).append(handler)
+
+
+def unregister():
+    # Compare by name, the handlers from before a module reload are different function objects
+    for handler_list_name, handler in HANDLERS:
+        handler_list = getattr(bpy.app.handlers, handler_list_name)
+        for registered_handler in [registered_handler for registered_handler in handler_list if
+                                   getattr(registered_handler, '__name__', None) == handler.__name__]:
+            handler_list.remove(registered_handler)
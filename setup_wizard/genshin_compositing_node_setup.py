@@ -7,6 +7,7 @@ from bpy_extras.io_utils import ImportHelper
 from bpy.props import StringProperty
 from bpy.types import Operator
 from setup_wizard.import_order import cache_using_cache_key, get_cache, HOYOVERSE_COMPOSITING_NODE_FILE_PATH
+from setup_wizard.instrumentation.span_tracer import span_tracer
 
 from setup_wizard.setup_wizard_operator_base_classes import CustomOperatorProperties
 from setup_wizard.setup_wizard_operator_base_classes import NextStepInvoker
@@ -177,11 +178,12 @@ class GI_OT_CompositingNodeSetup(Operator, ImportHelper, CustomOperatorPropertie
         inner_path = 'NodeTree'
 
         for node_group_name in self.names_of_node_groups:
-            bpy.ops.wm.append(
-                filepath=os.path.join(composite_node_group_blend_file_path, inner_path, node_group_name),
-                directory=os.path.join(composite_node_group_blend_file_path, inner_path),
-                filename=node_group_name
-            )
+            with span_tracer.span('Append Compositing Node Group', 'append'):
+                bpy.ops.wm.append(
+                    filepath=os.path.join(composite_node_group_blend_file_path, inner_path, node_group_name),
+                    directory=os.path.join(composite_node_group_blend_file_path, inner_path),
+                    filename=node_group_name
+                )
             
             if bpy.data.node_groups.get(node_group_name):
                 self.logs += f'Appended {node_group_name}\n'
@@ -4,7 +4,6 @@
 # the armature bone settings when importing the FBX model
 
 import bpy
-import pathlib
 
 # ImportHelper is a helper class, defines filename and
 # invoke() function which calls the file selector.
@@ -17,7 +16,9 @@ from setup_wizard.domain.game_types import GameType
 from setup_wizard.import_order import NextStepInvoker, cache_using_cache_key
 from setup_wizard.import_order import get_cache, CHARACTER_MODEL_FOLDER_FILE_PATH
 from setup_wizard.setup_wizard_operator_base_classes import BasicSetupUIOperator, CustomOperatorProperties
+from setup_wizard.texture_import_setup.texture_header_prefetcher import texture_header_prefetcher
 from setup_wizard.utils import material_utils
+from setup_wizard.utils.character_folder_manifest import CharacterFolderManifest
 
 
 SHADER_COLOR_ATTRIBUTE_NAME = 'Col'
@@ -87,6 +88,10 @@ class GI_OT_GenshinImportModel(Operator, ImportHelper, CustomOperatorProperties)
                 )
             return {'FINISHED'}
 
+        if character_model_directory and os.path.isdir(character_model_directory):
+            # Read texture headers and warm the page cache in the background while the model and materials are imported
+            texture_header_prefetcher.prefetch(CharacterFolderManifest.get(character_model_directory).texture_files)
+
         existing_materials = bpy.data.materials.values()  # used to track materials before and after importing character model
         original_language = bpy.context.preferences.view.language
         try:
@@ -201,10 +206,8 @@ class GI_OT_GenshinImportModel(Operator, ImportHelper, CustomOperatorProperties)
                     mesh.color_attributes.active_color.name = name
 
     def __find_fbx_file(self, directory):
-        for root, folder, files in os.walk(directory):
-            for file_name in files:
-                if '.fbx' in pathlib.Path(file_name).suffix:
-                    return os.path.join(root, file_name)
+        fbx_files = CharacterFolderManifest.get(directory).fbx_files
+        return fbx_files[0] if fbx_files else None
 
 
 '''
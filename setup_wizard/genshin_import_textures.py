@@ -13,6 +13,7 @@ from setup_wizard.texture_import_setup.material_default_value_setters import Mat
 from setup_wizard.setup_wizard_operator_base_classes import CustomOperatorProperties
 from setup_wizard.texture_import_setup.game_texture_importers import GameTextureImporter, GameTextureImporterFactory
 from setup_wizard.texture_import_setup.texture_importer_service import TextureImporterService
+from setup_wizard.texture_import_setup.texture_image_registry import texture_image_registry
 
 
 class GI_OT_GenshinImportTextures(Operator, ImportHelper, CustomOperatorProperties):
@@ -37,6 +38,7 @@ class GI_OT_GenshinImportTextures(Operator, ImportHelper, CustomOperatorProperti
     )
 
     def execute(self, context):
+        texture_image_registry.clear()  # Don't share images with a previous import (ex. another character)
         game_texture_importer: GameTextureImporter = \
             GameTextureImporterFactory.create(self.game_type, self, context)
         material_default_value_setter = MaterialDefaultValueSetterFactory.create(self.game_type)
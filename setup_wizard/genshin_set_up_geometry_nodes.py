@@ -4,6 +4,7 @@ import bpy
 from bpy.types import Operator
 from setup_wizard.geometry_nodes_setup.game_geometry_nodes_setup_service import GameGeometryNodesSetupService
 from setup_wizard.geometry_nodes_setup.geometry_nodes_setups import GameGeometryNodesSetupFactory
+from setup_wizard.geometry_nodes_setup.outline_modifier_index import OutlineModifierIndex
 
 from setup_wizard.import_order import NextStepInvoker
 from setup_wizard.setup_wizard_operator_base_classes import CustomOperatorProperties
@@ -23,6 +24,7 @@ class GI_OT_SetUpGeometryNodes(Operator, CustomOperatorProperties):
 
             geometry_nodes_service = GameGeometryNodesSetupService(game_geometry_nodes_setup)
             geometry_nodes_service.setup_geometry_nodes()
+            OutlineModifierIndex.build(context.scene)
 
             NextStepInvoker().invoke(
                 self.next_step_idx, 
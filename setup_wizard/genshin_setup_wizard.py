@@ -4,6 +4,7 @@ import os
 import bpy
 from bpy.props import StringProperty
 from bpy.types import Operator
+from setup_wizard.domain import shader_identity_cache
 from setup_wizard.domain.game_types import GameType
 from setup_wizard.import_order import NextStepInvoker
 
@@ -16,14 +17,10 @@ class GI_OT_GenshinSetupWizardUI(Operator, BasicSetupUIOperator):
     bl_label = 'Genshin: Setup Wizard (UI)'
 
     def execute(self, context):
-        next_step_index = 0
-
-        NextStepInvoker().invoke(
-            next_step_index,
-            'invoke_next_step_ui', 
-            high_level_step_name=self.bl_idname if bpy.app.version >= (3,3,0) >= (3,3,0) \
+        self.run_pipeline(
+            context,
+            self.bl_idname if bpy.app.version >= (3,3,0) >= (3,3,0) \
                 else self.bl_idname + '_no_outlines',
-            game_type=self.game_type,
         )
         return {'FINISHED'}
 
@@ -34,14 +31,10 @@ class HSR_OT_HonkaiStarRailSetupWizardUI(Operator, BasicSetupUIOperator):
     bl_label = 'Honkai Star Rail: Setup Wizard (UI)'
 
     def execute(self, context):
-        next_step_index = 0
-
-        NextStepInvoker().invoke(
-            next_step_index,
-            'invoke_next_step_ui', 
-            high_level_step_name=self.bl_idname if bpy.app.version >= (3,3,0) >= (3,3,0) \
+        self.run_pipeline(
+            context,
+            self.bl_idname if bpy.app.version >= (3,3,0) >= (3,3,0) \
                 else self.bl_idname + '_no_outlines',
-            game_type=self.game_type,
         )
         return {'FINISHED'}
 
@@ -52,14 +45,10 @@ class PGR_OT_SetupWizardUI(Operator, BasicSetupUIOperator):
     bl_label = 'Genshin: Setup Wizard (UI)'
 
     def execute(self, context):
-        next_step_index = 0
-
-        NextStepInvoker().invoke(
-            next_step_index,
-            'invoke_next_step_ui', 
-            high_level_step_name=self.bl_idname if bpy.app.version >= (3,3,0) >= (3,3,0) \
+        self.run_pipeline(
+            context,
+            self.bl_idname if bpy.app.version >= (3,3,0) >= (3,3,0) \
                 else self.bl_idname + '_no_outlines',
-            game_type=self.game_type,
         )
         return {'FINISHED'}
 
@@ -97,6 +86,7 @@ class GI_OT_GenshinSetupWizard(Operator):
 
 def register():
     bpy.utils.register_class(GI_OT_GenshinSetupWizard)
+    shader_identity_cache.register()
     bpy.app.timers.register(on_register, first_interval=1)
 
 
@@ -151,6 +141,8 @@ def setup_dependencies():
     import setup_wizard.character_rig_setup.character_rigger_operator
     import setup_wizard.character_rig_setup.rootshape_filepath_setter_operator
     import setup_wizard.optimization.emissive_optimizer
+    import setup_wizard.optimization.proxy_texture_swapper
+    import setup_wizard.optimization.texture_memory_report_operator
     import setup_wizard.genshin_compositing_node_setup
     import setup_wizard.change_bpy_context
     import setup_wizard.mesh_import_setup.chibi_face_setup
@@ -172,6 +164,8 @@ def setup_dependencies():
     importlib.reload(setup_wizard.character_rig_setup.character_rigger_operator)
     importlib.reload(setup_wizard.character_rig_setup.rootshape_filepath_setter_operator)
     importlib.reload(setup_wizard.optimization.emissive_optimizer)
+    importlib.reload(setup_wizard.optimization.proxy_texture_swapper)
+    importlib.reload(setup_wizard.optimization.texture_memory_report_operator)
     importlib.reload(setup_wizard.genshin_compositing_node_setup)
     importlib.reload(setup_wizard.change_bpy_context)
     importlib.reload(setup_wizard.mesh_import_setup.chibi_face_setup)
@@ -202,6 +196,8 @@ def setup_dependencies():
         setup_wizard.character_rig_setup.character_rigger_operator.GI_OT_CharacterRiggerOperator,
         setup_wizard.character_rig_setup.rootshape_filepath_setter_operator.GI_OT_RootShape_FilePath_Setter_Operator,
         setup_wizard.optimization.emissive_optimizer.GI_OT_Emissive_Optimizer,
+        setup_wizard.optimization.proxy_texture_swapper.HYV_OT_Swap_Proxy_Textures,
+        setup_wizard.optimization.texture_memory_report_operator.HYV_OT_Texture_Memory_Report,
         setup_wizard.genshin_compositing_node_setup.GI_OT_CompositingNodeSetup,
         setup_wizard.genshin_compositing_node_setup.HYV_OT_HoyoversePostProcessingDefaultSettings,
         setup_wizard.change_bpy_context.GI_OT_Change_BPY_Context,
@@ -235,10 +231,13 @@ def unregister():
     from setup_wizard.character_rig_setup.character_rigger_operator import GI_OT_CharacterRiggerOperator
     from setup_wizard.character_rig_setup.rootshape_filepath_setter_operator import GI_OT_RootShape_FilePath_Setter_Operator
     from setup_wizard.optimization.emissive_optimizer import GI_OT_Emissive_Optimizer
+    from setup_wizard.optimization.proxy_texture_swapper import HYV_OT_Swap_Proxy_Textures
+    from setup_wizard.optimization.texture_memory_report_operator import HYV_OT_Texture_Memory_Report
     from setup_wizard.genshin_compositing_node_setup import GI_OT_CompositingNodeSetup, \
         HYV_OT_HoyoversePostProcessingDefaultSettings
     from setup_wizard.change_bpy_context import GI_OT_Change_BPY_Context
     from setup_wizard.mesh_import_setup.chibi_face_setup import PGR_OT_SetUpChibiFace, PGR_OT_ImportChibiFaceTexture
+    from setup_wizard.texture_import_setup.texture_header_prefetcher import texture_header_prefetcher
 
     for class_to_unregister in [
         GI_OT_GenshinImportModel,
@@ -262,6 +261,8 @@ def unregister():
         GI_OT_CharacterRiggerOperator,
         GI_OT_RootShape_FilePath_Setter_Operator,
         GI_OT_Emissive_Optimizer,
+        HYV_OT_Swap_Proxy_Textures,
+        HYV_OT_Texture_Memory_Report,
         GI_OT_CompositingNodeSetup,
         HYV_OT_HoyoversePostProcessingDefaultSettings,
         GI_OT_Change_BPY_Context,
@@ -272,6 +273,8 @@ def unregister():
             bpy.utils.unregister_class(class_to_unregister)
         except ValueError:
             pass  # expected if class is already registered
+    shader_identity_cache.unregister()
+    texture_header_prefetcher.shutdown()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+# Author: michael-gh1
+
+from bisect import bisect_left
+
+import bpy
+
+from setup_wizard.geometry_nodes_setup.geometry_nodes_setups import NAME_OF_GEOMETRY_NODES_MODIFIER
+
+
+class OutlineModifierIndex:
+    '''
+    Index of the Outlines geometry nodes modifiers in the scene, built once after the geometry nodes are set up.
+
+    Outline modifiers are named `Outlines {mesh_name}` and material data is matched to them by body part or
+    material data file stem (ex. `Outlines Body` is in `Outlines Body` and `Outlines Body.001`). Every suffix that
+    follows an `Outlines ` in a modifier name is kept sorted, so that a lookup is a binary search for the suffixes
+    starting with the key instead of a substring scan over every modifier on every object.
+    '''
+    MODIFIER_NAME_PREFIX = f'{NAME_OF_GEOMETRY_NODES_MODIFIER} '
+    index = None
+
+    def __init__(self, scene_objects):
+        self.object_count = len(scene_objects)
+        self.modifiers = []  # (object name, modifier name, modifier) in scene object and modifier order
+        suffixes = []
+
+        for scene_object in scene_objects:
+            for modifier in scene_object.modifiers:
+                modifier_name = modifier.name
+                prefix_position = modifier_name.find(self.MODIFIER_NAME_PREFIX)
+                if prefix_position == -1:
+                    continue
+
+                modifier_position = len(self.modifiers)
+                self.modifiers.append((scene_object.name, modifier_name, modifier))
+                while prefix_position != -1:
+                    suffixes.append((modifier_name[prefix_position + len(self.MODIFIER_NAME_PREFIX):], modifier_position))
+                    prefix_position = modifier_name.find(self.MODIFIER_NAME_PREFIX, prefix_position + 1)
+
+        suffixes.sort()
+        self.suffixes = [suffix for suffix, _ in suffixes]
+        self.suffix_modifier_positions = [modifier_position for _, modifier_position in suffixes]
+
+    @classmethod
+    def build(cls, scene=None):
+        scene = scene or bpy.context.scene
+        cls.index = cls(scene.objects.values())
+        return cls.index
+
+    @classmethod
+    def get(cls, scene=None):
+        '''
+        Returns the index built after the geometry nodes were set up, rebuilding it if it does not exist yet
+        (ex. material data is imported on its own) or if objects were added/removed or outline modifiers renamed/removed since.
+        '''
+        scene = scene or bpy.context.scene
+        if cls.index is None or cls.index.is_stale(scene):
+            return cls.build(scene)
+        return cls.index
+
+    @classmethod
+    def clear(cls):
+        cls.index = None
+
+    def is_stale(self, scene):
+        if len(scene.objects) != self.object_count:
+            return True
+        try:
+            return any(modifier.name != modifier_name for _, modifier_name, modifier in self.modifiers)
+        except ReferenceError:  # Modifier was removed
+            return True
+
+    def get_modifiers(self, *keys):
+        '''
+        Returns the modifiers whose name contains `Outlines {key}` for any of the keys, in scene order
+        '''
+        modifier_positions = set()
+        for key in keys:
+            suffix_position = bisect_left(self.suffixes, key)
+            while suffix_position < len(self.suffixes) and self.suffixes[suffix_position].startswith(key):
+                modifier_positions.add(self.suffix_modifier_positions[suffix_position])
+                suffix_position += 1
+        return [self.modifiers[modifier_position][2] for modifier_position in sorted(modifier_positions)]
@@ -6,7 +6,13 @@ import bpy
 import json
 import os
 
+from datetime import datetime
+
+from typing import Dict, List, NamedTuple
+
 from setup_wizard.domain.game_types import GameType
+from setup_wizard.instrumentation.span_tracer import span_tracer
+from setup_wizard.instrumentation.step_instrumentation import RUN_REPORT_TIMESTAMP_FORMAT, get_run_reports_directory
 
 # Config Constants
 COMPONENT_NAME = 'component_name'
@@ -15,6 +21,17 @@ CACHE_KEY = 'cache_key'
 UI_ORDER_CONFIG_KEY = 'ui_order'
 BLENDER_ADDON_CONFIG_FILENAME = f'character_setup_wizard.json'
 BLENDER_ADDON_CONFIG_FILEPATH = os.path.join(bpy.utils.user_resource('CONFIG'), BLENDER_ADDON_CONFIG_FILENAME)
+SETUP_WIZARD_CONFIG_FILEPATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json')
+SETUP_WIZARD_UI_CONFIG_FILEPATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config_ui.json')
+SETUP_WIZARD_PIPELINE_NAME = 'setup_wizard'  # config.json has a single pipeline, config_ui.json has one per high level step
+PIPELINE_RUNNER_INVOKER_TYPE = 'pipeline_runner'
+
+# Pipeline Step Statuses
+STEP_FINISHED = 'FINISHED'
+STEP_SKIPPED = 'SKIPPED'
+STEP_WAITING_FOR_INPUT = 'WAITING_FOR_INPUT'  # the step opened a file browser, the run resumes when it's confirmed
+STEP_CANCELLED = 'CANCELLED'
+STEP_FAILED = 'FAILED'
 
 # Cache Constants
 CHARACTER_MODEL_FOLDER_FILE_PATH = 'character_model_folder_file_path'
@@ -46,35 +63,274 @@ class NextStepInvoker:
             invoke_next_step(current_step_index, file_path_to_cache, game_type)
         elif type == 'invoke_next_step_ui':
             invoke_next_step_ui(high_level_step_name, current_step_index, game_type)
+        elif type == PIPELINE_RUNNER_INVOKER_TYPE:
+            PipelineRunner.on_step_completed(current_step_index)
         else:
             print(f'Warning: Unknown type found when invoking: {type}')
 
 
+class PipelineStep(NamedTuple):
+    component_name: str
+    enabled: bool
+    cache_key: str
+    operator: object  # resolved through ComponentFunctionFactory, None for the placeholder step 0
+
+
+class PipelinePlan:
+    '''
+    The steps of config.json or config_ui.json, compiled once instead of reading the config file on every step.
+    Each step's operator is resolved ahead of time through the ComponentFunctionFactory.
+
+    Plans are revalidated against the config file's modified time at the start of a run (step 0 or 1),
+    so step transitions don't touch the disk.
+    '''
+    plans = {}
+
+    def __init__(self, config_file_path: str, modified_time: int, pipelines: Dict[str, List[PipelineStep]]):
+        self.config_file_path = config_file_path
+        self.modified_time = modified_time
+        self.pipelines = pipelines
+
+    @classmethod
+    def get(cls, config_file_path: str, revalidate=False):
+        plan = cls.plans.get(config_file_path)
+        if not plan or (revalidate and plan.modified_time != os.stat(config_file_path).st_mtime_ns):
+            plan = cls.compile(config_file_path)
+            cls.plans[config_file_path] = plan
+        return plan
+
+    @classmethod
+    def compile(cls, config_file_path: str):
+        modified_time = os.stat(config_file_path).st_mtime_ns
+        with open(config_file_path) as config_file:
+            config = json.load(config_file)
+
+        if UI_ORDER_CONFIG_KEY in config:
+            pipelines = {
+                high_level_step_name: cls.compile_steps(
+                    [{COMPONENT_NAME: component_name, ENABLED: True, CACHE_KEY: ''} for component_name in component_names]
+                ) for high_level_step_name, component_names in config[UI_ORDER_CONFIG_KEY].items()
+            }
+        else:
+            pipelines = {
+                SETUP_WIZARD_PIPELINE_NAME: cls.compile_steps([config[str(step_idx)] for step_idx in range(len(config))])
+            }
+        return cls(config_file_path, modified_time, pipelines)
+
+    @staticmethod
+    def compile_steps(step_configs):
+        return [
+            PipelineStep(
+                component_name=step_config[COMPONENT_NAME],
+                enabled=step_config[ENABLED],
+                cache_key=step_config[CACHE_KEY],
+                operator=ComponentFunctionFactory.create_component_function(step_config[COMPONENT_NAME]) if step_idx > 0 else None,
+            ) for step_idx, step_config in enumerate(step_configs)
+        ]
+
+    def get_steps(self, pipeline_name=SETUP_WIZARD_PIPELINE_NAME) -> List[PipelineStep]:
+        return self.pipelines.get(pipeline_name)
+
+    @classmethod
+    def clear(cls):
+        cls.plans.clear()
+
+
+class PipelineStepResult(NamedTuple):
+    step_index: int
+    component_name: str
+    status: str
+    message: str = ''
+
+
+class PipelineRunner:
+    '''
+    Runs the steps of a config_ui.json high level step in a flat loop, one operator after another,
+    instead of each operator invoking the next one (which nests every step on the Python stack).
+
+    Steps are executed with the `pipeline_runner` invoker type, so the NextStepInvoker only reports back that the
+    step completed. A step that did not complete opened a file browser: the run is paused and resumes from the
+    next step once the file browser's operator completes the step.
+
+    The run stops early when a step is cancelled, fails or abort() is called.
+    With undo grouping (opt-in), a single undo step is pushed for the whole run. It's only pushed when the run
+    finishes in the wizard operator that started it, a run resumed by a file browser's operator doesn't push one.
+    With instrumentation, each step is measured and a run report is written when the run finishes.
+    While span tracing is enabled, each step is a span and the traces are written when the run finishes.
+    With a step profiler, steps are profiled with cProfile.
+    '''
+    active_runner = None  # the run currently executing or waiting for a file browser
+    last_run = None
+
+    def __init__(self, high_level_step_name, game_type: str=GameType.GENSHIN_IMPACT.name, undo_grouping=False, instrumentation=None, profiler=None):
+        self.high_level_step_name = high_level_step_name
+        self.game_type = game_type
+        self.undo_grouping = undo_grouping
+        self.is_resumed = False  # resumed by a file browser's operator instead of the wizard operator
+        self.instrumentation = instrumentation
+        self.profiler = profiler
+        self.waiting_step_measurement = None
+        self.waiting_step_profile = None
+        self.step_results: Dict[int, PipelineStepResult] = {}
+        self.executing_step_index = None
+        self.completed_step_index = None
+        self.is_aborted = False
+
+    def run(self, start_step_index=1):
+        if start_step_index == 1:
+            if PipelineRunner.active_runner and PipelineRunner.active_runner is not self:
+                print(f'INFO: Discarding unfinished run of {PipelineRunner.active_runner.high_level_step_name}')
+            reload_blender_cache()
+            if self.instrumentation:
+                self.instrumentation.start()
+        PipelineRunner.active_runner = self
+
+        steps = PipelinePlan.get(SETUP_WIZARD_UI_CONFIG_FILEPATH, revalidate=start_step_index == 1) \
+            .get_steps(self.high_level_step_name)
+        for step_index in range(start_step_index, len(steps)):
+            if self.is_aborted:
+                break
+            step = steps[step_index]
+            if not step.enabled:
+                self.step_results[step_index] = PipelineStepResult(step_index, step.component_name, STEP_SKIPPED)
+                continue
+
+            step_result = self.execute_step(step_index, step)
+            if step_result.status == STEP_WAITING_FOR_INPUT:
+                return self.step_results
+            if step_result.status in (STEP_CANCELLED, STEP_FAILED):
+                self.abort()
+        self.finish()
+        return self.step_results
+
+    def execute_step(self, step_index, step: PipelineStep):
+        self.executing_step_index = step_index
+        self.completed_step_index = None
+        step_measurement = self.instrumentation.measure_step(step_index, step.component_name) if self.instrumentation else None
+        step_profile = self.profiler.start(step_index, step.component_name) if self.profiler else None
+        try:
+            with span_tracer.span(step.component_name, 'step'):
+                operator_result = step.operator(
+                    'EXEC_DEFAULT',
+                    next_step_idx=step_index,
+                    invoker_type=PIPELINE_RUNNER_INVOKER_TYPE,
+                    high_level_step_name=self.high_level_step_name,
+                    game_type=self.game_type,
+                )
+        except Exception as ex:
+            self.step_results[step_index] = PipelineStepResult(step_index, step.component_name, STEP_FAILED, str(ex))
+            self.record_step_measurement(step_measurement, STEP_FAILED)
+            self.stop_step_profile(step_profile)
+            self.abort()
+            self.finish()
+            raise ex
+        finally:
+            self.executing_step_index = None
+
+        if STEP_CANCELLED in operator_result:
+            status = STEP_CANCELLED
+        elif self.completed_step_index == step_index:
+            status = STEP_FINISHED
+        else:
+            status = STEP_WAITING_FOR_INPUT
+        self.step_results[step_index] = PipelineStepResult(step_index, step.component_name, status)
+
+        if status == STEP_WAITING_FOR_INPUT:
+            # Measured and profiled until the file browser completes the step
+            if step_measurement:
+                step_measurement.waited_for_input = True
+            self.waiting_step_measurement = step_measurement
+            self.waiting_step_profile = step_profile
+        else:
+            self.record_step_measurement(step_measurement, status)
+            self.stop_step_profile(step_profile)
+        return self.step_results[step_index]
+
+    def record_step_measurement(self, step_measurement, status):
+        if step_measurement:
+            self.instrumentation.record(step_measurement.stop(status))
+
+    def stop_step_profile(self, step_profile):
+        if step_profile:
+            self.profiler.stop(step_profile)
+
+    @classmethod
+    def on_step_completed(cls, step_index):
+        runner = cls.active_runner
+        if not runner:
+            print(f'WARNING: Step {step_index} completed, but no Setup Wizard run is active')
+            return
+        if runner.executing_step_index is not None:
+            runner.completed_step_index = step_index
+            return
+
+        # Completed through a file browser after the run was paused
+        waiting_step_result = runner.step_results.get(step_index)
+        if waiting_step_result:
+            runner.step_results[step_index] = waiting_step_result._replace(status=STEP_FINISHED)
+        runner.record_step_measurement(runner.waiting_step_measurement, STEP_FINISHED)
+        runner.stop_step_profile(runner.waiting_step_profile)
+        runner.waiting_step_measurement = None
+        runner.waiting_step_profile = None
+        runner.is_resumed = True
+        runner.run(step_index + 1)
+
+    def abort(self):
+        self.is_aborted = True
+
+    def finish(self):
+        if PipelineRunner.active_runner is self:
+            PipelineRunner.active_runner = None
+        PipelineRunner.last_run = self
+        if self.instrumentation:
+            self.instrumentation.stop()
+            try:
+                self.instrumentation.write_report()
+            except OSError as ex:
+                print(f'WARNING: Unable to write Setup Wizard run report: {ex}')
+        if span_tracer.enabled:
+            span_tracer.stop()
+            try:
+                span_tracer.write_traces(
+                    get_run_reports_directory(),
+                    f'{self.high_level_step_name}_{datetime.now().strftime(RUN_REPORT_TIMESTAMP_FORMAT)}'
+                )
+            except OSError as ex:
+                print(f'WARNING: Unable to write Setup Wizard traces: {ex}')
+
+        if self.undo_grouping and any(step_result.status == STEP_FINISHED for step_result in self.step_results.values()):
+            if self.is_resumed:
+                print(f'INFO: Skipped grouping undo for {self.high_level_step_name}, the run was resumed by a file browser')
+            else:
+                bpy.ops.ed.undo_push(message=f'Setup Wizard: {self.high_level_step_name}')
+        for step_result in self.step_results.values():
+            if step_result.status != STEP_FINISHED:
+                print(f'INFO: Step {step_result.step_index} ({step_result.component_name}): {step_result.status} {step_result.message}')
+
+
 def invoke_next_step(
         current_step_idx: int, 
         file_path_to_cache=None, 
         game_type: str=GameType.GENSHIN_IMPACT.name):
-    path_to_setup_wizard_folder = os.path.dirname(os.path.abspath(__file__))
-    file = open(f'{path_to_setup_wizard_folder}/config.json')
-    config = json.load(file)
+    steps = PipelinePlan.get(SETUP_WIZARD_CONFIG_FILEPATH, revalidate=current_step_idx == 1).get_steps()
 
     if current_step_idx == 1:
         clear_cache()
     cache = get_cache()
 
-    if current_step_idx <= 0 or current_step_idx + 1 > len(config):  # +1 because we have a step 0
+    if current_step_idx <= 0 or current_step_idx + 1 > len(steps):  # +1 because we have a step 0
         return
 
     # Cache only if running SetupWizard using F3 search menu. It should return before reaching here.
-    previous_step = config.get(str(current_step_idx - 1))
-    if file_path_to_cache and previous_step and previous_step[CACHE_KEY]:
+    previous_step = steps[current_step_idx - 1]
+    if file_path_to_cache and previous_step.cache_key:
         cache_previous_step_file_path(cache, previous_step, file_path_to_cache)
-    
-    if config[str(current_step_idx)][ENABLED]:
-        cached_file_directory = cache.get(config[str(current_step_idx)][CACHE_KEY], '')
+
+    current_step = steps[current_step_idx]
+    if current_step.enabled:
+        cached_file_directory = cache.get(current_step.cache_key, '')
         execute_or_invoke = 'EXEC' if cached_file_directory else 'INVOKE'
-        component_name = config[str(current_step_idx)][COMPONENT_NAME]
-        function_to_use = ComponentFunctionFactory.create_component_function(component_name)
+        function_to_use = current_step.operator
 
         if type(function_to_use) is bpy.ops._BPyOpsSubModOp:
             print(f'Calling {function_to_use} with {execute_or_invoke}_DEFAULT w/ cache: {cached_file_directory}')
@@ -95,16 +351,14 @@ def invoke_next_step_ui(
         high_level_step_name, 
         current_step_index, 
         game_type: str=GameType.GENSHIN_IMPACT.name):
-    path_to_setup_wizard_folder = os.path.dirname(os.path.abspath(__file__))
+    plan = PipelinePlan.get(SETUP_WIZARD_UI_CONFIG_FILEPATH, revalidate=current_step_index == 0)
+    if current_step_index == 0:
+        reload_blender_cache()
 
-    file = open(f'{path_to_setup_wizard_folder}/config_ui.json')
-    config = json.load(file)
-    ui_order = config.get(UI_ORDER_CONFIG_KEY)
-    high_level_step_list = ui_order.get(high_level_step_name)
+    high_level_step_list = plan.get_steps(high_level_step_name)
     if current_step_index == len(high_level_step_list) - 1:
         return
-    component_name = high_level_step_list[current_step_index + 1]
-    operator_to_execute = ComponentFunctionFactory.create_component_function(component_name)
+    operator_to_execute = high_level_step_list[current_step_index + 1].operator
 
     operator_to_execute(
         'EXEC_DEFAULT',
@@ -114,15 +368,28 @@ def invoke_next_step_ui(
         game_type=game_type,
     )
 
+blender_cache = None  # In-memory copy of the user Blender config, every write goes through write_to_blender_cache()
+
+
 def read_from_blender_cache():
-    try:
-        with open(BLENDER_ADDON_CONFIG_FILEPATH, 'r') as json_file:
-            print(f'Reading from user Blender config: {BLENDER_ADDON_CONFIG_FILEPATH}')
-            config = json.load(json_file)
-            print(f'Retrieved user Blender config')
-            return config
-    except FileNotFoundError as err:
-        return {}
+    global blender_cache
+    if blender_cache is None:
+        try:
+            with open(BLENDER_ADDON_CONFIG_FILEPATH, 'r') as json_file:
+                print(f'Reading from user Blender config: {BLENDER_ADDON_CONFIG_FILEPATH}')
+                blender_cache = json.load(json_file)
+                print(f'Retrieved user Blender config')
+        except FileNotFoundError as err:
+            blender_cache = {}
+    return dict(blender_cache)
+
+
+def reload_blender_cache():
+    '''
+    Reads the user Blender config from disk again on the next read (ex. in case it was edited outside of Blender)
+    '''
+    global blender_cache
+    blender_cache = None
 
 
 def get_cache(cache_enabled=True):
@@ -131,16 +398,18 @@ def get_cache(cache_enabled=True):
     return read_from_blender_cache()
 
 def write_to_blender_cache(config):
+    global blender_cache
     with open(BLENDER_ADDON_CONFIG_FILEPATH, 'w') as json_file:
         print(f'Writing to user Blender config: {BLENDER_ADDON_CONFIG_FILEPATH}')
         json_string = json.dumps(config, indent=4)
         json_file.write(json_string)
         print(f'Successfully wrote to user Blender config')
+    blender_cache = dict(config)
 
 def cache_previous_step_file_path(cache, last_step, file_path_to_cache):
     if not file_path_to_cache:
         return
-    step_cache_key = last_step.get(CACHE_KEY)
+    step_cache_key = last_step.cache_key
 
     print(f'Assigning `{step_cache_key}:{file_path_to_cache}` in cache')
     cache[step_cache_key] = file_path_to_cache
@@ -0,0 +1,218 @@
+# Author: michael-gh1
+
+import functools
+import json
+import os
+import threading
+import time
+
+from typing import Callable, Any, List, NamedTuple
+
+SPEEDSCOPE_SCHEMA_URL = 'https://www.speedscope.app/file-format-schema.json'
+DEFAULT_SPAN_CATEGORY = 'setup_wizard'
+PHASE_SPAN_CATEGORY = 'phase'
+
+
+class TracedSpan(NamedTuple):
+    name: str
+    category: str
+    thread_id: int
+    start_time: int  # nanoseconds, time.perf_counter_ns()
+    end_time: int
+    args: dict
+
+
+class Span:
+    def __init__(self, span_tracer, name, category, args):
+        self.span_tracer = span_tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.span_tracer.open_span(self)
+        self.start_time = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.span_tracer.close_span(self, time.perf_counter_ns())
+        return False
+
+
+class NullSpan:
+    '''
+    Returned while tracing is disabled, so `with span_tracer.span(...)` costs a method call and nothing else
+    '''
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+class SpanTracer:
+    '''
+    Records nested spans (ex. importers, material data appliers, shader identification, appends and rig phases)
+    while enabled, and exports them in the Chrome Trace Event format (chrome://tracing, Perfetto) and the
+    speedscope format to view a whole setup as a flame graph.
+
+    Spans are recorded through the @trace_span() decorator or `with span_tracer.span(name)`.
+    phase(name) marks the start of the next phase of a long function (ex. the rig script), closing the previous
+    phase. Open phases are closed with their enclosing span.
+    '''
+    def __init__(self):
+        self.enabled = False
+        self.spans: List[TracedSpan] = []
+        self.open_spans = threading.local()
+        self.lock = threading.Lock()
+
+    def start(self):
+        self.spans = []
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+
+    def span(self, name, category=DEFAULT_SPAN_CATEGORY, **args):
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, category, args)
+
+    def phase(self, name, **args):
+        if not self.enabled:
+            return
+        open_spans = self.__get_open_spans()
+        if open_spans and open_spans[-1].category == PHASE_SPAN_CATEGORY:
+            self.close_span(open_spans[-1], time.perf_counter_ns())
+        self.span(name, PHASE_SPAN_CATEGORY, **args).__enter__()
+
+    def open_span(self, span: Span):
+        self.__get_open_spans().append(span)
+
+    def close_span(self, span: Span, end_time):
+        open_spans = self.__get_open_spans()
+        while open_spans and open_spans[-1] is not span and open_spans[-1].category == PHASE_SPAN_CATEGORY:
+            self.__record(open_spans.pop(), end_time)  # phases end with their enclosing span
+        if open_spans and open_spans[-1] is span:
+            open_spans.pop()
+        self.__record(span, end_time)
+
+    def __record(self, span: Span, end_time):
+        traced_span = TracedSpan(span.name, span.category, threading.get_ident(), span.start_time, end_time, span.args)
+        with self.lock:
+            self.spans.append(traced_span)
+
+    def __get_open_spans(self):
+        if not hasattr(self.open_spans, 'spans'):
+            self.open_spans.spans = []
+        return self.open_spans.spans
+
+    def get_spans(self) -> List[TracedSpan]:
+        # Parents before children: by start time, then longest first
+        with self.lock:
+            return sorted(self.spans, key=lambda span: (span.thread_id, span.start_time, -span.end_time))
+
+    def create_chrome_trace(self):
+        process_id = os.getpid()
+        return {
+            'traceEvents': [
+                {
+                    'name': span.name,
+                    'cat': span.category,
+                    'ph': 'X',
+                    'ts': span.start_time / 1000,  # microseconds
+                    'dur': (span.end_time - span.start_time) / 1000,
+                    'pid': process_id,
+                    'tid': span.thread_id,
+                    'args': {key: str(value) for key, value in span.args.items()},
+                } for span in self.get_spans()
+            ],
+            'displayTimeUnit': 'ms',
+        }
+
+    def create_speedscope_profile(self, name):
+        frames = []
+        frame_indexes = {}
+        profiles = []
+        spans_by_thread = {}
+        for span in self.get_spans():
+            spans_by_thread.setdefault(span.thread_id, []).append(span)
+
+        for thread_id, spans in spans_by_thread.items():
+            events = []
+            open_spans = []
+            for span in spans:
+                while open_spans and open_spans[-1].end_time <= span.start_time:
+                    closed_span = open_spans.pop()
+                    events.append({'type': 'C', 'frame': frame_indexes[closed_span.name], 'at': closed_span.end_time})
+                if span.name not in frame_indexes:
+                    frame_indexes[span.name] = len(frames)
+                    frames.append({'name': span.name})
+                events.append({'type': 'O', 'frame': frame_indexes[span.name], 'at': span.start_time})
+                open_spans.append(span)
+            while open_spans:
+                closed_span = open_spans.pop()
+                events.append({'type': 'C', 'frame': frame_indexes[closed_span.name], 'at': closed_span.end_time})
+
+            profiles.append({
+                'type': 'evented',
+                'name': f'{name} (thread {thread_id})',
+                'unit': 'nanoseconds',
+                'startValue': spans[0].start_time,
+                'endValue': max(span.end_time for span in spans),
+                'events': events,
+            })
+
+        return {
+            '$schema': SPEEDSCOPE_SCHEMA_URL,
+            'shared': {'frames': frames},
+            'profiles': profiles,
+            'name': name,
+            'exporter': 'Character Setup Wizard',
+        }
+
+    def write_traces(self, directory, name):
+        '''
+        Writes <name>.trace.json (Chrome Trace Event format) and <name>.speedscope.json
+        '''
+        os.makedirs(directory, exist_ok=True)
+        chrome_trace_file_path = os.path.join(directory, f'{name}.trace.json')
+        speedscope_file_path = os.path.join(directory, f'{name}.speedscope.json')
+
+        with open(chrome_trace_file_path, 'w') as chrome_trace_file:
+            json.dump(self.create_chrome_trace(), chrome_trace_file)
+        with open(speedscope_file_path, 'w') as speedscope_file:
+            json.dump(self.create_speedscope_profile(name), speedscope_file)
+
+        print(f'INFO: Wrote Setup Wizard traces: {chrome_trace_file_path}, {speedscope_file_path}')
+        return chrome_trace_file_path, speedscope_file_path
+
+
+span_tracer = SpanTracer()
+
+
+def trace_span(name: str = None, category: str = DEFAULT_SPAN_CATEGORY) -> Callable:
+    """
+    Decorator to record a span for each call of the function while tracing is enabled.
+
+    Args:
+        name: Span name (default: the function's qualified name, ex. GenshinAvatarTextureImporter.import_textures)
+        category: Span category
+
+    Returns:
+        Decorator function
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            if not span_tracer.enabled:
+                return func(*args, **kwargs)
+            with Span(span_tracer, span_name, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
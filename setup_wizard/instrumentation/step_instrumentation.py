@@ -0,0 +1,166 @@
+# Author: michael-gh1
+
+import json
+import os
+import time
+import tracemalloc
+
+from datetime import datetime
+from typing import List, NamedTuple
+
+import bpy
+
+RUN_REPORTS_FOLDER_NAME = 'csw_run_reports'  # next to the csw_logs folder
+RUN_REPORT_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+DEFAULT_SLOWEST_STEPS_COUNT = 5
+MAX_RUN_REPORTS = 20  # older run reports (and traces) in csw_run_reports are removed
+DATABLOCK_COLLECTION_NAMES = [
+    'actions',
+    'armatures',
+    'collections',
+    'images',
+    'materials',
+    'meshes',
+    'node_groups',
+    'objects',
+    'textures',
+]
+
+
+class StepMetrics(NamedTuple):
+    step_index: int
+    component_name: str
+    status: str
+    wall_time: float  # seconds
+    cpu_time: float  # seconds
+    peak_allocated_bytes: int  # Python allocations only (0 unless traced), Blender's own allocations aren't traced
+    created_datablocks: int
+    waited_for_input: bool  # the step opened a file browser, wall time includes the time spent in it
+
+
+class StepMeasurement:
+    '''
+    Measures a single pipeline step from start() to stop()
+    '''
+    def __init__(self, step_index, component_name):
+        self.step_index = step_index
+        self.component_name = component_name
+        self.waited_for_input = False
+
+    def start(self):
+        self.start_wall_time = time.perf_counter()
+        self.start_cpu_time = time.process_time()
+        self.start_datablock_count = count_datablocks()
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            self.start_allocated_bytes, _ = tracemalloc.get_traced_memory()
+        return self
+
+    def stop(self, status) -> StepMetrics:
+        peak_allocated_bytes = 0
+        if tracemalloc.is_tracing():
+            _, peak_traced_bytes = tracemalloc.get_traced_memory()
+            peak_allocated_bytes = max(peak_traced_bytes - self.start_allocated_bytes, 0)
+
+        return StepMetrics(
+            step_index=self.step_index,
+            component_name=self.component_name,
+            status=status,
+            wall_time=time.perf_counter() - self.start_wall_time,
+            cpu_time=time.process_time() - self.start_cpu_time,
+            peak_allocated_bytes=peak_allocated_bytes,
+            created_datablocks=count_datablocks() - self.start_datablock_count,
+            waited_for_input=self.waited_for_input,
+        )
+
+
+class PipelineInstrumentation:
+    '''
+    Records the wall time, CPU time, peak Python allocations and created datablocks of each step in a pipeline run.
+    The run report is written as JSON to the csw_run_reports folder in the Addon Config Directory,
+    which keeps the latest MAX_RUN_REPORTS reports.
+
+    Python allocations are only traced with tracemalloc when trace_allocations is set, it slows down Python
+    allocations considerably.
+    '''
+    last_instrumentation = None  # shown in the Setup Wizard Run Report panel
+
+    def __init__(self, pipeline_name, reports_directory=None, trace_allocations=False):
+        self.pipeline_name = pipeline_name
+        self.trace_allocations = trace_allocations
+        self.reports_directory = reports_directory or get_run_reports_directory()
+        self.step_metrics: List[StepMetrics] = []
+        self.started_at = None
+        self.report_file_path = None
+        self.is_tracing_started = False
+
+    def start(self):
+        self.started_at = datetime.now()
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.is_tracing_started = True
+        return self
+
+    def measure_step(self, step_index, component_name) -> StepMeasurement:
+        return StepMeasurement(step_index, component_name).start()
+
+    def record(self, step_metrics: StepMetrics):
+        self.step_metrics.append(step_metrics)
+
+    def stop(self):
+        if self.is_tracing_started:
+            tracemalloc.stop()
+            self.is_tracing_started = False
+        PipelineInstrumentation.last_instrumentation = self
+
+    def get_slowest_steps(self, count=DEFAULT_SLOWEST_STEPS_COUNT) -> List[StepMetrics]:
+        return sorted(self.step_metrics, key=lambda step_metrics: step_metrics.wall_time, reverse=True)[:count]
+
+    def get_total_wall_time(self):
+        return sum(step_metrics.wall_time for step_metrics in self.step_metrics)
+
+    def create_report(self):
+        return {
+            'pipeline_name': self.pipeline_name,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'blender_version': '.'.join(str(version_number) for version_number in bpy.app.version),
+            'total_wall_time': self.get_total_wall_time(),
+            'total_cpu_time': sum(step_metrics.cpu_time for step_metrics in self.step_metrics),
+            'total_created_datablocks': sum(step_metrics.created_datablocks for step_metrics in self.step_metrics),
+            'steps': [step_metrics._asdict() for step_metrics in self.step_metrics],
+            'slowest_steps': [step_metrics.component_name for step_metrics in self.get_slowest_steps()],
+        }
+
+    def write_report(self):
+        started_at = self.started_at or datetime.now()
+        report_file_path = os.path.join(
+            self.reports_directory,
+            f'{self.pipeline_name}_{started_at.strftime(RUN_REPORT_TIMESTAMP_FORMAT)}.json'
+        )
+        os.makedirs(self.reports_directory, exist_ok=True)
+        with open(report_file_path, 'w') as report_file:
+            json.dump(self.create_report(), report_file, indent=4)
+
+        self.report_file_path = report_file_path
+        print(f'INFO: Wrote Setup Wizard run report: {report_file_path}')
+        self.remove_old_reports()
+        return report_file_path
+
+    def remove_old_reports(self):
+        report_file_paths = sorted(
+            [entry.path for entry in os.scandir(self.reports_directory) if entry.is_file() and entry.name.endswith('.json')],
+            key=os.path.getmtime,
+        )
+        for report_file_path in report_file_paths[:-MAX_RUN_REPORTS]:
+            try:
+                os.remove(report_file_path)
+            except OSError as ex:
+                print(f'WARNING: Unable to remove old run report {report_file_path}: {ex}')
+
+
+def get_run_reports_directory():
+    return os.path.join(bpy.utils.user_resource('CONFIG'), RUN_REPORTS_FOLDER_NAME)
+
+
+def count_datablocks():
+    return sum(len(getattr(bpy.data, collection_name, ())) for collection_name in DATABLOCK_COLLECTION_NAMES)
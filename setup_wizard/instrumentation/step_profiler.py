@@ -0,0 +1,116 @@
+# Author: michael-gh1
+
+import cProfile
+import io
+import os
+import pstats
+
+from datetime import datetime
+
+import bpy
+
+from setup_wizard.instrumentation.step_instrumentation import RUN_REPORT_TIMESTAMP_FORMAT, get_run_reports_directory
+from setup_wizard.logger import Logger
+
+ADDON_PACKAGE_NAME = __package__.split('.')[0]  # CharacterSetupWizardAddonPreferences.bl_idname
+PROFILE_STEPS_ENVIRONMENT_VARIABLE = 'CSW_PROFILE_STEPS'  # '1' profiles every step, or a comma-separated list of steps
+PROFILE_ALL_STEPS_VALUES = ['1', 'true', 'all', '*']
+DEFAULT_TOP_FUNCTIONS_COUNT = 25
+
+
+class StepProfile:
+    def __init__(self, step_index, component_name):
+        self.step_index = step_index
+        self.component_name = component_name
+        self.profile = cProfile.Profile()
+
+
+class StepProfiler:
+    '''
+    Profiles pipeline steps with cProfile. Each profiled step is saved as a .prof file (ex. for snakeviz or
+    pstats) in a folder per run in csw_run_reports, and the top functions by cumulative time are printed
+    and written to csw_logs/step_profiler.log.
+
+    Enabled in the addon preferences or with the CSW_PROFILE_STEPS environment variable, which takes priority.
+    '''
+    def __init__(self, run_name, component_names=None, top_functions_count=DEFAULT_TOP_FUNCTIONS_COUNT, profiles_directory=None):
+        self.component_names = component_names  # None profiles every step
+        self.top_functions_count = top_functions_count
+        self.profiles_directory = profiles_directory or os.path.join(
+            get_run_reports_directory(),
+            f'{run_name}_{datetime.now().strftime(RUN_REPORT_TIMESTAMP_FORMAT)}_profiles'
+        )
+        self.profile_file_paths = []
+        self.logger = None
+
+    @classmethod
+    def create(cls, run_name, context):
+        '''
+        Returns a StepProfiler if step profiling is enabled, otherwise None
+        '''
+        environment_value = os.environ.get(PROFILE_STEPS_ENVIRONMENT_VARIABLE, '').strip()
+        if environment_value:
+            return cls(run_name, cls.parse_component_names(environment_value))
+
+        addon = context.preferences.addons.get(ADDON_PACKAGE_NAME)
+        preferences = addon.preferences if addon else None
+        if preferences and getattr(preferences, 'step_profiling_enabled', False):
+            return cls(
+                run_name,
+                cls.parse_component_names(preferences.step_profiling_component_names),
+                preferences.step_profiling_top_functions_count,
+            )
+        return None
+
+    @staticmethod
+    def parse_component_names(value):
+        if not value.strip() or value.strip().lower() in PROFILE_ALL_STEPS_VALUES:
+            return None
+        return [component_name.strip() for component_name in value.split(',') if component_name.strip()]
+
+    def is_profiled(self, component_name):
+        return self.component_names is None or component_name in self.component_names
+
+    def start(self, step_index, component_name) -> StepProfile:
+        if not self.is_profiled(component_name):
+            return None
+        step_profile = StepProfile(step_index, component_name)
+        try:
+            step_profile.profile.enable()
+        except ValueError as ex:  # another profiler is already active
+            print(f'WARNING: Unable to profile step {step_index} ({component_name}): {ex}')
+            return None
+        return step_profile
+
+    def stop(self, step_profile: StepProfile):
+        if not step_profile:
+            return None
+        step_profile.profile.disable()
+
+        os.makedirs(self.profiles_directory, exist_ok=True)
+        profile_file_path = os.path.join(
+            self.profiles_directory,
+            f'{step_profile.step_index:02d}_{step_profile.component_name}.prof'
+        )
+        step_profile.profile.dump_stats(profile_file_path)
+        self.profile_file_paths.append(profile_file_path)
+
+        summary = self.create_summary(step_profile)
+        print(summary)
+        self.__get_logger().info(summary)
+        return profile_file_path
+
+    def create_summary(self, step_profile: StepProfile):
+        stream = io.StringIO()
+        pstats.Stats(step_profile.profile, stream=stream) \
+            .strip_dirs() \
+            .sort_stats(pstats.SortKey.CUMULATIVE) \
+            .print_stats(self.top_functions_count)
+        return f'INFO: Step {step_profile.step_index} ({step_profile.component_name}) ' \
+            f'top {self.top_functions_count} functions by cumulative time:\n{stream.getvalue()}'
+
+    def __get_logger(self):
+        if not self.logger:
+            log_file_path = os.path.join(bpy.utils.user_resource('CONFIG'), 'csw_logs', 'step_profiler.log')
+            self.logger = Logger(log_file_path).logger
+        return self.logger
@@ -1,6 +1,5 @@
 
 from abc import ABC, abstractmethod
-import json
 import os
 from pathlib import PurePosixPath
 from typing import List, Union
@@ -8,6 +7,7 @@ import bpy
 from bpy.types import Operator, Context, Material
 
 from setup_wizard.domain.body_hair_ramp_switch_values import BodyHairRampSwitchValues
+from setup_wizard.instrumentation.span_tracer import trace_span
 from setup_wizard.logger import log_function
 from setup_wizard.domain.material_data_body_part_to_version_map import body_part_based_on_version_map
 from setup_wizard.domain.shader_node_names import ShaderNodeNames, V2_GenshinShaderNodeNames, V3_GenshinShaderNodeNames
@@ -21,13 +21,18 @@ from setup_wizard.domain.shader_material_name_keywords import ShaderMaterialName
 
 from setup_wizard.domain.game_types import GameType
 from setup_wizard.domain.outline_material_data import OutlineMaterialGroup
-from setup_wizard.exceptions import UnsupportedMaterialDataJsonFormatException, UserInputException
+from setup_wizard.exceptions import UserInputException
 from setup_wizard.import_order import CHARACTER_MODEL_FOLDER_FILE_PATH, get_cache
 from setup_wizard.material_data_import_setup.material_data_applier import MaterialDataApplier, MaterialDataAppliersFactory
+from setup_wizard.material_data_import_setup.material_data_applier_selector import MaterialDataApplierSelector
+from setup_wizard.material_data_import_setup.material_data_cache import MaterialDataCache
+from setup_wizard.material_data_import_setup.material_data_document_store import MaterialDataDocumentStore
+from setup_wizard.parsers.material_data_json_parser_dispatcher import MaterialDataJsonParserDispatcher
 from setup_wizard.parsers.material_data_json_parsers import MaterialDataJsonParser, HoyoStudioMaterialDataJsonParser, \
     UABEMaterialDataJsonParser, UnknownHoyoStudioMaterialDataJsonParser
-from setup_wizard.utils.genshin_body_part_deducer import get_monster_body_part_name, get_npc_mesh_body_part_name, \
-    get_body_part
+from setup_wizard.utils.character_folder_manifest import CharacterFolderManifest
+from setup_wizard.utils.genshin_body_part_deducer import get_monster_body_part_name, get_npc_mesh_body_part_name
+from setup_wizard.utils.node_input_writer import node_input_writer
 
 
 class MaterialDataFile:
@@ -51,6 +56,8 @@ class GameMaterialDataImporter(ABC):
         raise NotImplementedError
 
     def apply_material_data(self, body_part: str, material_data_appliers: List[MaterialDataApplier], file):
+        material_data_appliers = self.material_data_applier_selector.select(material_data_appliers)
+
         for material_data_applier in material_data_appliers:
             try:
                 material_data_applier.set_up_mesh_material_data()
@@ -67,27 +74,6 @@ class GameMaterialDataImporter(ABC):
                 print('WARNING: Falling back and trying next version')
                 continue # fallback and try next version
 
-    # Originally a "private" method, but moved to public due to inheriting classes
-    def get_material_data_json_parser(self, json_material_data):
-        for index, parser_class in enumerate(self.parsers):
-            try:
-                parser: MaterialDataJsonParser  = parser_class(json_material_data)
-                parser.parse()
-                return parser
-            except AttributeError:
-                if index == len(self.parsers) - 1:
-                    raise UnsupportedMaterialDataJsonFormatException(self.parsers)
-
-    # TOOD: Refactor into own class?
-    @staticmethod
-    def open_and_load_json_data(directory_file_path, file):
-        with open(f'{directory_file_path}/{file.name}') as fp:
-            try:
-                json_material_data = json.load(fp)
-                return json_material_data
-            except UnicodeDecodeError:
-                raise Exception(f'Failed to load JSON. Did you select a different type of file? \nFile Selected: "{file.name}"')
-
     @log_function()
     def find_material_and_outline_material_for_body_part(self, body_part) -> Union[Material, Material, Material]:
         # Order of Selection
@@ -163,7 +149,7 @@ class GameMaterialDataImporter(ABC):
 
         material_data_files = []
         if material_data_directory:
-            for filename in os.listdir(material_data_directory):
+            for filename in CharacterFolderManifest.get(character_directory).get_entry_names(material_data_directory):
                 material_data_file = MaterialDataFile(filename)
                 material_data_files.append(material_data_file)
 
@@ -188,6 +174,16 @@ class GameMaterialDataImporter(ABC):
         if self.material and self.outlines_material and num_of_files != 1:
             raise UserInputException(f'\n\n>>> Select only 1 material data file to apply to the material. You selected {num_of_files} material data files to apply on 1 material.')
 
+    def create_material_data_document_store(self, material_data_directory: MaterialDataDirectory):
+        material_data_cache = MaterialDataCache() if self.context.window_manager.cache_enabled else None
+        material_data_json_parser_dispatcher = MaterialDataJsonParserDispatcher(self.parsers)
+        return MaterialDataDocumentStore(
+            material_data_directory.file_path,
+            material_data_directory.files,
+            material_data_json_parser_dispatcher.parse,
+            material_data_cache,
+        )
+
 
 class GameMaterialDataImporterFactory:
     def create(game_type: GameType, blender_operator: Operator, context: Context, outline_material_group: OutlineMaterialGroup):
@@ -222,9 +218,12 @@ class GenshinImpactMaterialDataImporter(GameMaterialDataImporter):
         self.outlines_material = outline_material_group.outlines_material
         self.material_names = material_names
         self.shader_node_names: ShaderNodeNames = shader_node_names
+        self.material_data_applier_selector = MaterialDataApplierSelector()
 
+    @trace_span()
     def import_material_data(self):
         self.validate_UI_inputs_for_targeted_material_data_import()
+        node_input_writer.reset_statistics()
         material_data_directory: MaterialDataDirectory = self.get_material_data_files()
 
         caller_is_advanced_setup = self.blender_operator.setup_mode == 'ADVANCED'
@@ -242,6 +241,7 @@ class GenshinImpactMaterialDataImporter(GameMaterialDataImporter):
             return {'SKIP'}
 
         self.validate_num_of_file_inputs_for_targeted_material_data_import(material_data_directory.files)
+        material_data_document_store = self.create_material_data_document_store(material_data_directory)
 
         for file in material_data_directory.files:
             body_part = None
@@ -270,8 +270,7 @@ class GenshinImpactMaterialDataImporter(GameMaterialDataImporter):
                 body_part = PurePosixPath(file.name).stem.split('_')[-1]
                 character_type = CharacterType.UNKNOWN  # catch-all, tries default material applying behavior
 
-            json_material_data = self.open_and_load_json_data(material_data_directory.file_path, file)
-            material_data_parser = self.get_material_data_json_parser(json_material_data)
+            material_data_parser = material_data_document_store.get_parser(file)
 
             material, outlines_material, night_soul_outlines_material = self.find_material_and_outline_material_for_body_part(body_part)
             outline_material_group: OutlineMaterialGroup = OutlineMaterialGroup(material, outlines_material, night_soul_outlines_material)
@@ -289,7 +288,7 @@ class GenshinImpactMaterialDataImporter(GameMaterialDataImporter):
                     f'* Expected Materials "{self.material_names.MATERIAL_PREFIX}{body_part}" and "{self.material_names.MATERIAL_PREFIX}{body_part} Outlines"')
                 continue
 
-            shadow_ramp_type_setter = ShadowRampTypeSetter(file, material_data_directory, self.shader_node_names)
+            shadow_ramp_type_setter = ShadowRampTypeSetter(file, material_data_document_store, self.shader_node_names)
             shadow_ramp_type_setter.set_shadow_ramp_type(material)
 
             material_data_appliers = MaterialDataAppliersFactory.create(
@@ -299,6 +298,8 @@ class GenshinImpactMaterialDataImporter(GameMaterialDataImporter):
                 character_type
             )
             self.apply_material_data(body_part, material_data_appliers, file)
+        material_data_document_store.flush()
+        node_input_writer.print_statistics()
         return {'FINISHED'}
 
     def __customized_skirk_starcloak_material_data_setup(self, material_data_parser, character_type, file, body_part):
@@ -314,9 +315,9 @@ class GenshinImpactMaterialDataImporter(GameMaterialDataImporter):
         self.apply_material_data(body_part, material_data_appliers, file)
 
 class ShadowRampTypeSetter:
-    def __init__(self, target_file, material_data_directory: MaterialDataDirectory, shader_node_names: ShaderNodeNames):
+    def __init__(self, target_file, material_data_document_store: MaterialDataDocumentStore, shader_node_names: ShaderNodeNames):
         self.target_file = target_file
-        self.material_data_directory = material_data_directory
+        self.material_data_document_store = material_data_document_store
         self.shader_node_names = shader_node_names
 
     def set_shadow_ramp_type(self, shader_material):
@@ -324,29 +325,7 @@ class ShadowRampTypeSetter:
         self.__set_shadow_ramp_type_on_shader_material(shader_material, shadow_ramp_type)
 
     def __get_shadow_ramp_type_by_PackedShadowRampTex(self):
-        material_data_files = [mat_file for mat_file in self.material_data_directory.files if mat_file.name.lower() != self.target_file.name.lower()]
-
-        target_file_json = GenshinImpactMaterialDataImporter.open_and_load_json_data(
-            self.material_data_directory.file_path, 
-            self.target_file
-        )
-        target_file_shadow_ramp_pathID = self.__get_shadow_ramp_pathID(target_file_json)
-
-        for material_data_file in material_data_files:
-            material_data_json = GenshinImpactMaterialDataImporter.open_and_load_json_data(
-                self.material_data_directory.file_path, 
-                material_data_file
-            )
-            shadow_ramp_pathID = self.__get_shadow_ramp_pathID(material_data_json)
-
-            if shadow_ramp_pathID and target_file_shadow_ramp_pathID and shadow_ramp_pathID == target_file_shadow_ramp_pathID:
-                return get_body_part(material_data_file)
-
-    def __get_shadow_ramp_pathID(self, material_data_json):
-        try:
-            return material_data_json.get('m_SavedProperties').get('m_TexEnvs').get('_PackedShadowRampTex').get('m_Texture').get('m_PathID')
-        except AttributeError:
-            return None
+        return self.material_data_document_store.get_shadow_ramp_type(self.target_file)
 
     def __set_shadow_ramp_type_on_shader_material(self, shader_material, shadow_ramp_type):
         body_shader_node = shader_material.node_tree.nodes.get(self.shader_node_names.BODY_SHADER)
@@ -354,13 +333,13 @@ class ShadowRampTypeSetter:
 
         if body_hair_ramp_switch_input:
             body_hair_ramp_switch_values: BodyHairRampSwitchValues = BodyHairRampSwitchValues(self.shader_node_names)
-            self.__set_up_body_hair_ramp_switch_value(body_hair_ramp_switch_input, shadow_ramp_type, body_hair_ramp_switch_values)
+            self.__set_up_body_hair_ramp_switch_value(body_hair_ramp_switch_input, shadow_ramp_type, body_hair_ramp_switch_values, shader_material.name)
 
-    def __set_up_body_hair_ramp_switch_value(self, switch_input, shadow_ramp_type, switch_values: BodyHairRampSwitchValues):
+    def __set_up_body_hair_ramp_switch_value(self, switch_input, shadow_ramp_type, switch_values: BodyHairRampSwitchValues, material_name):
         if shadow_ramp_type == 'Hair':  # TODO: Refactor into Enum along side genshin_body_part_deducer.py
-            switch_input.default_value = switch_values.HAIR
+            node_input_writer.write(switch_input, switch_values.HAIR, material_name)
         elif shadow_ramp_type == 'Body':  # TODO: Refactor into Enum along side genshin_body_part_deducer.py
-            switch_input.default_value = switch_values.BODY
+            node_input_writer.write(switch_input, switch_values.BODY, material_name)
 
 
 class HonkaiStarRailMaterialDataImporter(GameMaterialDataImporter):
@@ -376,9 +355,12 @@ class HonkaiStarRailMaterialDataImporter(GameMaterialDataImporter):
         self.outlines_material = outline_material_group.outlines_material
         self.material_names = material_names
         self.shader_node_names = shader_node_names
+        self.material_data_applier_selector = MaterialDataApplierSelector()
 
+    @trace_span()
     def import_material_data(self):
         self.validate_UI_inputs_for_targeted_material_data_import()
+        node_input_writer.reset_statistics()
         material_data_directory: MaterialDataDirectory = self.get_material_data_files()
 
         caller_is_advanced_setup = self.blender_operator.setup_mode == 'ADVANCED'
@@ -396,6 +378,7 @@ class HonkaiStarRailMaterialDataImporter(GameMaterialDataImporter):
             return {'SKIP'}
 
         self.validate_num_of_file_inputs_for_targeted_material_data_import(material_data_directory.files)
+        material_data_document_store = self.create_material_data_document_store(material_data_directory)
 
         for file in material_data_directory.files:
             is_firefly = PurePosixPath(file.name).stem.split('_')[-1] == 'D' or PurePosixPath(file.name).stem.split('_')[-1] == 'S'
@@ -405,8 +388,6 @@ class HonkaiStarRailMaterialDataImporter(GameMaterialDataImporter):
                 else PurePosixPath(file.name).stem.split('_')[-1]
             character_type = CharacterType.HSR_AVATAR
 
-            json_material_data = self.open_and_load_json_data(material_data_directory.file_path, file)
-
             material, outlines_material, __ = self.find_material_and_outline_material_for_body_part(body_part)
             outline_material_group: OutlineMaterialGroup = OutlineMaterialGroup(material, outlines_material)
 
@@ -418,7 +399,7 @@ class HonkaiStarRailMaterialDataImporter(GameMaterialDataImporter):
                     f'* Expected Materials "{self.material_names.MATERIAL_PREFIX}{body_part}" and "{self.material_names.MATERIAL_PREFIX}{body_part} Outlines"')
                 continue
 
-            material_data_parser = self.get_material_data_json_parser(json_material_data)
+            material_data_parser = material_data_document_store.get_parser(file)
             material_data_appliers = MaterialDataAppliersFactory.create(
                 self.blender_operator.game_type,
                 material_data_parser,
@@ -426,6 +407,8 @@ class HonkaiStarRailMaterialDataImporter(GameMaterialDataImporter):
                 character_type
             )
             self.apply_material_data(body_part, material_data_appliers, file)
+        material_data_document_store.flush()
+        node_input_writer.print_statistics()
         return {'FINISHED'}
 
 
@@ -443,6 +426,8 @@ class PunishingGrayRavenMaterialDataImporter(GameMaterialDataImporter):
         self.outlines_material = outline_material_group.outlines_material
         self.material_names = material_names
         self.shader_node_names = shader_node_names
+        self.material_data_applier_selector = MaterialDataApplierSelector()
 
+    @trace_span()
     def import_material_data(self):
         return {'FINISHED'}
@@ -1,6 +1,5 @@
 # Author: michael-gh1
 
-from collections import defaultdict
 from enum import auto
 import bpy
 
@@ -14,6 +13,11 @@ from setup_wizard.domain.character_types import CharacterType
 from setup_wizard.domain.game_types import GameType
 from setup_wizard.domain.outline_material_data import OutlineMaterialGroup
 from setup_wizard.domain.shader_material_names import V3_BonnyFestivityGenshinImpactMaterialNames, V1_HoYoToonGenshinImpactMaterialNames
+from setup_wizard.geometry_nodes_setup.outline_modifier_index import OutlineModifierIndex
+from setup_wizard.instrumentation.span_tracer import trace_span
+from setup_wizard.material_data_import_setup.srgb_color_converter import srgb_color_converter
+from setup_wizard.material_data_import_setup.tooltip_binding_plan import TooltipBinding, TooltipBindingPlan
+from setup_wizard.utils.node_input_writer import node_input_writer
 
 
 class MaterialDataAppliersFactory:
@@ -72,6 +76,23 @@ class MaterialDataApplier(ABC):
     def set_up_outline_material_data(self, body_part, file):
         pass
 
+    def get_required_node_inputs(self):
+        '''
+        The (node_tree, node_name, input_names) this applier writes to, used by the MaterialDataApplierSelector
+        to check if the applier is compatible with the shader before writing anything.
+        Only inputs for material data that exists in the selected JSON are required, because those are the only ones written to.
+        '''
+        return [
+            (self.outline_material.node_tree, self.outlines_node_tree_node_name, self.get_required_input_names(self.outline_mapping)),
+        ]
+
+    def get_required_input_names(self, material_mapping):
+        required_input_names = []
+        for material_json_name, material_node_name in material_mapping.items():
+            if material_json_name in self.material_data_parser.properties:
+                required_input_names.extend(material_node_name if type(material_node_name) is list else [material_node_name])
+        return tuple(required_input_names)
+
     def set_up_outline_colors(self):
         outlines_shader_node_inputs = self.outline_material.node_tree.nodes.get(self.outlines_node_tree_node_name).inputs
 
@@ -80,13 +101,18 @@ class MaterialDataApplier(ABC):
             outlines_shader_node_inputs,
         )
 
+    @trace_span()
     def apply_material_data(self, material_mapping, node_inputs):
-        for material_json_name, material_node_name in material_mapping.items():
+        material_json_values = self.material_data_parser.properties.get_many(material_mapping.keys())
+        if type(self) is V2_HSR_MaterialDataApplier:
+            # Convert to sRGB to Hex to RGB for Nya222 Shader, all colors at once
+            # Currently it doesn't do a conversion from gamma-corrected RGB to linear color space
+            material_json_values = srgb_color_converter.convert_many(material_json_values)
+
+        for (material_json_name, material_node_name), material_json_value in zip(material_mapping.items(), material_json_values):
             material_node_names = material_node_name if type(material_node_name) is list else [material_node_name]
 
             for material_node_name in material_node_names:
-                material_json_value = self.get_value_in_json_parser(self.material_data_parser, material_json_name)
-
                 if material_json_value is None:  # explicitly check for None
                     self.__handle_material_value_not_found(material_json_name)
                     continue
@@ -99,28 +125,22 @@ class MaterialDataApplier(ABC):
                 else:
                     node_input = node_inputs.get(material_node_name)
                 try:
-                    # Convert to sRGB to Hex to RGB for Nya222 Shader 
-                    # Currently it doesn't do a conversion from gamma-corrected RGB to linear color space
-                    if type(self) is V2_HSR_MaterialDataApplier and type(material_json_value) is tuple:
-                        material_json_value = self.convert_color_srgb_to_hex_to_rgb(material_json_value)
-                    node_input.default_value = material_json_value
+                    self.write_node_input(node_input, material_json_value)
                 except AttributeError as ex:
                     print(f'Did not find {material_node_name} in {self.material.name}/{self.outline_material.name} material using {self} \
                         Falling back to next MaterialDataApplier version')
                     raise ex
 
-    def get_value_in_json_parser(self, parser, key):
-        m_floats = getattr(parser.m_floats, key, None)
-        m_colors = getattr(parser.m_colors, key, None)
-        m_texEnvs = getattr(parser.m_texEnvs, key, None)
+    def write_node_input(self, node_input, value):
+        node_input_writer.write(node_input, value, self.material.name)
 
-        return m_floats if m_floats is not None else \
-            m_colors if m_colors is not None else \
-                m_texEnvs if m_texEnvs is not None else None
+    def get_value_in_json_parser(self, parser, key):
+        return parser.properties.get(key)
 
     def __handle_material_value_not_found(self, material_json_name):
         print(f'Info: Unable to find material data: {material_json_name} in selected JSON.')
 
+    # Reference implementation of SrgbColorConverter, which is used when applying material data
     def convert_color_srgb_to_hex_to_rgb(self, material_json_value):
         r = material_json_value[0]
         g = material_json_value[1]
@@ -192,6 +212,19 @@ class V1_MaterialDataApplier(MaterialDataApplier):
     def __init__(self, material_data_parser, material: Material):
         super().__init__(material_data_parser, material, self.outlines_node_tree_node_name)
 
+    def get_required_node_inputs(self):
+        required_node_inputs = super().get_required_node_inputs()
+        if 'Face' not in self.material.name:
+            required_node_inputs.append(
+                (self.material.node_tree, self.shader_node_tree_node_name, self.get_required_input_names(self.local_material_mapping))
+            )
+        if 'Body' in self.material.name:
+            global_material_properties_node_group = bpy.data.node_groups.get("GLOBAL MATERIAL PROPERTIES")
+            required_node_inputs.append(
+                (global_material_properties_node_group, self.global_node_group_node_name, self.get_required_input_names(self.global_material_mapping))
+            )
+        return required_node_inputs
+
     def set_up_mesh_material_data(self):
         if 'Face' not in self.material.name:
             shader_node_tree_inputs = self.material.node_tree.nodes[self.shader_node_tree_node_name].inputs
@@ -280,6 +313,13 @@ class V2_MaterialDataApplier(MaterialDataApplier):
             self.outlines_node_tree_node_name = outlines_node_tree_node_name
         super().__init__(material_data_parser, outline_material_group, self.outlines_node_tree_node_name)
 
+    def get_required_node_inputs(self):
+        required_input_names = self.get_required_input_names(self.local_material_mapping)
+        return super().get_required_node_inputs() + [
+            (self.material.node_tree, self.shader_node_tree_node_name, required_input_names),
+            (self.outline_material.node_tree, self.shader_node_tree_node_name, required_input_names),
+        ]
+
     def set_up_mesh_material_data(self):
         base_material_shader_node_tree_inputs = self.material.node_tree.nodes[self.shader_node_tree_node_name].inputs
         outline_material_shader_node_tree_inputs = self.outline_material.node_tree.nodes[self.shader_node_tree_node_name].inputs
@@ -329,7 +369,7 @@ class V2_MaterialDataApplier(MaterialDataApplier):
         for material_node_name, material_json_value in _MainTexAlphaUse_material_node_dict.items():
             node_input = node_inputs.get(material_node_name)
             try:
-                node_input.default_value = material_json_value
+                self.write_node_input(node_input, material_json_value)
             except AttributeError as ex:
                 print(f'Did not find {material_node_name} in {self.material.name} material using {self} \
                     Skipped.')
@@ -438,6 +478,15 @@ class V3_MaterialDataApplier(V2_MaterialDataApplier):
         self.shader_node_tree_node_name = self.face_shader_node_tree_node_name if 'Face' in self.material.name else \
             self.body_shader_node_tree_node_name
 
+    def get_required_node_inputs(self):
+        # additional_local_material_mapping is not required, it is skipped if the shader is on an older V3 version
+        material_mapping = self.face_material_mapping if self.material.name == V3_BonnyFestivityGenshinImpactMaterialNames.FACE else \
+            self.local_material_mapping
+        return MaterialDataApplier.get_required_node_inputs(self) + [
+            (self.material.node_tree, self.shader_node_tree_node_name, self.get_required_input_names(material_mapping)),
+            (self.outline_material.node_tree, self.outlines_node_tree_node_name, self.get_required_input_names(self.outline_mapping)),
+        ]
+
     def set_up_mesh_material_data(self):
         base_material_shader_node_tree_inputs = self.material.node_tree.nodes[self.shader_node_tree_node_name].inputs
         outline_material_shader_node_tree_inputs = self.outline_material.node_tree.nodes[self.outlines_node_tree_node_name].inputs
@@ -470,11 +519,6 @@ class V3_MaterialDataApplier(V2_MaterialDataApplier):
             outline_material_shader_node_tree_inputs
         )
 
-class mTexEnvsKeys:
-    def __init__(self, key, m_TexEnvs_key):
-        self.key = key
-        self.m_TexEnvs_key = m_TexEnvs_key
-
 class V1_HoYoToonMaterialDataApplier(V3_MaterialDataApplier):
     class ShaderNodeType:
         INPUT = auto()
@@ -506,6 +550,13 @@ class V1_HoYoToonMaterialDataApplier(V3_MaterialDataApplier):
         3: {},
     }
 
+    def get_required_node_inputs(self):
+        # Inputs are bound by tooltip, so only the nodes themselves are required
+        return MaterialDataApplier.get_required_node_inputs(self) + [
+            (self.material.node_tree, self.shader_node_tree_node_name, ()),
+            (self.material.node_tree, ShaderNodeNames.EXTERNAL_GLOBAL_PROPERTIES, ()),
+        ]
+
     def set_up_mesh_material_data(self):
         shader_node = self.material.node_tree.nodes[self.shader_node_tree_node_name]
         outline_shader_node = self.outline_material.node_tree.nodes[self.outlines_node_tree_node_name]
@@ -522,59 +573,42 @@ class V1_HoYoToonMaterialDataApplier(V3_MaterialDataApplier):
             self.set_up_mesh_material_data_with_tooltips(vfx_shader_node, vfx_shader_node)
         self.set_up_mesh_material_data_with_tooltips(global_properties_interface_node, global_properties_inputs_node)
 
+    @trace_span()
     def set_up_mesh_material_data_with_tooltips(self, interface_node, inputs_node, is_outlines=False):
-        shader_node_interface_input_items = interface_node.node_tree.interface.items_tree.values()
-        description_to_names = defaultdict(list)
-        for input in shader_node_interface_input_items:
-            description_to_names[input.description].append(input.name)
-        for node_interface_input in shader_node_interface_input_items:
-            material_data_key = node_interface_input.description.strip()  # Tooltip
-
-            if self.is_tooltip_TexEnv(material_data_key):
-                m_TexEnvs_keys: mTexEnvsKeys = self.get_TexEnv_Keys(material_data_key)
-                m_TexEnv_values = self.get_value_in_json_parser(self.material_data_parser, m_TexEnvs_keys.m_TexEnvs_key)
-                if m_TexEnv_values:
-                    material_json_value = m_TexEnv_values.get(m_TexEnvs_keys.key)
-                    material_json_value = (
-                        material_json_value.get('X') or 0.0, 
-                        material_json_value.get('Y') or 0.0, 
-                        material_json_value.get('Z') or 0.0
-                    )
-            else:
-                material_json_value = self.get_value_in_json_parser(self.material_data_parser, material_data_key)
+        tooltip_binding_plan = TooltipBindingPlan.get(interface_node, inputs_node)
+        material_data_properties = self.material_data_parser.properties
+        node_inputs = inputs_node.inputs
+
+        for binding in tooltip_binding_plan.bindings:
+            material_data_key = binding.material_data_key
+            material_json_value = self.get_binding_value(binding, material_data_properties)
+
             if material_json_value is not None and type(material_json_value) is not dict:  # Explicit None check in case value is falsy
                 try:
-                    material_json_value = self.__manipulate_material_data_to_shader_value(
-                        material_data_key, 
-                        material_json_value,
-                        node_interface_input,
-                        inputs_node
-                    )
+                    material_json_value = binding.coerce(material_json_value)
 
                     if material_data_key == '_MainTexAlphaUse':
                         self.set_up_alpha_options_material_data(
-                            inputs_node.inputs, 
+                            node_inputs, 
                             outlines_alpha_only=is_outlines,
                             _MainTexAlphaUse_mapping=self._MainTexAlphaUse_mapping
                         )
                     else:
-                        inputs_node.inputs.get(node_interface_input.name).default_value = material_json_value
+                        self.write_node_input(node_inputs.get(binding.socket_name), material_json_value)
 
-                        if material_data_key == '_Color' and description_to_names.get('_ColorAlpha') and \
-                            [inputs_node.inputs.get(input_name) for input_name in description_to_names.get('_ColorAlpha')]:
-                            _ColorAlpha_input_name = description_to_names.get('_ColorAlpha')[0]
-                            inputs_node.inputs.get(_ColorAlpha_input_name).default_value = material_json_value[3]
+                        if material_data_key == '_Color' and tooltip_binding_plan.color_alpha_socket_name:
+                            self.write_node_input(node_inputs.get(tooltip_binding_plan.color_alpha_socket_name), material_json_value[3])
 
                         # Hu Tao Cherry Snow-Laden and Escoffier
                         if self.is_old_stocking_shading(material_data_key, material_json_value):
-                            toggle_old_stocking_shading_input = inputs_node.inputs.get(self.shader_node_input_names.TOGGLE_OLD_STOCKING_SHADING)
+                            toggle_old_stocking_shading_input = node_inputs.get(self.shader_node_input_names.TOGGLE_OLD_STOCKING_SHADING)
                             self.set_old_stocking_shading(toggle_old_stocking_shading_input, True)
                 except AttributeError as ex:
-                    print(f'Did not find {node_interface_input.name} in {self.material.name}/{self.outline_material.name} material using {self} \
+                    print(f'Did not find {binding.socket_name} in {self.material.name}/{self.outline_material.name} material using {self} \
                         Falling back to next MaterialDataApplier version')
                     raise ex
                 except TypeError as ex:
-                    print(f'ERROR: {ex} on {node_interface_input.name} in {self.material.name}/{self.outline_material.name} material using {self} for {material_json_value}')
+                    print(f'ERROR: {ex} on {binding.socket_name} in {self.material.name}/{self.outline_material.name} material using {self} for {material_json_value}')
 
         # Disable Toggle Stencil on Face material for older characters without Pupil materials
         if self.material.name.endswith('Face') and self.is_not_using_eye_stencil():
@@ -592,40 +626,25 @@ class V1_HoYoToonMaterialDataApplier(V3_MaterialDataApplier):
             toggle_alpha_node = inputs_node.inputs.get(self.shader_node_input_names.TOGGLE_ALPHA)
             transparency_clip_node = inputs_node.inputs.get(self.shader_node_input_names.TRANSPARENCY_CLIP_THRESHOLD)
 
-            toggle_alpha_node.default_value = True
-            transparency_clip_node.default_value = 1.0
-
-    def is_tooltip_TexEnv(self, tooltip):
-        tooltip_keys = tooltip.split(' ')
-        if len(tooltip_keys) == 1:
-            return False
+            self.write_node_input(toggle_alpha_node, True)
+            self.write_node_input(transparency_clip_node, 1.0)
 
-        m_TexEnvs_key = tooltip_keys[1]
-        if m_TexEnvs_key.startswith('(') and m_TexEnvs_key.endswith(')'):
-            return True
-        return False
-
-    def get_TexEnv_Keys(self, tooltip):
-        tooltip_keys = tooltip.split(' ')
-        if len(tooltip_keys) == 1:
-            return False
-
-        key = tooltip_keys[0]
-        m_TexEnvs_key = tooltip_keys[1].replace('(', '').replace(')', '')
-        
-        return mTexEnvsKeys(key, m_TexEnvs_key)
-
-    def __manipulate_material_data_to_shader_value(self, material_data_key, material_json_value, node_interface_input, inputs_node=None):
-        input_object = inputs_node.inputs.get(node_interface_input.name) if inputs_node else node_interface_input
-
-        if (type(input_object) is bpy.types.NodeSocketBool or type(input_object) is bpy.types.NodeTreeInterfaceSocketBool) and \
-            type(material_json_value) is float:
-            material_json_value = bool(material_json_value)
-        elif (type(input_object) is bpy.types.NodeSocketInt or type(input_object) is bpy.types.NodeTreeInterfaceSocketInt) and \
-            type(material_json_value) is float:
-            material_json_value = int(material_json_value) + 1  # Shader values are one-based while material data is zero-based indexing
-        elif self.is_number_of_values_mismatch(input_object, material_json_value):
-            material_json_value = material_json_value[:3]
+    def get_binding_value(self, binding: TooltipBinding, material_data_properties):
+        '''
+        Returns the material data value of the binding's tooltip, an (X, Y, Z) tuple for TexEnv tooltips
+        '''
+        material_json_value = material_data_properties.get(binding.material_data_key)
+
+        if binding.m_TexEnvs_key:
+            m_TexEnv_values = material_json_value
+            material_json_value = None
+            if m_TexEnv_values:
+                material_json_value = m_TexEnv_values.get(binding.m_TexEnvs_key)
+                material_json_value = (
+                    material_json_value.get('X') or 0.0, 
+                    material_json_value.get('Y') or 0.0, 
+                    material_json_value.get('Z') or 0.0
+                )
         return material_json_value
 
     def has_normal_map(self, material_data_parser) -> bool:
@@ -639,7 +658,7 @@ class V1_HoYoToonMaterialDataApplier(V3_MaterialDataApplier):
 
     def set_toggle_normal_map(self, toggle_normal_map_input, value: bool) -> None:
         if toggle_normal_map_input:
-            toggle_normal_map_input.default_value = value
+            self.write_node_input(toggle_normal_map_input, value)
 
     def is_not_using_eye_stencil(self) -> bool:
         '''
@@ -650,7 +669,7 @@ class V1_HoYoToonMaterialDataApplier(V3_MaterialDataApplier):
 
     def set_use_eye_stencil(self, use_eye_stencil_input, value: bool) -> None:
         if use_eye_stencil_input:
-            use_eye_stencil_input.default_value = value
+            self.write_node_input(use_eye_stencil_input, value)
 
     def is_old_stocking_shading(self, material_data_key, material_data_value) -> bool:
         """
@@ -670,61 +689,43 @@ class V1_HoYoToonMaterialDataApplier(V3_MaterialDataApplier):
 
     def set_old_stocking_shading(self, toggle_old_stocking_shading_input, value: bool) -> None:
         if toggle_old_stocking_shading_input:
-            toggle_old_stocking_shading_input.default_value = value
+            self.write_node_input(toggle_old_stocking_shading_input, value)
 
     def set_up_outline_material_data(self, body_part, file):
         self.set_up_outline_material_data_with_tooltips(body_part, file)
 
+    @trace_span()
     def set_up_outline_material_data_with_tooltips(self, body_part, file):
-        for scene_object in bpy.context.scene.objects.values():
-            for modifier in scene_object.modifiers:
-                if f'Outlines {body_part}' in modifier.name or f'Outlines {file.name.rsplit("_", 1)[0]}' in modifier.name:
-                    print(f"INFO: Modifying '{modifier.name}' using '{file.name}'")
-                    sockets = [item for item in modifier.node_group.interface.items_tree if item.item_type == 'SOCKET']
-                    for socket in sockets:
-                        material_data_key = socket.description  # Tooltip
-
-                        if self.is_tooltip_TexEnv(material_data_key):
-                            m_TexEnvs_keys: mTexEnvsKeys = self.get_TexEnv_Keys(material_data_key)
-                            m_TexEnv_values = self.get_value_in_json_parser(self.material_data_parser, m_TexEnvs_keys.m_TexEnvs_key)
-                            if m_TexEnv_values:
-                                material_json_value = m_TexEnv_values.get(m_TexEnvs_keys.key)
-                                material_json_value = (
-                                    material_json_value.get('X') or 0.0, 
-                                    material_json_value.get('Y') or 0.0, 
-                                    material_json_value.get('Z') or 0.0
-                                )
-                        else:
-                            material_json_value = self.get_value_in_json_parser(self.material_data_parser, material_data_key)
-                        if material_json_value is not None and type(material_json_value) is not dict:  # Explicit None check in case value is falsy
-                            try:
-                                material_json_value = self.__manipulate_material_data_to_shader_value(
-                                    material_data_key, 
-                                    material_json_value,
-                                    socket
-                                )
-                                modifier[socket.identifier] = material_json_value
-                            except AttributeError as ex:
-                                print(f'Did not find {socket.name} in {self.material.name}/{self.outline_material.name} material using {self} \
-                                    Falling back to next MaterialDataApplier version')
-                                raise ex
-                            except TypeError as ex:
-                                print(f'ERROR: {ex} on {socket.name} in {self.material.name}/{self.outline_material.name} material using {self} for {material_json_value}')
-
-    '''
-    Specifically for handling `NS Anim` and `NS Scale`, which both have only 3 inputs, but material data has 4 (rgba)
-    This was done on the shader because NodeSocketVectors can handle negative values while colors cannot
-    '''
-    def is_number_of_values_mismatch(self, input, material_json_value):
-        return (type(input) is bpy.types.NodeSocketVector or type(input) is bpy.types.NodeTreeInterfaceSocketVector) and \
-            len(input.default_value) == 3 and \
-            len(material_json_value) == 4
+        outline_modifier_index = OutlineModifierIndex.get()
+        material_data_properties = self.material_data_parser.properties
+
+        for modifier in outline_modifier_index.get_modifiers(body_part, file.name.rsplit("_", 1)[0]):
+            print(f"INFO: Modifying '{modifier.name}' using '{file.name}'")
+            tooltip_binding_plan = TooltipBindingPlan.get_for_modifier(modifier.node_group)
+            for binding in tooltip_binding_plan.bindings:
+                material_json_value = self.get_binding_value(binding, material_data_properties)
+
+                if material_json_value is not None and type(material_json_value) is not dict:  # Explicit None check in case value is falsy
+                    try:
+                        material_json_value = binding.coerce(material_json_value)
+                        node_input_writer.write_property(modifier, binding.socket_identifier, material_json_value, self.outline_material.name)
+                    except AttributeError as ex:
+                        print(f'Did not find {binding.socket_name} in {self.material.name}/{self.outline_material.name} material using {self} \
+                            Falling back to next MaterialDataApplier version')
+                        raise ex
+                    except TypeError as ex:
+                        print(f'ERROR: {ex} on {binding.socket_name} in {self.material.name}/{self.outline_material.name} material using {self} for {material_json_value}')
 
 
 class V2_WeaponMaterialDataApplier(V2_MaterialDataApplier):
     def __init__(self, material_data_parser, outline_material_group: OutlineMaterialGroup):
         super().__init__(material_data_parser, outline_material_group)
 
+    def get_required_node_inputs(self):
+        return MaterialDataApplier.get_required_node_inputs(self) + [
+            (self.material.node_tree, self.shader_node_tree_node_name, self.get_required_input_names(self.local_material_mapping)),
+        ]
+
     def set_up_mesh_material_data(self):
         weapon_material = self.material
         shader_node_tree_inputs = weapon_material.node_tree.nodes[self.shader_node_tree_node_name].inputs
@@ -803,6 +804,11 @@ class V2_HSR_MaterialDataApplier(V2_MaterialDataApplier):
         if 'Face' in self.material.name:
             self.outline_mapping = self.face_outline_mapping
 
+    def get_required_node_inputs(self):
+        return MaterialDataApplier.get_required_node_inputs(self) + [
+            (self.material.node_tree, self.shader_node_tree_node_name, self.get_required_input_names(self.local_material_mapping)),
+        ]
+
     def set_up_mesh_material_data(self):
         shader_node_tree_inputs = self.material.node_tree.nodes[self.shader_node_tree_node_name].inputs
 
@@ -898,6 +904,17 @@ class StellarToon_MaterialDataApplier(V2_MaterialDataApplier):
         if 'Face' in self.material.name:
             self.outline_mapping = self.face_outline_mapping
 
+    def get_required_node_inputs(self):
+        if 'Hair' in self.material.name:
+            required_input_names = self.get_required_input_names(self.hair_material_mapping)
+        elif 'Face' in self.material.name:
+            required_input_names = self.get_required_input_names(self.face_material_mapping) + ('Enable Emission',)
+        else:
+            required_input_names = self.get_required_input_names(self.local_material_mapping)
+        return MaterialDataApplier.get_required_node_inputs(self) + [
+            (self.material.node_tree, self.shader_node_tree_node_name, required_input_names),
+        ]
+
     def set_up_mesh_material_data(self):
         shader_node_tree_inputs = self.material.node_tree.nodes[self.shader_node_tree_node_name].inputs
 
@@ -911,7 +928,7 @@ class StellarToon_MaterialDataApplier(V2_MaterialDataApplier):
                 self.face_material_mapping,
                 shader_node_tree_inputs,
             )
-            self.material.node_tree.nodes.get(self.shader_node_tree_node_name).inputs.get('Enable Emission').default_value = 1.0
+            self.write_node_input(self.material.node_tree.nodes.get(self.shader_node_tree_node_name).inputs.get('Enable Emission'), 1.0)
         else:
             super().apply_material_data(
                 self.local_material_mapping,
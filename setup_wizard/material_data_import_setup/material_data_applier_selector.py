@@ -0,0 +1,65 @@
+# Author: michael-gh1
+
+from typing import List
+
+from setup_wizard.material_data_import_setup.material_data_applier import MaterialDataApplier
+
+
+class MaterialDataApplierSelector:
+    '''
+    Orders the MaterialDataAppliers before anything is written, so the first applier run is one whose nodes and
+    inputs exist, instead of running each applier version until one does not raise (which leaves the inputs
+    written by the failed appliers behind).
+
+    Compatible appliers come first and the rest follow in their original order, so an applier that still fails
+    on something the probe does not cover (ex. outline colors) falls back to the next version.
+
+    Each applier is probed against the nodes and inputs it requires. The result is cached by applier type
+    and the node groups (shader version) it was probed against, so materials set up with the same shader
+    version within a run only get probed once.
+    '''
+    def __init__(self):
+        self.compatibility = {}
+
+    def select(self, material_data_appliers: List[MaterialDataApplier]) -> List[MaterialDataApplier]:
+        compatible_material_data_appliers = [
+            material_data_applier for material_data_applier in material_data_appliers if self.is_compatible(material_data_applier)
+        ]
+
+        if not compatible_material_data_appliers:
+            print(f'WARNING: No compatible MaterialDataApplier found in {[applier.__class__.__name__ for applier in material_data_appliers]}')
+            print('WARNING: Falling back to trying each version')
+        return compatible_material_data_appliers + [
+            material_data_applier for material_data_applier in material_data_appliers
+            if material_data_applier not in compatible_material_data_appliers
+        ]
+
+    def is_compatible(self, material_data_applier: MaterialDataApplier):
+        try:
+            required_node_inputs = [
+                (node_tree.nodes.get(node_name), node_name, input_names)
+                for node_tree, node_name, input_names in material_data_applier.get_required_node_inputs()
+            ]
+        except AttributeError:  # Material, outline material or node group does not exist
+            return False
+
+        compatibility_key = (
+            type(material_data_applier),
+            tuple(
+                (node_name, self.__get_node_group_name(node), input_names)
+                for node, node_name, input_names in required_node_inputs
+            ),
+        )
+        is_compatible = self.compatibility.get(compatibility_key)
+        if is_compatible is None:
+            is_compatible = all(
+                node is not None and all(node.inputs.get(input_name) is not None for input_name in input_names)
+                for node, _, input_names in required_node_inputs
+            )
+            self.compatibility[compatibility_key] = is_compatible
+        return is_compatible
+
+    @staticmethod
+    def __get_node_group_name(node):
+        node_group = getattr(node, 'node_tree', None)
+        return node_group.name if node_group else None
@@ -0,0 +1,184 @@
+# Author: michael-gh1
+
+import hashlib
+import json
+import marshal
+import os
+import shutil
+import time
+import zlib
+
+import bpy
+
+MATERIAL_DATA_CACHE_FOLDER_NAME = 'csw_material_data_cache'
+MATERIAL_DATA_CACHE_INDEX_FILENAME = 'index.json'
+MATERIAL_DATA_CACHE_ENTRY_EXTENSION = '.bin'
+MATERIAL_DATA_CACHE_VERSION = 1
+MATERIAL_DATA_CACHE_MAX_SIZE_BYTES = 64 * 1024 * 1024
+
+
+class MaterialDataCache:
+    '''
+    Persistent cache of normalized material data (m_Floats/m_Colors/m_TexEnvs), stored in the user's Blender config folder.
+    Files are looked up by path + size + mtime. If that misses, the content hash of the file is used instead,
+    so copies of the same material data JSON in other folders still hit the cache.
+    Entries are marshalled and compressed, and the least recently used entries are evicted past the size cap.
+    New entries and the index are kept in memory and written once by flush(), at the end of the import run.
+    '''
+    def __init__(self, cache_directory=None, max_size_bytes=MATERIAL_DATA_CACHE_MAX_SIZE_BYTES):
+        self.cache_directory = cache_directory or \
+            os.path.join(bpy.utils.user_resource('CONFIG'), MATERIAL_DATA_CACHE_FOLDER_NAME)
+        self.max_size_bytes = max_size_bytes
+        self.index_file_path = os.path.join(self.cache_directory, MATERIAL_DATA_CACHE_INDEX_FILENAME)
+        self.index = None
+        self.pending_entries = {}  # content hash: compressed entry, not written yet
+        self.is_dirty = False
+
+    def get(self, file_path):
+        content_hash = self.__get_content_hash(file_path)
+        if not content_hash:
+            return None
+
+        material_data = self.__read_entry(content_hash)
+        if material_data is not None:
+            self.__get_index()['entries'][content_hash]['last_used'] = time.time()
+            self.is_dirty = True
+        return material_data
+
+    def put(self, file_path, material_data):
+        content_hash = self.__get_content_hash(file_path)
+        if not content_hash:
+            return
+
+        try:
+            entry = zlib.compress(marshal.dumps(material_data))
+        except ValueError as ex:
+            print(f'WARNING: Unable to cache material data for {file_path}: {ex}')
+            return
+
+        self.pending_entries[content_hash] = entry
+        self.__get_index()['entries'][content_hash] = {
+            'size': len(entry),
+            'last_used': time.time(),
+        }
+        self.is_dirty = True
+        self.__evict_least_recently_used()
+
+    def flush(self):
+        if not self.is_dirty:
+            return
+        try:
+            os.makedirs(self.cache_directory, exist_ok=True)
+            for content_hash, entry in self.pending_entries.items():
+                with open(self.__get_entry_file_path(content_hash), 'wb') as entry_file:
+                    entry_file.write(entry)
+            with open(self.index_file_path, 'w') as index_file:
+                json.dump(self.__get_index(), index_file)
+        except OSError as ex:
+            print(f'WARNING: Unable to save material data cache to {self.cache_directory}: {ex}')
+            return
+        self.pending_entries.clear()
+        self.is_dirty = False
+
+    def clear(self):
+        if os.path.isdir(self.cache_directory):
+            print(f'Clearing material data cache: {self.cache_directory}')
+            shutil.rmtree(self.cache_directory, ignore_errors=True)
+        self.index = self.__create_index()
+        self.pending_entries.clear()
+        self.is_dirty = False
+
+    def get_size(self):
+        return sum(entry.get('size', 0) for entry in self.__get_index()['entries'].values())
+
+    def __get_content_hash(self, file_path):
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        paths = self.__get_index()['paths']
+        path_entry = paths.get(file_path)
+        if path_entry and path_entry['size'] == file_stat.st_size and path_entry['mtime'] == file_stat.st_mtime_ns:
+            return path_entry['hash']
+
+        content_hash = self.hash_file(file_path)
+        paths[file_path] = {
+            'size': file_stat.st_size,
+            'mtime': file_stat.st_mtime_ns,
+            'hash': content_hash,
+        }
+        self.is_dirty = True
+        return content_hash
+
+    def __read_entry(self, content_hash):
+        if content_hash not in self.__get_index()['entries']:
+            return None
+
+        try:
+            if content_hash in self.pending_entries:
+                return marshal.loads(zlib.decompress(self.pending_entries[content_hash]))
+            with open(self.__get_entry_file_path(content_hash), 'rb') as entry_file:
+                return marshal.loads(zlib.decompress(entry_file.read()))
+        except (OSError, EOFError, ValueError, TypeError, zlib.error):
+            self.__remove_entry(content_hash)
+            return None
+
+    def __evict_least_recently_used(self):
+        entries = self.__get_index()['entries']
+        cache_size = self.get_size()
+        for content_hash, entry in sorted(entries.items(), key=lambda item: item[1]['last_used']):
+            if cache_size <= self.max_size_bytes:
+                break
+            cache_size -= entry['size']
+            self.__remove_entry(content_hash)
+
+    def __remove_entry(self, content_hash):
+        index = self.__get_index()
+        index['entries'].pop(content_hash, None)
+        index['paths'] = {path: path_entry for path, path_entry in index['paths'].items() if path_entry['hash'] != content_hash}
+        self.pending_entries.pop(content_hash, None)
+        self.is_dirty = True
+
+        try:
+            os.remove(self.__get_entry_file_path(content_hash))
+        except OSError:
+            pass
+
+    def __get_entry_file_path(self, content_hash):
+        return os.path.join(self.cache_directory, f'{content_hash}{MATERIAL_DATA_CACHE_ENTRY_EXTENSION}')
+
+    def __get_index(self):
+        if self.index is None:
+            self.index = self.__read_index()
+        return self.index
+
+    def __read_index(self):
+        try:
+            with open(self.index_file_path, 'r') as index_file:
+                index = json.load(index_file)
+        except (OSError, ValueError):
+            return self.__create_index()
+
+        # marshal's format is only guaranteed to be stable within the same marshal version
+        if index.get('version') != MATERIAL_DATA_CACHE_VERSION or index.get('marshal_version') != marshal.version:
+            self.clear()
+            return self.index
+        return index
+
+    @staticmethod
+    def __create_index():
+        return {
+            'version': MATERIAL_DATA_CACHE_VERSION,
+            'marshal_version': marshal.version,
+            'paths': {},
+            'entries': {},
+        }
+
+    @staticmethod
+    def hash_file(file_path, chunk_size=1024 * 1024):
+        content_hash = hashlib.sha1()
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(chunk_size), b''):
+                content_hash.update(chunk)
+        return content_hash.hexdigest()
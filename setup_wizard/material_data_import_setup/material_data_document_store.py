@@ -0,0 +1,120 @@
+# Author: michael-gh1
+
+import json
+import os
+from collections import defaultdict
+
+from setup_wizard.parsers.material_data_json_parsers import CachedMaterialDataJsonParser, MaterialDataJsonParser
+from setup_wizard.utils.genshin_body_part_deducer import get_body_part
+
+
+class MaterialDataDocumentStore:
+    '''
+    Per-run store of the material data JSON documents in a material data directory.
+    Each file is opened and parsed at most once, no matter how many times it is requested
+    by the importer, the ShadowRampTypeSetter or the MaterialDataAppliers.
+
+    If a MaterialDataCache is given, parsed material data is read from and written to it,
+    so files parsed in a previous run are not opened as JSON again.
+    '''
+    SHADOW_RAMP_PATH_ID_KEY = 'shadow_ramp_path_id'
+
+    def __init__(self, directory_file_path, files, material_data_json_parser_resolver=None, material_data_cache=None):
+        self.directory_file_path = directory_file_path
+        self.files = files or []
+        self.material_data_json_parser_resolver = material_data_json_parser_resolver
+        self.material_data_cache = material_data_cache
+        self.documents = {}
+        self.parsers = {}
+        self.cached_material_data = {}
+        self.shadow_ramp_path_ids = {}
+        self.files_by_shadow_ramp_path_id = None
+
+    def get(self, file):
+        document = self.documents.get(file.name)
+        if document is None:
+            document = self.open_and_load_json_data(self.directory_file_path, file)
+            self.documents[file.name] = document
+        return document
+
+    def get_parser(self, file) -> MaterialDataJsonParser:
+        parser = self.parsers.get(file.name)
+        if parser:
+            return parser
+
+        cached_material_data = self.__get_cached_material_data(file)
+        if cached_material_data is not None:
+            parser = CachedMaterialDataJsonParser(cached_material_data)
+            parser.parse()
+        else:
+            document = self.get(file)
+            parser = self.material_data_json_parser_resolver(document)
+            if self.material_data_cache:
+                self.material_data_cache.put(self.__get_file_path(file), {
+                    **parser.material_data,
+                    self.SHADOW_RAMP_PATH_ID_KEY: self.get_shadow_ramp_path_id(document),
+                })
+        self.parsers[file.name] = parser
+        return parser
+
+    def flush(self):
+        if self.material_data_cache:
+            self.material_data_cache.flush()
+
+    def get_files_using_shadow_ramp(self, shadow_ramp_path_id):
+        if self.files_by_shadow_ramp_path_id is None:
+            self.__index_files_by_shadow_ramp_path_id()
+        return self.files_by_shadow_ramp_path_id.get(shadow_ramp_path_id, [])
+
+    def get_shadow_ramp_type(self, target_file):
+        '''
+        Returns the body part of the first other material data file that shares the target file's _PackedShadowRampTex
+        '''
+        target_file_shadow_ramp_path_id = self.__get_file_shadow_ramp_path_id(target_file)
+        if not target_file_shadow_ramp_path_id:
+            return None
+
+        for material_data_file in self.get_files_using_shadow_ramp(target_file_shadow_ramp_path_id):
+            if material_data_file.name.lower() != target_file.name.lower():
+                return get_body_part(material_data_file)
+        return None
+
+    def __index_files_by_shadow_ramp_path_id(self):
+        self.files_by_shadow_ramp_path_id = defaultdict(list)
+        for file in self.files:
+            shadow_ramp_path_id = self.__get_file_shadow_ramp_path_id(file)
+            if shadow_ramp_path_id:
+                self.files_by_shadow_ramp_path_id[shadow_ramp_path_id].append(file)
+
+    def __get_file_shadow_ramp_path_id(self, file):
+        if file.name not in self.shadow_ramp_path_ids:
+            cached_material_data = self.__get_cached_material_data(file)
+            self.shadow_ramp_path_ids[file.name] = cached_material_data.get(self.SHADOW_RAMP_PATH_ID_KEY) \
+                if cached_material_data is not None else self.get_shadow_ramp_path_id(self.get(file))
+        return self.shadow_ramp_path_ids[file.name]
+
+    def __get_cached_material_data(self, file):
+        if not self.material_data_cache:
+            return None
+        if file.name not in self.cached_material_data:
+            self.cached_material_data[file.name] = self.material_data_cache.get(self.__get_file_path(file))
+        return self.cached_material_data[file.name]
+
+    def __get_file_path(self, file):
+        return os.path.abspath(os.path.join(self.directory_file_path, file.name))
+
+    @staticmethod
+    def get_shadow_ramp_path_id(material_data_json):
+        try:
+            return material_data_json.get('m_SavedProperties').get('m_TexEnvs').get('_PackedShadowRampTex').get('m_Texture').get('m_PathID')
+        except AttributeError:
+            return None
+
+    @staticmethod
+    def open_and_load_json_data(directory_file_path, file):
+        with open(f'{directory_file_path}/{file.name}') as fp:
+            try:
+                json_material_data = json.load(fp)
+                return json_material_data
+            except UnicodeDecodeError:
+                raise Exception(f'Failed to load JSON. Did you select a different type of file? \nFile Selected: "{file.name}"')
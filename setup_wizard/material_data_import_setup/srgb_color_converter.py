@@ -0,0 +1,73 @@
+# Author: michael-gh1
+
+try:
+    import numpy  # Bundled with Blender
+except ImportError:
+    numpy = None
+
+
+def srgb_byte_to_linear(srgb_byte):
+    val = srgb_byte / 255.0
+    if val <= 0.04045:
+        return val / 12.92
+    else:
+        return ((val + 0.055) / 1.055) ** 2.4
+
+
+# The sRGB -> Hex -> RGB conversion quantizes each channel to a byte, so there are only 256 possible linear values
+SRGB_BYTE_TO_LINEAR = tuple(srgb_byte_to_linear(srgb_byte) for srgb_byte in range(256))
+
+
+class SrgbColorConverter:
+    '''
+    Batched version of MaterialDataApplier.convert_color_srgb_to_hex_to_rgb (used for the Nya222 HSR Shader).
+    All colors of a material are converted in one pass and every unique color is only converted once.
+
+    Results are identical to the hex round trip: each channel is clamped to [0, 1], truncated to a byte
+    and looked up in a table of linear values built from the same formula. Alpha is passed through unchanged.
+    '''
+    def __init__(self):
+        self.converted_colors = {}
+        self.srgb_byte_to_linear = numpy.array(SRGB_BYTE_TO_LINEAR, dtype=numpy.float64) if numpy else None
+
+    def convert(self, color):
+        return self.convert_many([color])[0]
+
+    def convert_many(self, values):
+        '''
+        Converts every color (tuple) in values, any other value is returned as is
+        '''
+        unconverted_colors = list({
+            value for value in values if type(value) is tuple and value not in self.converted_colors
+        })
+        if unconverted_colors:
+            if self.srgb_byte_to_linear is not None:
+                self.__convert_with_numpy(unconverted_colors)
+            else:
+                self.__convert(unconverted_colors)
+
+        # .get() misses for colors with NaN channels, NaN is never equal to itself
+        return [
+            (self.converted_colors.get(value) or self.__convert_color(value)) if type(value) is tuple else value for value in values
+        ]
+
+    def __convert_with_numpy(self, colors):
+        rgb = numpy.array([color[:3] for color in colors], dtype=numpy.float64)
+        rgb = numpy.nan_to_num(rgb, nan=0.0)  # min(max(0, nan), 1) is 0
+        srgb_bytes = (numpy.clip(rgb, 0, 1) * 255).astype(numpy.intp)
+        linear_rgb = self.srgb_byte_to_linear[srgb_bytes].tolist()
+
+        for color, (r, g, b) in zip(colors, linear_rgb):
+            self.converted_colors[color] = (r, g, b, color[3])
+
+    def __convert(self, colors):
+        for color in colors:
+            self.converted_colors[color] = self.__convert_color(color)
+
+    @staticmethod
+    def __convert_color(color):
+        r, g, b = (SRGB_BYTE_TO_LINEAR[int(min(max(0, channel), 1) * 255)] for channel in color[:3])
+        return (r, g, b, color[3])
+
+
+srgb_color_converter = SrgbColorConverter()
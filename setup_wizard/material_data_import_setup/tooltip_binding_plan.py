@@ -0,0 +1,157 @@
+# Author: michael-gh1
+
+from collections import defaultdict
+from enum import Enum, auto
+
+import bpy
+
+
+class mTexEnvsKeys:
+    def __init__(self, key, m_TexEnvs_key):
+        self.key = key
+        self.m_TexEnvs_key = m_TexEnvs_key
+
+
+class ValueCoercion(Enum):
+    NONE = auto()
+    BOOL = auto()  # Material data floats are toggles on the shader
+    INT = auto()  # Shader values are one-based while material data is zero-based indexing
+    VECTOR3 = auto()  # `NS Anim` and `NS Scale` only have 3 values, but material data has 4 (rgba)
+
+
+class TooltipBinding:
+    __slots__ = ('socket_name', 'socket_identifier', 'material_data_key', 'm_TexEnvs_key', 'value_coercion')
+
+    def __init__(self, socket_name, material_data_key, m_TexEnvs_key, value_coercion: ValueCoercion, socket_identifier=None):
+        self.socket_name = socket_name
+        self.socket_identifier = socket_identifier  # Modifier inputs are written by identifier (ex. Socket_2)
+        self.material_data_key = material_data_key  # Tooltip, or the TexEnv's name (ex. _MainTex) if it's a TexEnv tooltip
+        self.m_TexEnvs_key = m_TexEnvs_key  # Key inside of the TexEnv (ex. m_Scale), None if not a TexEnv tooltip
+        self.value_coercion = value_coercion
+
+    def coerce(self, material_json_value):
+        if self.value_coercion is ValueCoercion.BOOL and type(material_json_value) is float:
+            return bool(material_json_value)
+        elif self.value_coercion is ValueCoercion.INT and type(material_json_value) is float:
+            return int(material_json_value) + 1
+        elif self.value_coercion is ValueCoercion.VECTOR3 and len(material_json_value) == 4:
+            return material_json_value[:3]
+        return material_json_value
+
+
+class TooltipBindingPlan:
+    '''
+    The tooltip (description) -> socket bindings of a node group's interface.
+    Compiled once per node tree and cached by node tree name and interface hash, so that every material,
+    outline material, VFX node, global properties node and outlines modifier using the same node group shares one plan.
+    '''
+    MODIFIER_INPUTS = 'MODIFIER_INPUTS'
+    plans = {}
+
+    def __init__(self, bindings, color_alpha_socket_name):
+        self.bindings = bindings
+        self.color_alpha_socket_name = color_alpha_socket_name
+
+    @classmethod
+    def get(cls, interface_node, inputs_node):
+        node_tree = interface_node.node_tree
+        interface_items = node_tree.interface.items_tree.values()
+        plan_key = (
+            node_tree.name,
+            cls.get_interface_hash(interface_items),
+            None if inputs_node is interface_node else inputs_node.name,
+        )
+
+        plan = cls.plans.get(plan_key)
+        if not plan:
+            plan = cls.compile(interface_items, inputs_node)
+            cls.plans[plan_key] = plan
+        return plan
+
+    @classmethod
+    def get_for_modifier(cls, node_group):
+        '''
+        Returns the plan of a geometry nodes modifier's node group, its inputs are the node group's interface sockets
+        '''
+        interface_items = [item for item in node_group.interface.items_tree.values() if item.item_type == 'SOCKET']
+        plan_key = (node_group.name, cls.get_interface_hash(interface_items), cls.MODIFIER_INPUTS)
+
+        plan = cls.plans.get(plan_key)
+        if not plan:
+            plan = cls.compile(interface_items)
+            cls.plans[plan_key] = plan
+        return plan
+
+    @classmethod
+    def clear(cls):
+        cls.plans.clear()
+
+    @classmethod
+    def compile(cls, interface_items, inputs_node=None):
+        '''
+        Without an inputs_node, the value coercion is based on the interface sockets
+        '''
+        description_to_names = defaultdict(list)
+        for interface_item in interface_items:
+            description_to_names[interface_item.description].append(interface_item.name)
+        color_alpha_socket_names = description_to_names.get('_ColorAlpha')
+
+        bindings = []
+        for interface_item in interface_items:
+            material_data_key = interface_item.description.strip()  # Tooltip
+            m_TexEnvs_key = None
+
+            if cls.is_tooltip_TexEnv(material_data_key):
+                m_TexEnvs_keys: mTexEnvsKeys = cls.get_TexEnv_Keys(material_data_key)
+                material_data_key = m_TexEnvs_keys.m_TexEnvs_key
+                m_TexEnvs_key = m_TexEnvs_keys.key
+
+            bindings.append(TooltipBinding(
+                interface_item.name,
+                material_data_key,
+                m_TexEnvs_key,
+                cls.get_value_coercion(inputs_node.inputs.get(interface_item.name) if inputs_node else interface_item),
+                getattr(interface_item, 'identifier', None),
+            ))
+        return cls(bindings, color_alpha_socket_names[0] if color_alpha_socket_names else None)
+
+    @staticmethod
+    def get_interface_hash(interface_items):
+        return hash(tuple(
+            (interface_item.item_type, interface_item.name, interface_item.description, getattr(interface_item, 'socket_type', None))
+            for interface_item in interface_items
+        ))
+
+    @staticmethod
+    def get_value_coercion(input_object):
+        input_type = type(input_object)
+        if input_type is bpy.types.NodeSocketBool or input_type is bpy.types.NodeTreeInterfaceSocketBool:
+            return ValueCoercion.BOOL
+        elif input_type is bpy.types.NodeSocketInt or input_type is bpy.types.NodeTreeInterfaceSocketInt:
+            return ValueCoercion.INT
+        elif (input_type is bpy.types.NodeSocketVector or input_type is bpy.types.NodeTreeInterfaceSocketVector) and \
+            len(input_object.default_value) == 3:
+            return ValueCoercion.VECTOR3
+        return ValueCoercion.NONE
+
+    @staticmethod
+    def is_tooltip_TexEnv(tooltip):
+        tooltip_keys = tooltip.split(' ')
+        if len(tooltip_keys) == 1:
+            return False
+
+        m_TexEnvs_key = tooltip_keys[1]
+        if m_TexEnvs_key.startswith('(') and m_TexEnvs_key.endswith(')'):
+            return True
+        return False
+
+    @staticmethod
+    def get_TexEnv_Keys(tooltip):
+        tooltip_keys = tooltip.split(' ')
+        if len(tooltip_keys) == 1:
+            return False
+
+        key = tooltip_keys[0]
+        m_TexEnvs_key = tooltip_keys[1].replace('(', '').replace(')', '')
+
+        return mTexEnvsKeys(key, m_TexEnvs_key)
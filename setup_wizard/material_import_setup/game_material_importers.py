@@ -14,6 +14,7 @@ from setup_wizard.domain.shader_material_names import StellarToonShaderMaterialN
 from setup_wizard.import_order import GENSHIN_IMPACT_OUTLINES_FILE_PATH, NextStepInvoker, cache_using_cache_key, get_cache, \
     GENSHIN_IMPACT_ROOT_FOLDER_FILE_PATH, GENSHIN_IMPACT_SHADER_FILE_PATH, HONKAI_STAR_RAIL_ROOT_FOLDER_FILE_PATH, \
     HONKAI_STAR_RAIL_SHADER_FILE_PATH, PUNISHING_GRAY_RAVEN_ROOT_FOLDER_FILE_PATH, PUNISHING_GRAY_RAVEN_SHADER_FILE_PATH
+from setup_wizard.instrumentation.span_tracer import span_tracer, trace_span
 from setup_wizard.material_import_setup.empty_names import LightDirectionEmptyNames
 from setup_wizard.outline_import_setup.outline_node_groups import OutlineNodeGroupNames
 from setup_wizard.texture_import_setup.material_default_value_setters import MaterialDefaultValueSetter, MaterialDefaultValueSetterFactory
@@ -52,6 +53,7 @@ class GameMaterialImporter:
         self.game_default_blend_file_with_materials = game_default_blend_file_with_materials
         self.names_of_game_materials = names_of_game_materials
 
+    @trace_span()
     def import_materials(self):
         cache_enabled = self.context.window_manager.cache_enabled
         user_selected_shader_blend_file_path = self.blender_operator.filepath if \
@@ -110,11 +112,12 @@ class GameMaterialImporter:
         try:
             # Use the exact file the user selected, otherwise fallback to the non-Goo blender file in the directory
             shader_blend_file_path = blend_file_with_genshin_materials or default_blend_file_path
-            bpy.ops.wm.append(
-                directory=shader_blend_file_path,
-                files=self.names_of_game_materials,
-                set_fake=True
-            )
+            with span_tracer.span('Append Shader Materials', 'append'):
+                bpy.ops.wm.append(
+                    directory=shader_blend_file_path,
+                    files=self.names_of_game_materials,
+                    set_fake=True
+                )
             shader_blend_node_tree_file_path = blend_file_with_genshin_node_tree or default_blend_file_path_node_tree
             light_direction_empties_file_path = blend_file_with_light_direction_empties or default_blend_file_with_light_direction_empties
             self.import_light_vectors_geometry_node(shader_blend_node_tree_file_path, light_direction_empties_file_path)
@@ -141,19 +144,21 @@ class GameMaterialImporter:
     def import_light_vectors_geometry_node(self, node_tree_filepath, object_file_path):
         for outline_node_group_name in OutlineNodeGroupNames.V3_LIGHT_VECTORS_GEOMETRY_NODES:
             if not bpy.data.node_groups.get(outline_node_group_name):
-                bpy.ops.wm.append(
-                    filepath=os.path.join(node_tree_filepath, outline_node_group_name),
-                    directory=os.path.join(node_tree_filepath),
-                    filename=outline_node_group_name
-                )
+                with span_tracer.span('Append Light Vectors Geometry Node', 'append'):
+                    bpy.ops.wm.append(
+                        filepath=os.path.join(node_tree_filepath, outline_node_group_name),
+                        directory=os.path.join(node_tree_filepath),
+                        filename=outline_node_group_name
+                    )
 
         light_direction_empties_to_append = \
             [empty_object for empty_object in LightDirectionEmptyNames.LIGHT_DIRECTION_EMPTIES_FILE_IMPORT 
              if not bpy.data.objects.get(empty_object.get('name'))]
-        bpy.ops.wm.append(
-            directory=os.path.join(object_file_path),
-            files=light_direction_empties_to_append
-        )
+        with span_tracer.span('Append Light Direction Empties', 'append'):
+            bpy.ops.wm.append(
+                directory=os.path.join(object_file_path),
+                files=light_direction_empties_to_append
+            )
 
     def __get_outlines_node_group_from_shader_blend_file(self, shader_blend_file_path):
         with bpy.data.libraries.load(shader_blend_file_path) as (data_from, data_to):
@@ -193,6 +198,7 @@ class GenshinImpactMaterialImporterFacade(GameMaterialImporter):
             self.NAMES_OF_GENSHIN_MATERIALS
         )
 
+    @trace_span()
     def import_materials(self):
         starting_scene_names = bpy.data.scenes.keys()
         active_scene_name = bpy.context.scene.name if bpy.context.scene else starting_scene_names[0]
@@ -311,6 +317,7 @@ class HonkaiStarRailMaterialImporterFacade(GameMaterialImporter):
             self.NAMES_OF_HONKAI_STAR_RAIL_MATERIALS
         )
 
+    @trace_span()
     def import_materials(self):
         status = super().import_materials()  # Honkai Star Rail Material Importer
 
@@ -363,6 +370,7 @@ class PunishingGrayRavenMaterialImporterFacade(GameMaterialImporter):
             self.NAMES_OF_PUNISHING_GRAY_RAVEN_MATERIALS
         )
 
+    @trace_span()
     def import_materials(self):
         status = super().import_materials()  # Punishing Gray Raven Material Importer
 
@@ -6,6 +6,7 @@ import os
 from bpy_extras.io_utils import ImportHelper
 from bpy.types import Operator
 
+from setup_wizard.instrumentation.span_tracer import span_tracer
 from setup_wizard.setup_wizard_operator_base_classes import CustomOperatorProperties
 from setup_wizard.domain.game_types import GameType
 from setup_wizard.domain.shader_material_names import JaredNytsPunishingGrayRavenShaderMaterialNames
@@ -81,11 +82,12 @@ class PGR_OT_SetUpChibiFace(Operator, ImportHelper, CustomOperatorProperties):
             ) if user_selected_shader_blend_file_path else None
 
             try:
-                bpy.ops.wm.append(
-                    directory=blend_file_with_meshes_filepath,
-                    files=self.names_of_meshes,
-                    set_fake=True
-                )
+                with span_tracer.span('Append Chibi Face Meshes', 'append'):
+                    bpy.ops.wm.append(
+                        directory=blend_file_with_meshes_filepath,
+                        files=self.names_of_meshes,
+                        set_fake=True
+                    )
             except RuntimeError as ex:
                 self.report({'ERROR'}, \
                     f"ERROR: Error when trying to append materials and Light Vector geometry node. \n\
@@ -0,0 +1,29 @@
+# Author: michael-gh1
+
+import bpy
+
+from bpy.types import Operator
+
+from setup_wizard.texture_import_setup.proxy_texture_cache import ProxyTextureCache
+
+
+class HYV_OT_Swap_Proxy_Textures(Operator):
+    """Swaps every imported texture between its proxy and full resolution texture (ex. before rendering)"""
+    bl_idname = "hoyoverse.swap_proxy_textures"
+    bl_label = "Swap Proxy/Full Resolution Textures"
+
+    def execute(self, context):
+        proxy_texture_cache = ProxyTextureCache()
+        swappable_images = proxy_texture_cache.get_swappable_images(bpy.data.images)
+        proxy_images = [image for image in swappable_images if proxy_texture_cache.is_proxy(image)]
+
+        if proxy_images:
+            for image in proxy_images:
+                proxy_texture_cache.use_full_resolution(image)
+            self.report({'INFO'}, f'Swapped {len(proxy_images)} textures to full resolution')
+        else:
+            proxy_texture_scale = int(context.window_manager.proxy_texture_scale)
+            for image in swappable_images:
+                proxy_texture_cache.use_proxy(image, proxy_texture_scale)
+            self.report({'INFO'}, f'Swapped {len(swappable_images)} textures to proxies')
+        return {'FINISHED'}
@@ -0,0 +1,57 @@
+# Author: michael-gh1
+
+import bpy
+
+from bpy.props import IntProperty, StringProperty
+from bpy.types import Operator
+from bpy_extras.io_utils import ExportHelper
+
+from setup_wizard.texture_import_setup.texture_memory_report import DEFAULT_OVERSIZED_TEXTURE_SIZE, TextureMemoryReporter, \
+    get_character_materials
+
+
+class HYV_OT_Texture_Memory_Report(Operator, ExportHelper):
+    """Exports the estimated texture memory of the selected characters (or all materials) as a JSON report"""
+    bl_idname = "hoyoverse.texture_memory_report"
+    bl_label = "Export Texture Memory Report"
+
+    filename_ext = '.json'
+    filter_glob: StringProperty(
+        default='*.json',
+        options={'HIDDEN'},
+    )
+
+    oversized_texture_size: IntProperty(
+        name='Oversized Texture Size',
+        description='Textures with a width or height larger than this are flagged as oversized',
+        default=DEFAULT_OVERSIZED_TEXTURE_SIZE,
+        min=1,
+    )
+
+    def execute(self, context):
+        armatures = [obj for obj in context.selected_objects if obj.type == 'ARMATURE']
+        texture_memory_reporter = TextureMemoryReporter(self.oversized_texture_size)
+
+        if armatures:
+            materials_by_character = {armature.name: get_character_materials(armature) for armature in armatures}
+        else:
+            materials_by_character = {'All Materials': bpy.data.materials}
+        report = {
+            'characters': {
+                character_name: texture_memory_reporter.create_report(materials)
+                for character_name, materials in materials_by_character.items()
+            }
+        }
+        character_reports = report['characters'].values()
+
+        TextureMemoryReporter.write_json(report, self.filepath)
+
+        total_gpu_megabytes = sum(character_report['total_estimated_gpu_bytes'] for character_report in character_reports) / (1024 * 1024)
+        duplicate_images = sum(len(character_report['duplicate_images']) for character_report in character_reports)
+        oversized_images = sum(len(character_report['oversized_images']) for character_report in character_reports)
+        self.report(
+            {'INFO'},
+            f'Estimated texture memory: {total_gpu_megabytes:.1f} MB GPU, '
+            f'{duplicate_images} duplicate and {oversized_images} oversized textures. Report: {self.filepath}'
+        )
+        return {'FINISHED'}
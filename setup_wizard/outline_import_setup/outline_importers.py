@@ -7,6 +7,7 @@ from abc import ABC, abstractmethod
 from bpy.types import Operator, Context
 
 from setup_wizard.domain.shader_identifier_service import GenshinImpactShaders, HonkaiStarRailShaders, ShaderIdentifierService, ShaderIdentifierServiceFactory
+from setup_wizard.instrumentation.span_tracer import span_tracer, trace_span
 from setup_wizard.outline_import_setup.outline_node_groups import OutlineNodeGroupNames
 from setup_wizard.import_order import GENSHIN_IMPACT_OUTLINES_FILE_PATH, PUNISHING_GRAY_RAVEN_OUTLINES_FILE_PATH, HONKAI_STAR_RAIL_OUTLINES_FILE_PATH, \
     NextStepInvoker, cache_using_cache_key, get_cache
@@ -51,6 +52,7 @@ class GenshinImpactOutlineNodeGroupImporter(GameOutlineNodeGroupImporter):
         self.outlines_file_path = GENSHIN_IMPACT_OUTLINES_FILE_PATH  # Keep same filepath for all Genshin Impact
         self.outlines_node_group_names = outlines_node_group_name
 
+    @trace_span()
     def import_outline_node_group(self):
         cache_enabled = self.context.window_manager.cache_enabled
         filepath = get_cache(cache_enabled).get(self.outlines_file_path) or self.blender_operator.filepath
@@ -69,11 +71,12 @@ class GenshinImpactOutlineNodeGroupImporter(GameOutlineNodeGroupImporter):
         for outline_node_group_name in self.outlines_node_group_names:
             if not bpy.data.node_groups.get(outline_node_group_name):
                 inner_path = 'NodeTree'
-                bpy.ops.wm.append(
-                    filepath=os.path.join(filepath, inner_path, outline_node_group_name),
-                    directory=os.path.join(filepath, inner_path),
-                    filename=outline_node_group_name
-                )
+                with span_tracer.span('Append Outlines Node Group', 'append'):
+                    bpy.ops.wm.append(
+                        filepath=os.path.join(filepath, inner_path, outline_node_group_name),
+                        directory=os.path.join(filepath, inner_path),
+                        filename=outline_node_group_name
+                    )
                 if cache_enabled and filepath:
                     cache_using_cache_key(get_cache(cache_enabled), self.outlines_file_path, filepath)
 
@@ -91,6 +94,7 @@ class HonkaiStarRailOutlineNodeGroupImporter(GameOutlineNodeGroupImporter):
         self.outlines_file_path = HONKAI_STAR_RAIL_OUTLINES_FILE_PATH  # Keep same filepath for all HSR
         self.outlines_node_group_names = outlines_node_group_names
 
+    @trace_span()
     def import_outline_node_group(self):
         cache_enabled = self.context.window_manager.cache_enabled
         filepath = get_cache(cache_enabled).get(self.outlines_file_path) or self.blender_operator.filepath
@@ -110,11 +114,12 @@ class HonkaiStarRailOutlineNodeGroupImporter(GameOutlineNodeGroupImporter):
             if not bpy.data.node_groups.get(outline_node_group_name):
                 inner_path = 'NodeTree'
 
-                bpy.ops.wm.append(
-                    filepath=os.path.join(filepath, inner_path, outline_node_group_name),
-                    directory=os.path.join(filepath, inner_path),
-                    filename=outline_node_group_name
-                )
+                with span_tracer.span('Append Outlines Node Group', 'append'):
+                    bpy.ops.wm.append(
+                        filepath=os.path.join(filepath, inner_path, outline_node_group_name),
+                        directory=os.path.join(filepath, inner_path),
+                        filename=outline_node_group_name
+                    )
                 if cache_enabled and filepath:
                     cache_using_cache_key(get_cache(cache_enabled), self.outlines_file_path, filepath)
 
@@ -134,6 +139,7 @@ class PunishingGrayRavenOutlineNodeGroupImporter(GameOutlineNodeGroupImporter):
         self.outlines_node_group_names = \
             OutlineNodeGroupNames.V2_JAREDNYTS_PGR_OUTLINES + OutlineNodeGroupNames.V3_JAREDNYTS_PGR_OUTLINES
 
+    @trace_span()
     def import_outline_node_group(self):
         cache_enabled = self.context.window_manager.cache_enabled
         filepath = get_cache(cache_enabled).get(self.outlines_file_path) or self.blender_operator.filepath
@@ -153,11 +159,12 @@ class PunishingGrayRavenOutlineNodeGroupImporter(GameOutlineNodeGroupImporter):
             if not bpy.data.node_groups.get(outline_node_group_name):
                 inner_path = 'NodeTree'
 
-                bpy.ops.wm.append(
-                    filepath=os.path.join(filepath, inner_path, outline_node_group_name),
-                    directory=os.path.join(filepath, inner_path),
-                    filename=outline_node_group_name
-                )
+                with span_tracer.span('Append Outlines Node Group', 'append'):
+                    bpy.ops.wm.append(
+                        filepath=os.path.join(filepath, inner_path, outline_node_group_name),
+                        directory=os.path.join(filepath, inner_path),
+                        filename=outline_node_group_name
+                    )
                 if cache_enabled and filepath:
                     cache_using_cache_key(get_cache(cache_enabled), self.outlines_file_path, filepath)
 
@@ -4,13 +4,51 @@
     Data class that is used to store values from m_Floats and m_Colors from Material Data Jsons
 '''
 class MaterialData:
+    __slots__ = ('values',)
+
     default_values = {
         '_MTSharpLayerOffset': 1.0
     }
 
     def __init__(self, json_m_data):
-        for default_key, default_value in self.default_values.items():
-            setattr(self, default_key, default_value)
+        values = dict(self.default_values)
+        values.update(json_m_data.items())
+        self.values = values
+
+    # Keeps attribute-style access (ex. m_texEnvs._BumpMap) working on top of the dict storage
+    def __getattr__(self, key):
+        if key == 'values':
+            raise AttributeError(key)
+        try:
+            return self.values[key]
+        except KeyError:
+            raise AttributeError(key)
+
+
+'''
+    Flat lookup table of every property in m_Floats, m_Colors and m_TexEnvs
+    If a key exists in more than one, m_Floats takes precedence over m_Colors, which takes precedence over m_TexEnvs
+'''
+class MaterialDataPropertyIndex:
+    __slots__ = ('properties',)
+
+    def __init__(self, m_floats: MaterialData, m_colors: MaterialData, m_texEnvs: MaterialData = None):
+        properties = {}
+        for material_data in (m_texEnvs, m_colors, m_floats):  # Lowest precedence first
+            if material_data is not None:
+                # Explicit None check, a None value falls back to the next lower precedence value
+                properties.update((key, value) for key, value in material_data.values.items() if value is not None)
+        self.properties = properties
+
+    def get(self, key, default=None):
+        return self.properties.get(key, default)
+
+    def get_many(self, keys):
+        properties = self.properties
+        return [properties.get(key) for key in keys]
+
+    def __contains__(self, key):
+        return key in self.properties
 
-        for key, value in json_m_data.items():
-            setattr(self, key, value)
+    def __len__(self):
+        return len(self.properties)
@@ -0,0 +1,47 @@
+# Author: michael-gh1
+
+from setup_wizard.exceptions import UnsupportedMaterialDataJsonFormatException
+from setup_wizard.parsers.material_data_json_parsers import MaterialDataJsonParser, HoyoStudioMaterialDataJsonParser, \
+    UABEMaterialDataJsonParser, UnknownHoyoStudioMaterialDataJsonParser
+
+
+class MaterialDataJsonParserDispatcher:
+    '''
+    Identifies the format of a material data JSON from its top-level keys and runs exactly one parser on it.
+    Detecting the format is a few key lookups, so it's done for every file instead of trying parsers until one works.
+    '''
+    PARSE_ERRORS = (AttributeError, KeyError, TypeError)
+
+    def __init__(self, parsers):
+        self.parsers = parsers
+
+    def parse(self, json_material_data) -> MaterialDataJsonParser:
+        parser_class = self.detect_parser_class(json_material_data)
+        if parser_class not in self.parsers:
+            raise UnsupportedMaterialDataJsonFormatException(self.parsers)
+
+        try:
+            return self.__parse_with(parser_class, json_material_data)
+        except self.PARSE_ERRORS:
+            raise UnsupportedMaterialDataJsonFormatException(self.parsers)
+
+    def __parse_with(self, parser_class, json_material_data):
+        parser: MaterialDataJsonParser = parser_class(json_material_data)
+        parser.parse()
+        return parser
+
+    @staticmethod
+    def detect_parser_class(json_material_data):
+        if type(json_material_data) is not dict:
+            return None
+
+        m_saved_properties = json_material_data.get('m_SavedProperties')
+        if type(m_saved_properties) is dict:
+            m_colors = m_saved_properties.get('m_Colors')
+            if type(m_colors) is dict:
+                return HoyoStudioMaterialDataJsonParser
+            elif type(m_colors) is list:  # list of {'Key': ..., 'Value': ...}
+                return UnknownHoyoStudioMaterialDataJsonParser
+        elif type(json_material_data.get('0 Material Base')) is dict:
+            return UABEMaterialDataJsonParser
+        return None
@@ -2,10 +2,12 @@
 
 from abc import ABC, abstractmethod
 
-from setup_wizard.parsers.data_classes import MaterialData
+from setup_wizard.parsers.data_classes import MaterialData, MaterialDataPropertyIndex
 
 
 class MaterialDataJsonParser(ABC):
+    has_m_texEnvs = True
+
     def __init__(self, json_material_data):
         self.json_material_data = json_material_data
 
@@ -13,6 +15,21 @@ class MaterialDataJsonParser(ABC):
     def parse(self, json_material_data):
         raise NotImplementedError()
 
+    def set_material_data(self, json_m_floats, json_m_colors, json_m_texEnvs=None):
+        '''
+        Stores the normalized m_Floats/m_Colors/m_TexEnvs dicts, which are what gets written to the MaterialDataCache
+        '''
+        self.material_data = {
+            'm_Floats': json_m_floats,
+            'm_Colors': json_m_colors,
+            'm_TexEnvs': json_m_texEnvs,
+        }
+        self.m_floats = MaterialData(json_m_floats)
+        self.m_colors = MaterialData(json_m_colors)
+        if self.has_m_texEnvs:
+            self.m_texEnvs = MaterialData(json_m_texEnvs)
+        self.properties = MaterialDataPropertyIndex(self.m_floats, self.m_colors, getattr(self, 'm_texEnvs', None))
+
 
 class HoyoStudioMaterialDataJsonParser(MaterialDataJsonParser):
     def __init__(self, json_material_data):
@@ -24,9 +41,11 @@ class HoyoStudioMaterialDataJsonParser(MaterialDataJsonParser):
         for key, value in m_colors.items():
             m_colors_dict[key] = self.get_rgba_colors(value)
 
-        self.m_floats = MaterialData(self.json_material_data.get('m_SavedProperties').get('m_Floats'))
-        self.m_colors = MaterialData(m_colors_dict)
-        self.m_texEnvs = MaterialData(self.json_material_data.get('m_SavedProperties').get('m_TexEnvs'))
+        self.set_material_data(
+            self.json_material_data.get('m_SavedProperties').get('m_Floats'),
+            m_colors_dict,
+            self.json_material_data.get('m_SavedProperties').get('m_TexEnvs'),
+        )
 
     def get_rgba_colors(self, material_json_value):
         # check lowercase for backwards compatibility
@@ -64,12 +83,12 @@ class UnknownHoyoStudioMaterialDataJsonParser(HoyoStudioMaterialDataJsonParser):
             value = m_texEnvs_value_dict['Value']
             m_texEnvs_dict[key] = value
 
-        self.m_floats = MaterialData(m_floats_dict)
-        self.m_colors = MaterialData(m_colors_dict)
-        self.m_texEnvs = MaterialData(m_texEnvs_dict)
+        self.set_material_data(m_floats_dict, m_colors_dict, m_texEnvs_dict)
 
 
 class UABEMaterialDataJsonParser(MaterialDataJsonParser):
+    has_m_texEnvs = False
+
     def __init__(self, json_material_data):
         super().__init__(json_material_data)
 
@@ -79,9 +98,8 @@ class UABEMaterialDataJsonParser(MaterialDataJsonParser):
 
         json_m_floats = self.__get_json_m_floats(m_saved_properties)
         json_m_colors = self.__get_json_m_colors(m_saved_properties)
-        
-        self.m_floats = MaterialData(json_m_floats)
-        self.m_colors = MaterialData(json_m_colors)
+
+        self.set_material_data(json_m_floats, json_m_colors)
 
     def __get_json_m_floats(self, m_saved_properties):
         raw_m_floats = m_saved_properties.get('0 map m_Floats').get('0 Array Array')
@@ -120,3 +138,20 @@ class UABEMaterialDataJsonParser(MaterialDataJsonParser):
         b = material_json_value.get(f'{prefix} b')
         a = material_json_value.get(f'{prefix} a')
         return (r, g, b, a)
+
+
+class CachedMaterialDataJsonParser(MaterialDataJsonParser):
+    '''
+    Rebuilds a parser from the normalized material data stored in the MaterialDataCache
+    '''
+    def __init__(self, material_data):
+        super().__init__(None)
+        self.cached_material_data = material_data
+        self.has_m_texEnvs = material_data.get('m_TexEnvs') is not None
+
+    def parse(self):
+        self.set_material_data(
+            self.cached_material_data.get('m_Floats'),
+            self.cached_material_data.get('m_Colors'),
+            self.cached_material_data.get('m_TexEnvs'),
+        )
@@ -45,9 +45,36 @@ class CharacterSetupWizardAddonPreferences(bpy.types.AddonPreferences):
         max=59
     )
 
+    # Step profiling preferences, the CSW_PROFILE_STEPS environment variable takes priority
+    step_profiling_enabled: bpy.props.BoolProperty(
+        name='(Debug) Profile Setup Wizard Steps',
+        description='Profiles Setup Wizard steps with cProfile and saves a .prof file per step to the Addon Config Directory',
+        default=False
+    )
+
+    step_profiling_component_names: bpy.props.StringProperty(
+        name='Steps',
+        description='Comma-separated steps to profile (ex. import_materials, import_material_data). Leave empty to profile every step',
+        default=''
+    )
+
+    step_profiling_top_functions_count: bpy.props.IntProperty(
+        name='Top Functions',
+        description='Number of functions by cumulative time in the summary written to the log',
+        default=25,
+        min=1
+    )
+
     def draw(self, context):
         layout: bpy.types.UILayout = self.layout
 
+        col = layout.box().column()
+        col.prop(self, 'step_profiling_enabled')
+        sub_col = col.column()
+        sub_col.enabled = self.step_profiling_enabled
+        sub_col.prop(self, 'step_profiling_component_names')
+        sub_col.prop(self, 'step_profiling_top_functions_count')
+
         col = layout.box().column()
         col.label(text=('(Experimental) Add-on Update'), icon='ERROR')
         addon_updater_ops.update_settings_ui(self, context, col)
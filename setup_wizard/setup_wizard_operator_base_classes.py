@@ -1,8 +1,11 @@
 # Author: michael-gh1
 
-from bpy.props import IntProperty, StringProperty
+from bpy.props import BoolProperty, IntProperty, StringProperty
 
-from setup_wizard.import_order import NextStepInvoker
+from setup_wizard.import_order import NextStepInvoker, PipelineRunner
+from setup_wizard.instrumentation.span_tracer import span_tracer
+from setup_wizard.instrumentation.step_instrumentation import PipelineInstrumentation
+from setup_wizard.instrumentation.step_profiler import StepProfiler
 
 class CustomOperatorProperties:
     next_step_idx: IntProperty()
@@ -31,14 +34,27 @@ class CustomOperatorProperties:
 
 class BasicSetupUIOperator:
     game_type: StringProperty()
+    undo_grouping: BoolProperty(
+        name='Group Undo',
+        description='Undo the entire setup in one step (only if no file browser was opened during the setup)',
+        default=False,
+    )
 
     def execute(self, context):
-        next_step_index = 0
+        self.run_pipeline(context, self.bl_idname)
+        return {'FINISHED'}
 
-        NextStepInvoker().invoke(
-            next_step_index,
-            'invoke_next_step_ui', 
-            high_level_step_name=self.bl_idname,
+    def run_pipeline(self, context, high_level_step_name):
+        instrumentation_enabled = context.scene.character_setup_wizard_instrumentation_enabled
+        if context.scene.character_setup_wizard_tracing_enabled:
+            span_tracer.start()
+        PipelineRunner(
+            high_level_step_name,
             game_type=self.game_type,
-        )
-        return {'FINISHED'}
+            undo_grouping=self.undo_grouping,
+            instrumentation=PipelineInstrumentation(
+                high_level_step_name,
+                trace_allocations=context.scene.character_setup_wizard_allocation_tracing_enabled,
+            ) if instrumentation_enabled else None,
+            profiler=StepProfiler.create(high_level_step_name, context),
+        ).run()
@@ -0,0 +1,141 @@
+import timeit
+
+from setup_wizard.texture_import_setup.texture_filename_classifier import genshin_avatar_texture_filename_classifier, \
+    genshin_monster_texture_filename_classifier, genshin_npc_texture_filename_classifier, \
+    honkai_star_rail_avatar_texture_filename_classifier, punishing_gray_raven_avatar_texture_filename_classifier
+
+'''
+Micro-benchmark of the texture filename classifiers against the rule by rule string checks they replaced.
+
+Run from the repository root. PYTEST_VERSION skips the addon registration imports in setup_wizard/__init__.py (no bpy needed):
+PYTEST_VERSION=0 python -m setup_wizard.tests.benchmarks.benchmark_texture_filename_classifier
+'''
+
+GENSHIN_AVATAR_TEXTURE_NAMES = [
+    'Avatar_Lady_Sword_Furina_Tex_Body_Diffuse.png',
+    'Avatar_Lady_Sword_Furina_Tex_Body_Lightmap.png',
+    'Avatar_Lady_Sword_Furina_Tex_Body_Normalmap.png',
+    'Avatar_Lady_Sword_Furina_Tex_Body_Shadow_Ramp.png',
+    'Avatar_Lady_Sword_Furina_Tex_Hair_Diffuse.png',
+    'Avatar_Lady_Sword_Furina_Tex_Hair_Lightmap.png',
+    'Avatar_Lady_Sword_Furina_Tex_Hair_Normalmap.png',
+    'Avatar_Lady_Sword_Furina_Tex_Hair_Shadow_Ramp.png',
+    'Avatar_Lady_Sword_Furina_Tex_Face_Diffuse.png',
+    'Avatar_Lady_Tex_FaceLightmap.png',
+    'Avatar_Tex_Face_Shadow.png',
+    'Avatar_Tex_MetalMap.png',
+    'Avatar_Tex_Specular_Ramp.png',
+    'Avatar_Girl_Catalyst_Nahida_Tex_Glass_Diffuse.png',
+    'Avatar_Boy_Sword_Kaveh_Tex_Body1_Diffuse.png',
+    'Avatar_Boy_Sword_Kaveh_Tex_Body2_Lightmap.png',
+    'Avatar_Boy_Sword_Kaveh_Tex_Body2_Shadow_Ramp.png',
+    'Avatar_Girl_Sword_Skirk_Tex_Effect_Diffuse.png',
+    'Avatar_Girl_Sword_Skirk_Tex_EffectHair_Diffuse.png',
+    'Avatar_Lady_Bow_Yelan_Tex_Dress_Diffuse.png',
+    'Avatar_Boy_Polearm_Xiao_Tex_Gauntlet_Diffuse.png',
+    'Avatar_Girl_Claymore_Mualani_Tex_NyxState_Ramp.png',
+    'Avatar_Girl_Claymore_Mualani_Tex_Mask.png',
+    'Avatar_Lady_Catalyst_Mona_Tex_Stockings_Detailmap.png',
+    'Avatar_Lady_Sword_Furina_SkillObj_Salon_Tex_Diffuse.png',
+    'Avatar_Lady_Sword_Furina_Tex_Tail_Diffuse.png',
+    'Avatar_Lady_Sword_Furina_Tex_Unknown.png',
+]
+
+GENSHIN_NPC_TEXTURE_NAMES = [
+    'NPC_Lady_Tex_Hair_Diffuse.png',
+    'NPC_Lady_Tex_Hair_Lightmap.png',
+    'NPC_Lady_Tex_Body_Diffuse.png',
+    'NPC_Lady_Tex_Body_Lightmap.png',
+    'NPC_Lady_Tex_Face_Diffuse.png',
+    'NPC_Lady_Tex_Face_Lightmap.png',
+    'NPC_Paimon_Tex_Cloak_Diffuse.png',
+    'NPC_Lady_Tex_Item_Diffuse.png',
+    'NPC_Lady_Tex_Hat_Lightmap.png',
+    'NPC_Lady_Tex_Others_Diffuse.png',
+]
+
+GENSHIN_MONSTER_TEXTURE_NAMES = [
+    'Monster_Hili_Tex_Body_Diffuse.png',
+    'Monster_Hili_Tex_Body_Lightmap.png',
+    'Monster_Hili_Tex_Hair_Diffuse.png',
+    'Monster_Hili_Tex_Hair_Lightmap.png',
+    'Monster_Slime_Tex_Diffuse.png',
+    'Monster_Slime_Tex_Lightmap.png',
+    'Monster_Hili_Body_Shadow_Ramp.png',
+    'Monster_Tex_Specular_Ramp.png',
+    'Monster_Asmoday_Hand_Tex_Eff.png',
+]
+
+HONKAI_STAR_RAIL_AVATAR_TEXTURE_NAMES = [
+    'Avatar_Kafka_00_Hair_Color.png',
+    'Avatar_Kafka_00_Hair_LightMap.png',
+    'Avatar_Kafka_00_Hair_Warm_Ramp.png',
+    'Avatar_Kafka_00_Hair_Cool_Ramp.png',
+    'Avatar_Kafka_00_Body_Color.png',
+    'Avatar_Kafka_00_Body_LightMap.png',
+    'Avatar_Kafka_00_Body_Warm_Ramp.png',
+    'Avatar_Kafka_00_Body_Cool_Ramp.png',
+    'Avatar_Kafka_00_Body_Stockings.png',
+    'Avatar_Firefly_00_Body1_Color.png',
+    'Avatar_Firefly_00_Body2_LightMap.png',
+    'Avatar_Kafka_00_Face_Color.png',
+    'W_140_Maid_FaceMap_00.png',
+    'W_140_Maid_Face_ExpressionMap_00.png',
+    'Avatar_Silwolf_00_Weapon_Color_A.png',
+    'Avatar_Asta_00_Weapon_LigthMap.png',
+    'Avatar_Pela_00_Weapon_Screen_Color.png',
+    'Avatar_Tingyun_00_Handbag_Color.png',
+    'Avatar_Yukong_00_Cloak_Color.png',
+]
+
+PUNISHING_GRAY_RAVEN_AVATAR_TEXTURE_NAMES = [
+    'R3LifuMd019011Eye.png',
+    'R3LifuMd019011Hair.png',
+    'R3LifuMd019011Hair_NM.png',
+    'R3LifuMd019011Hair_PBR.png',
+    'R3LifuMd019011Hair_HEAO.png',
+    'R3LifuMd019011Body_AO.png',
+    'R3LifuMd019011Face_HEAO.png',
+    'R3LifuMd019011Face_Skin.png',
+    'R3LifuMd019011HET.png',
+]
+
+TEXTURE_NAMES_BY_CLASSIFIER = [
+    (genshin_avatar_texture_filename_classifier, GENSHIN_AVATAR_TEXTURE_NAMES),
+    (genshin_npc_texture_filename_classifier, GENSHIN_NPC_TEXTURE_NAMES),
+    (genshin_monster_texture_filename_classifier, GENSHIN_MONSTER_TEXTURE_NAMES),
+    (honkai_star_rail_avatar_texture_filename_classifier, HONKAI_STAR_RAIL_AVATAR_TEXTURE_NAMES),
+    (punishing_gray_raven_avatar_texture_filename_classifier, PUNISHING_GRAY_RAVEN_AVATAR_TEXTURE_NAMES),
+]
+
+
+def classify_all(classify):
+    for classifier, texture_names in TEXTURE_NAMES_BY_CLASSIFIER:
+        folder_context = classifier.get_folder_context(texture_names)
+        for texture_name in texture_names:
+            classify(classifier, texture_name, folder_context)
+
+
+def classify_uncached(classifier, texture_name, folder_context):
+    classifier.clear()
+    classifier.classify(texture_name, folder_context)
+
+
+def main(number=200):
+    texture_count = sum(len(texture_names) for _, texture_names in TEXTURE_NAMES_BY_CLASSIFIER)
+    benchmarks = [
+        ('Rule by rule string checks', lambda: classify_all(
+            lambda classifier, texture_name, folder_context: classifier.classify_sequentially(texture_name, folder_context))),
+        ('Compiled rule regex', lambda: classify_all(classify_uncached)),
+        ('Compiled rule regex (memoized)', lambda: classify_all(
+            lambda classifier, texture_name, folder_context: classifier.classify(texture_name, folder_context))),
+    ]
+
+    print(f'Classifying {texture_count} texture names x {number}')
+    for benchmark_name, benchmark in benchmarks:
+        seconds = min(timeit.repeat(benchmark, number=number, repeat=5))
+        print(f'{benchmark_name:<32} {seconds * 1e6 / (number * texture_count):8.2f} us/texture')
+
+
+if __name__ == '__main__':
+    main()
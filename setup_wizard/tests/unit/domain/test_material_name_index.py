@@ -0,0 +1,91 @@
+import pytest
+
+from setup_wizard.domain.material_name_index import MaterialNameIndex
+
+
+class Material:
+    def __init__(self, name):
+        self.name = name
+
+
+class BlendDataCollection(dict):
+    '''Iterates over values, like bpy.data.materials and bpy.data.node_groups'''
+    def __init__(self, names):
+        super().__init__((name, Material(name)) for name in names)
+
+    def __iter__(self):
+        return iter(self.values())
+
+
+@pytest.fixture
+def materials():
+    return BlendDataCollection([
+        'HoYoverse - Genshin Body',
+        'HoYoverse - Genshin Hair',
+        'HoYoverse - Genshin Face',
+        'HoYoverse - Genshin Body Outlines',
+        'Avatar_Lady_Sword_Furina_Mat_Body',
+        'miHoYo - Genshin Body',
+        'HoYoverse - Furina Body',
+        'HoYoverse - Furina Dress',
+        'HSR - Body',
+        'Material',
+    ])
+
+
+@pytest.fixture
+def material_name_index(materials):
+    return MaterialNameIndex(materials, BlendDataCollection(['miHoYo - Genshin Face', 'Light Vectors']))
+
+
+@pytest.mark.parametrize("prefix, suffix", [
+    ('HoYoverse - ', 'Body'),
+    ('HoYoverse - ', ''),
+    ('', 'Body'),
+    ('', 'Outlines'),
+    ('miHoYo - ', 'Body'),
+    ('HSR - ', 'Hair'),
+    ('Avatar_', 'Mat_Body'),
+    ('Unknown', ''),
+    ('', ''),
+])
+def test_find_materials_matches_scan(materials, material_name_index, prefix, suffix):
+    expected_materials = [material for material in materials if material.name.startswith(prefix) and material.name.endswith(suffix)]
+
+    assert material_name_index.find_materials(prefix=prefix, suffix=suffix) == expected_materials
+
+
+@pytest.mark.parametrize("text", [
+    'HoYoverse - ',
+    'miHoYo - ',
+    'HSR - ',
+    'Furina',
+    'Mat_Bo',
+    'Outlines',
+    'PGR - ',
+    'Hair Outlines',
+    'se - Genshin Bo',
+    'Lady_Sword_F',
+    ' - Furina Hair',
+    '',
+])
+def test_has_material_containing_matches_scan(materials, material_name_index, text):
+    expected = bool([material for material in materials.values() if text in material.name])
+
+    assert material_name_index.has_material_containing(text) is expected
+
+
+def test_exact_lookups(materials, material_name_index):
+    assert material_name_index.get_material('HSR - Body') is materials['HSR - Body']
+    assert material_name_index.get_material('HSR - Hair') is None
+    assert material_name_index.has_node_group('miHoYo - Genshin Face')
+    assert not material_name_index.has_node_group('miHoYo - Genshin Body')
+
+
+def test_index_is_reused_per_scene_generation(materials):
+    node_groups = BlendDataCollection([])
+    material_name_index = MaterialNameIndex.get(materials, node_groups)
+
+    assert MaterialNameIndex.get(materials, node_groups) is material_name_index
+    assert MaterialNameIndex.get(BlendDataCollection(['HSR - Body']), node_groups) is not material_name_index
+    MaterialNameIndex.clear()
@@ -0,0 +1,74 @@
+import pytest
+import sys
+from unittest.mock import MagicMock
+
+sys.modules.setdefault('bpy', MagicMock())
+
+from setup_wizard.domain.shader_identifier_service import GenshinImpactShaderIdentifierService, GenshinImpactShaders, \
+    HonkaiStarRailShaderIdentifierService, HonkaiStarRailShaders
+from setup_wizard.domain.material_name_index import MaterialNameIndex
+from setup_wizard.domain.shader_identity_cache import ShaderIdentityCache
+
+
+class Material:
+    def __init__(self, name):
+        self.name = name
+        self.node_tree = MagicMock()
+        self.node_tree.nodes.get.return_value = None
+
+
+class BlendDataCollection(dict):
+    '''Iterates over values, like bpy.data.materials and bpy.data.node_groups'''
+    def __init__(self, names):
+        super().__init__((name, Material(name)) for name in names)
+
+    def __iter__(self):
+        return iter(self.values())
+
+
+@pytest.fixture(autouse=True)
+def shader_identity_cache():
+    ShaderIdentityCache.clear()
+    ShaderIdentityCache.reset_statistics()
+    yield
+    ShaderIdentityCache.clear()
+    ShaderIdentityCache.reset_statistics()
+    MaterialNameIndex.clear()
+
+
+def test_identify_shader_is_cached():
+    materials = BlendDataCollection(['HoYoverse - Genshin Body', 'HoYoverse - Genshin Hair'])
+    node_groups = BlendDataCollection([])
+
+    assert GenshinImpactShaderIdentifierService().identify_shader(materials, node_groups) is GenshinImpactShaders.V3_GENSHIN_IMPACT_SHADER
+    assert GenshinImpactShaderIdentifierService().identify_shader(materials, node_groups) is GenshinImpactShaders.V3_GENSHIN_IMPACT_SHADER
+    assert ShaderIdentityCache.get_statistics() == {'hits': 1, 'misses': 1}
+
+
+def test_identify_shader_misses_when_scene_changes():
+    node_groups = BlendDataCollection([])
+
+    GenshinImpactShaderIdentifierService().identify_shader(BlendDataCollection(['Avatar_Lady_Sword_Furina_Mat_Body']), node_groups)
+    shader = GenshinImpactShaderIdentifierService().identify_shader(BlendDataCollection(['miHoYo - Genshin Body']), node_groups)
+
+    assert shader is GenshinImpactShaders.V2_GENSHIN_IMPACT_SHADER
+    assert ShaderIdentityCache.get_statistics() == {'hits': 0, 'misses': 2}
+
+
+def test_identify_shader_is_cached_per_game_type():
+    materials = BlendDataCollection(['HSR - Body'])
+    node_groups = BlendDataCollection([])
+
+    assert GenshinImpactShaderIdentifierService().identify_shader(materials, node_groups) is None
+    assert HonkaiStarRailShaderIdentifierService().identify_shader(materials, node_groups) is HonkaiStarRailShaders.NYA222_HONKAI_STAR_RAIL_SHADER
+    assert ShaderIdentityCache.get_statistics() == {'hits': 0, 'misses': 2}
+
+
+def test_cached_none_is_a_hit():
+    materials = BlendDataCollection(['Avatar_Lady_Sword_Furina_Mat_Body'])
+    node_groups = BlendDataCollection([])
+
+    GenshinImpactShaderIdentifierService().identify_shader(materials, node_groups)
+    GenshinImpactShaderIdentifierService().identify_shader(materials, node_groups)
+
+    assert ShaderIdentityCache.get_statistics() == {'hits': 1, 'misses': 1}
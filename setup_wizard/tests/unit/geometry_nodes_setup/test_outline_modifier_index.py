@@ -0,0 +1,72 @@
+import pytest
+import sys
+from unittest.mock import MagicMock
+
+sys.modules.setdefault('bpy', MagicMock())
+sys.modules.setdefault('bpy.types', sys.modules['bpy'].types)
+
+from setup_wizard.geometry_nodes_setup.outline_modifier_index import OutlineModifierIndex
+
+
+class Modifier:
+    def __init__(self, name):
+        self.name = name
+
+
+class SceneObject:
+    def __init__(self, name, modifier_names):
+        self.name = name
+        self.modifiers = [Modifier(modifier_name) for modifier_name in modifier_names]
+
+
+class Scene:
+    def __init__(self, scene_objects):
+        self.objects = MagicMock()
+        self.objects.values.return_value = scene_objects
+        self.objects.__len__.return_value = len(scene_objects)
+
+
+@pytest.fixture
+def scene_objects():
+    return [
+        SceneObject('Body', ['Light Vectors Body', 'Outlines Body']),
+        SceneObject('Hair', ['Light Vectors Hair', 'Outlines Hair']),
+        SceneObject('Dress', ['Outlines Dress']),
+        SceneObject('Dress2', ['Outlines Dress2']),
+        SceneObject('Body.001', ['Outlines Body.001']),
+        SceneObject('Avatar_Lady_Sword_Furina_Mat_Body', ['Outlines Avatar_Lady_Sword_Furina_Mat_Body']),
+        SceneObject('Armature', []),
+    ]
+
+
+def scan_modifiers(scene_objects, *keys):
+    return [
+        modifier for scene_object in scene_objects for modifier in scene_object.modifiers
+        if any(f'Outlines {key}' in modifier.name for key in keys)
+    ]
+
+
+@pytest.mark.parametrize("keys", [
+    ('Body',),
+    ('Hair',),
+    ('Dress',),
+    ('Dress2',),
+    ('Face',),
+    ('Body', 'Avatar_Lady_Sword_Furina_Mat'),
+    ('Hair', 'Avatar_Lady_Sword_Furina_Mat_Body'),
+    ('',),
+])
+def test_get_modifiers_matches_substring_scan(scene_objects, keys):
+    outline_modifier_index = OutlineModifierIndex(scene_objects)
+
+    assert outline_modifier_index.get_modifiers(*keys) == scan_modifiers(scene_objects, *keys)
+
+
+def test_get_rebuilds_stale_index(scene_objects):
+    scene = Scene(scene_objects)
+    outline_modifier_index = OutlineModifierIndex.build(scene)
+    assert OutlineModifierIndex.get(scene) is outline_modifier_index
+
+    scene_objects[0].modifiers[1].name = 'Outlines Body Renamed'
+    assert OutlineModifierIndex.get(scene) is not outline_modifier_index
+    OutlineModifierIndex.clear()
@@ -0,0 +1,78 @@
+import json
+import sys
+from unittest.mock import MagicMock
+
+sys.modules.setdefault('bpy', MagicMock())
+
+import pytest
+
+from setup_wizard.instrumentation import span_tracer as span_tracer_module
+from setup_wizard.instrumentation.span_tracer import NULL_SPAN, SpanTracer, trace_span
+
+
+@pytest.fixture
+def span_tracer(monkeypatch):
+    span_tracer = SpanTracer()
+    monkeypatch.setattr(span_tracer_module, 'span_tracer', span_tracer)
+    yield span_tracer
+
+
+def rig_character(span_tracer):
+    span_tracer.phase('Prepare Metarig')
+    span_tracer.phase('Generate Rigify Rig')
+    with span_tracer.span('Append Rig Extras', 'append'):
+        pass
+
+
+def test_nothing_is_recorded_while_disabled(span_tracer):
+    import_textures = trace_span()(lambda: 'imported')
+
+    assert import_textures() == 'imported'
+    assert span_tracer.span('Append Shader Materials') is NULL_SPAN
+    span_tracer.phase('Prepare Metarig')
+    assert span_tracer.spans == []
+
+
+def test_spans_and_phases_are_nested(span_tracer):
+    traced_rig_character = trace_span('rig_script.rig_character', 'rig')(rig_character)
+    span_tracer.start()
+
+    with span_tracer.span('rig_character', 'step'):
+        traced_rig_character(span_tracer)
+    span_tracer.stop()
+
+    spans = span_tracer.get_spans()
+    assert [span.name for span in spans] == \
+        ['rig_character', 'rig_script.rig_character', 'Prepare Metarig', 'Generate Rigify Rig', 'Append Rig Extras']
+    rig_span, generate_rig_phase, append_span = spans[1], spans[3], spans[4]
+    assert generate_rig_phase.end_time == rig_span.end_time  # open phase closed with its enclosing span
+    assert generate_rig_phase.start_time <= append_span.start_time <= append_span.end_time <= generate_rig_phase.end_time
+
+
+def test_traces_are_exported(span_tracer, tmp_path):
+    traced_rig_character = trace_span('rig_script.rig_character', 'rig')(rig_character)
+    span_tracer.start()
+    traced_rig_character(span_tracer)
+    traced_rig_character(span_tracer)
+    span_tracer.stop()
+
+    chrome_trace_file_path, speedscope_file_path = span_tracer.write_traces(str(tmp_path), 'HOYOVERSE_OT_set_up_character_rig')
+
+    with open(chrome_trace_file_path) as chrome_trace_file:
+        trace_events = json.load(chrome_trace_file)['traceEvents']
+    assert len(trace_events) == 8
+    assert all(trace_event['ph'] == 'X' and trace_event['dur'] >= 0 for trace_event in trace_events)
+
+    with open(speedscope_file_path) as speedscope_file:
+        speedscope_profile = json.load(speedscope_file)
+    frame_names = [frame['name'] for frame in speedscope_profile['shared']['frames']]
+    events = speedscope_profile['profiles'][0]['events']
+    open_frames = []
+    for event in events:  # every close matches the innermost open frame
+        if event['type'] == 'O':
+            open_frames.append(event['frame'])
+        else:
+            assert open_frames.pop() == event['frame']
+    assert not open_frames
+    assert len(events) == 16
+    assert frame_names[0] == 'rig_script.rig_character'
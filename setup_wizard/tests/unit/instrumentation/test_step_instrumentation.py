@@ -0,0 +1,89 @@
+import json
+import os
+import sys
+import tracemalloc
+from unittest.mock import MagicMock
+
+sys.modules.setdefault('bpy', MagicMock())
+
+import pytest
+
+from setup_wizard.instrumentation import step_instrumentation as step_instrumentation_module
+from setup_wizard.instrumentation.step_instrumentation import PipelineInstrumentation
+
+
+class DatablockCollections:
+    def __init__(self):
+        self.objects = []
+        self.materials = []
+
+
+@pytest.fixture
+def bpy_data(monkeypatch):
+    bpy = MagicMock()
+    bpy.data = DatablockCollections()
+    bpy.app.version = (4, 2, 0)
+    monkeypatch.setattr(step_instrumentation_module, 'bpy', bpy)
+    yield bpy.data
+    PipelineInstrumentation.last_instrumentation = None
+
+
+def test_steps_are_measured(bpy_data, tmp_path):
+    instrumentation = PipelineInstrumentation('GENSHIN_OT_set_up_materials', reports_directory=str(tmp_path), trace_allocations=True).start()
+
+    step_measurement = instrumentation.measure_step(1, 'import_materials')
+    allocations = [bytearray(1024 * 1024)]
+    bpy_data.materials.extend(['HoYoverse - Genshin Body', 'HoYoverse - Genshin Hair'])
+    bpy_data.objects.append('Body')
+    instrumentation.record(step_measurement.stop('FINISHED'))
+    del allocations
+    instrumentation.stop()
+
+    step_metrics = instrumentation.step_metrics[0]
+    assert step_metrics.created_datablocks == 3
+    assert step_metrics.peak_allocated_bytes >= 1024 * 1024
+    assert step_metrics.wall_time >= 0 and step_metrics.cpu_time >= 0
+    assert not tracemalloc.is_tracing()
+    assert PipelineInstrumentation.last_instrumentation is instrumentation
+
+
+def test_slowest_steps_are_sorted_by_wall_time(bpy_data, tmp_path):
+    instrumentation = PipelineInstrumentation('GENSHIN_OT_set_up_materials', reports_directory=str(tmp_path))
+    for step_index, (component_name, wall_time) in enumerate([('import_materials', 0.5), ('import_character_textures', 3.0), ('replace_default_materials', 1.0)], 1):
+        instrumentation.record(step_instrumentation_module.StepMetrics(step_index, component_name, 'FINISHED', wall_time, wall_time, 0, 0, False))
+
+    assert [step_metrics.component_name for step_metrics in instrumentation.get_slowest_steps(2)] == \
+        ['import_character_textures', 'replace_default_materials']
+
+
+def test_run_report_is_written(bpy_data, tmp_path):
+    instrumentation = PipelineInstrumentation('GENSHIN_OT_set_up_materials', reports_directory=str(tmp_path / 'csw_run_reports')).start()
+    instrumentation.record(instrumentation.measure_step(1, 'import_materials').stop('FINISHED'))
+    instrumentation.stop()
+
+    with open(instrumentation.write_report()) as report_file:
+        report = json.load(report_file)
+
+    assert report['blender_version'] == '4.2.0'
+    assert report['steps'][0]['component_name'] == 'import_materials'
+    assert report['slowest_steps'] == ['import_materials']
+
+
+def test_allocations_are_not_traced_by_default(bpy_data, tmp_path):
+    instrumentation = PipelineInstrumentation('GENSHIN_OT_set_up_materials', reports_directory=str(tmp_path)).start()
+
+    assert not tracemalloc.is_tracing()
+    instrumentation.record(instrumentation.measure_step(1, 'import_materials').stop('FINISHED'))
+    instrumentation.stop()
+    assert instrumentation.step_metrics[0].peak_allocated_bytes == 0
+
+
+def test_old_run_reports_are_removed(bpy_data, tmp_path, monkeypatch):
+    monkeypatch.setattr(step_instrumentation_module, 'MAX_RUN_REPORTS', 2)
+    for report_index in range(3):
+        (tmp_path / f'GENSHIN_OT_setup_wizard_ui_{report_index}.json').write_text('{}')
+        os.utime(tmp_path / f'GENSHIN_OT_setup_wizard_ui_{report_index}.json', (report_index, report_index))
+
+    report_file_path = PipelineInstrumentation('GENSHIN_OT_set_up_materials', reports_directory=str(tmp_path)).write_report()
+
+    assert sorted(os.listdir(tmp_path)) == sorted(['GENSHIN_OT_setup_wizard_ui_2.json', os.path.basename(report_file_path)])
@@ -0,0 +1,69 @@
+import pstats
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+sys.modules.setdefault('bpy', MagicMock())
+
+import pytest
+
+from setup_wizard.instrumentation import step_profiler as step_profiler_module
+from setup_wizard.instrumentation.step_profiler import PROFILE_STEPS_ENVIRONMENT_VARIABLE, StepProfiler
+
+
+def identify_shader():
+    return sum(range(1000))
+
+
+@pytest.fixture
+def config_directory(tmp_path, monkeypatch):
+    bpy = MagicMock()
+    bpy.utils.user_resource.return_value = str(tmp_path)
+    monkeypatch.setattr(step_profiler_module, 'bpy', bpy)
+    monkeypatch.delenv(PROFILE_STEPS_ENVIRONMENT_VARIABLE, raising=False)
+    yield tmp_path
+
+
+def create_context(**preferences):
+    addon = SimpleNamespace(preferences=SimpleNamespace(**preferences)) if preferences else None
+    return SimpleNamespace(preferences=SimpleNamespace(addons={'setup_wizard': addon} if addon else {}))
+
+
+def test_step_profile_is_saved_and_summarized(config_directory, capsys):
+    step_profiler = StepProfiler('GENSHIN_OT_set_up_materials', top_functions_count=5, profiles_directory=str(config_directory / 'profiles'))
+
+    step_profile = step_profiler.start(2, 'replace_default_materials')
+    identify_shader()
+    profile_file_path = step_profiler.stop(step_profile)
+
+    assert profile_file_path.endswith('02_replace_default_materials.prof')
+    assert any(function_name == 'identify_shader' for _, _, function_name in pstats.Stats(profile_file_path).stats)
+    assert 'identify_shader' in capsys.readouterr().out
+    assert 'identify_shader' in (config_directory / 'csw_logs' / 'step_profiler.log').read_text()
+
+
+def test_only_selected_steps_are_profiled(config_directory):
+    step_profiler = StepProfiler('GENSHIN_OT_set_up_materials', ['import_material_data'], profiles_directory=str(config_directory))
+
+    assert step_profiler.start(1, 'import_materials') is None
+    step_profiler.stop(step_profiler.start(2, 'import_material_data'))
+    assert len(step_profiler.profile_file_paths) == 1
+
+
+@pytest.mark.parametrize("environment_value, preferences, expected_component_names", [
+    ('1', {}, None),
+    ('import_materials, rig_character', {'step_profiling_enabled': False}, ['import_materials', 'rig_character']),
+    ('', {'step_profiling_enabled': True, 'step_profiling_component_names': '', 'step_profiling_top_functions_count': 10}, None),
+    ('', {'step_profiling_enabled': True, 'step_profiling_component_names': 'import_materials', 'step_profiling_top_functions_count': 10}, ['import_materials']),
+])
+def test_profiling_is_enabled_by_environment_or_preferences(config_directory, monkeypatch, environment_value, preferences, expected_component_names):
+    monkeypatch.setenv(PROFILE_STEPS_ENVIRONMENT_VARIABLE, environment_value)
+
+    step_profiler = StepProfiler.create('GENSHIN_OT_setup_wizard_ui', create_context(**preferences))
+
+    assert step_profiler.component_names == expected_component_names
+
+
+def test_profiling_is_disabled_by_default(config_directory):
+    assert StepProfiler.create('GENSHIN_OT_setup_wizard_ui', create_context()) is None
+    assert StepProfiler.create('GENSHIN_OT_setup_wizard_ui', create_context(step_profiling_enabled=False)) is None
@@ -0,0 +1,96 @@
+import sys
+from unittest.mock import MagicMock
+
+sys.modules.setdefault('bpy', MagicMock())
+sys.modules.setdefault('bpy.types', sys.modules['bpy'].types)
+
+from setup_wizard.material_data_import_setup.material_data_applier_selector import MaterialDataApplierSelector
+
+
+class NodeGroup:
+    def __init__(self, name):
+        self.name = name
+
+
+class Node:
+    def __init__(self, node_group_name, input_names):
+        self.node_tree = NodeGroup(node_group_name)
+        self.inputs = MagicMock()
+        self.inputs.get.side_effect = lambda input_name: object() if input_name in input_names else None
+
+
+class NodeTree:
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+
+class FakeMaterialDataApplier:
+    def __init__(self, node_tree, node_name, input_names):
+        self.required_node_inputs = [(node_tree, node_name, input_names)]
+
+    def get_required_node_inputs(self):
+        return self.required_node_inputs
+
+
+class V3_FakeMaterialDataApplier(FakeMaterialDataApplier):
+    pass
+
+
+class V2_FakeMaterialDataApplier(FakeMaterialDataApplier):
+    pass
+
+
+def create_material_node_tree(node_group_name='HoYoverse - Genshin Body', input_names=('Face Blush Color',)):
+    body_shader = Node(node_group_name, input_names)
+    return NodeTree({'Body Shader': body_shader}), body_shader
+
+
+def test_orders_compatible_appliers_first():
+    node_tree, _ = create_material_node_tree()
+    v3_applier = V3_FakeMaterialDataApplier(node_tree, 'Body Shader', ('Face Blush Color', 'Use Material 2'))
+    v2_applier = V2_FakeMaterialDataApplier(node_tree, 'Body Shader', ('Face Blush Color',))
+
+    assert MaterialDataApplierSelector().select([v3_applier, v2_applier]) == [v2_applier, v3_applier]
+
+
+def test_orders_applier_with_missing_node_last():
+    node_tree, _ = create_material_node_tree()
+    v3_applier = V3_FakeMaterialDataApplier(node_tree, 'Group.006', ('Face Blush Color',))
+    v2_applier = V2_FakeMaterialDataApplier(node_tree, 'Body Shader', ('Face Blush Color',))
+
+    assert MaterialDataApplierSelector().select([v3_applier, v2_applier]) == [v2_applier, v3_applier]
+
+
+def test_keeps_other_compatible_appliers_as_fallbacks():
+    node_tree, _ = create_material_node_tree()
+    v3_applier = V3_FakeMaterialDataApplier(node_tree, 'Body Shader', ('Face Blush Color',))
+    v2_applier = V2_FakeMaterialDataApplier(node_tree, 'Body Shader', ('Face Blush Color',))
+
+    assert MaterialDataApplierSelector().select([v3_applier, v2_applier]) == [v3_applier, v2_applier]
+
+
+def test_falls_back_to_all_appliers_if_none_are_compatible():
+    v3_applier = V3_FakeMaterialDataApplier(None, 'Body Shader', ())
+    v2_applier = V2_FakeMaterialDataApplier(NodeTree({}), 'Group.006', ())
+
+    assert MaterialDataApplierSelector().select([v3_applier, v2_applier]) == [v3_applier, v2_applier]
+
+
+def test_probes_once_per_shader_version():
+    material_data_applier_selector = MaterialDataApplierSelector()
+    node_tree, body_shader = create_material_node_tree()
+    other_node_tree, other_body_shader = create_material_node_tree()
+
+    assert material_data_applier_selector.is_compatible(V3_FakeMaterialDataApplier(node_tree, 'Body Shader', ('Face Blush Color',)))
+    assert material_data_applier_selector.is_compatible(V3_FakeMaterialDataApplier(other_node_tree, 'Body Shader', ('Face Blush Color',)))
+    body_shader.inputs.get.assert_called_once_with('Face Blush Color')
+    other_body_shader.inputs.get.assert_not_called()
+
+
+def test_probes_again_for_a_different_shader_version():
+    material_data_applier_selector = MaterialDataApplierSelector()
+    node_tree, _ = create_material_node_tree()
+    other_node_tree, _ = create_material_node_tree('HoYoverse - Genshin Body (Old)', input_names=())
+
+    assert material_data_applier_selector.is_compatible(V3_FakeMaterialDataApplier(node_tree, 'Body Shader', ('Face Blush Color',)))
+    assert not material_data_applier_selector.is_compatible(V3_FakeMaterialDataApplier(other_node_tree, 'Body Shader', ('Face Blush Color',)))
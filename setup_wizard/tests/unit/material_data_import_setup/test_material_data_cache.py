@@ -0,0 +1,87 @@
+import json
+import os
+import pytest
+import sys
+from unittest.mock import MagicMock
+
+sys.modules.setdefault('bpy', MagicMock())
+
+from setup_wizard.material_data_import_setup.material_data_cache import MaterialDataCache
+
+
+MATERIAL_DATA = {
+    'm_Floats': {'_UseMaterial2': 1.0, '_MainTexAlphaUse': 0.0},
+    'm_Colors': {'_Color': (1.0, 0.5, 0.25, 1.0)},
+    'm_TexEnvs': {'_MainTex': {'m_Texture': {'m_PathID': 1234}, 'm_Scale': {'X': 1.0, 'Y': 1.0}}},
+}
+
+
+class TestMaterialDataCache:
+    @pytest.fixture
+    def cache_directory(self, tmp_path):
+        return str(tmp_path / 'cache')
+
+    @pytest.fixture
+    def material_data_file_path(self, tmp_path):
+        file_path = tmp_path / 'Avatar_Lady_Sword_Ayaka_Mat_Body.json'
+        file_path.write_text(json.dumps({'m_SavedProperties': {}}))
+        return str(file_path)
+
+    def put(self, cache_directory, file_path, material_data):
+        cache = MaterialDataCache(cache_directory)
+        cache.put(file_path, material_data)
+        cache.flush()
+
+    def test_put_and_get_round_trip(self, cache_directory, material_data_file_path):
+        self.put(cache_directory, material_data_file_path, MATERIAL_DATA)
+
+        assert MaterialDataCache(cache_directory).get(material_data_file_path) == MATERIAL_DATA
+
+    def test_put_is_only_written_on_flush(self, cache_directory, material_data_file_path):
+        cache = MaterialDataCache(cache_directory)
+        cache.put(material_data_file_path, MATERIAL_DATA)
+
+        assert not os.path.exists(cache_directory)
+        assert cache.get(material_data_file_path) == MATERIAL_DATA
+        cache.flush()
+        assert MaterialDataCache(cache_directory).get(material_data_file_path) == MATERIAL_DATA
+
+    def test_get_falls_back_to_content_hash(self, tmp_path, cache_directory, material_data_file_path):
+        self.put(cache_directory, material_data_file_path, MATERIAL_DATA)
+        copied_file_path = tmp_path / 'copy.json'
+        copied_file_path.write_bytes(open(material_data_file_path, 'rb').read())
+
+        assert MaterialDataCache(cache_directory).get(str(copied_file_path)) == MATERIAL_DATA
+
+    def test_get_misses_when_file_changes(self, cache_directory, material_data_file_path):
+        self.put(cache_directory, material_data_file_path, MATERIAL_DATA)
+        with open(material_data_file_path, 'w') as material_data_file:
+            material_data_file.write(json.dumps({'m_SavedProperties': {'m_Floats': {}}}))
+
+        assert MaterialDataCache(cache_directory).get(material_data_file_path) is None
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path, cache_directory):
+        file_paths = []
+        for index in range(3):
+            file_path = tmp_path / f'material_data_{index}.json'
+            file_path.write_text(json.dumps({'index': index}))
+            file_paths.append(str(file_path))
+
+        cache = MaterialDataCache(cache_directory)
+        cache.put(file_paths[0], {**MATERIAL_DATA, 'index': 0})
+        cache.put(file_paths[1], {**MATERIAL_DATA, 'index': 1})
+        cache.max_size_bytes = cache.get_size()  # room for two entries
+        cache.get(file_paths[0])  # file 1 is now the least recently used entry
+        cache.put(file_paths[2], {**MATERIAL_DATA, 'index': 2})
+
+        assert cache.get(file_paths[0]) == {**MATERIAL_DATA, 'index': 0}
+        assert cache.get(file_paths[1]) is None
+        assert cache.get(file_paths[2]) == {**MATERIAL_DATA, 'index': 2}
+
+    def test_clear(self, cache_directory, material_data_file_path):
+        cache = MaterialDataCache(cache_directory)
+        cache.put(material_data_file_path, MATERIAL_DATA)
+        cache.clear()
+
+        assert not os.path.exists(cache_directory)
+        assert MaterialDataCache(cache_directory).get(material_data_file_path) is None
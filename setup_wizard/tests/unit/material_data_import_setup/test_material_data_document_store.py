@@ -0,0 +1,90 @@
+import json
+import pytest
+import sys
+from unittest.mock import MagicMock, patch
+
+sys.modules.setdefault('bpy', MagicMock())
+
+from setup_wizard.material_data_import_setup.material_data_cache import MaterialDataCache
+from setup_wizard.material_data_import_setup.material_data_document_store import MaterialDataDocumentStore
+from setup_wizard.parsers.material_data_json_parsers import CachedMaterialDataJsonParser, HoyoStudioMaterialDataJsonParser
+
+
+class MaterialDataFile:
+    def __init__(self, name):
+        self.name = name
+
+
+def material_data_json(shadow_ramp_path_id):
+    return {
+        'm_SavedProperties': {
+            'm_TexEnvs': {
+                '_PackedShadowRampTex': {
+                    'm_Texture': {
+                        'm_PathID': shadow_ramp_path_id
+                    }
+                }
+            },
+            'm_Floats': {},
+            'm_Colors': {},
+        }
+    }
+
+
+class TestMaterialDataDocumentStore:
+    @pytest.fixture
+    def material_data_files(self, tmp_path):
+        documents = {
+            'Avatar_Lady_Sword_Ayaka_Mat_Hair.json': material_data_json(1111),
+            'Avatar_Lady_Sword_Ayaka_Mat_Body.json': material_data_json(2222),
+            'Avatar_Lady_Sword_Ayaka_Mat_Dress.json': material_data_json(2222),
+            'Avatar_Lady_Sword_Ayaka_Mat_Face.json': material_data_json(0),
+        }
+        for filename, document in documents.items():
+            (tmp_path / filename).write_text(json.dumps(document))
+        return [MaterialDataFile(filename) for filename in documents]
+
+    @pytest.fixture
+    def store(self, tmp_path, material_data_files):
+        return MaterialDataDocumentStore(str(tmp_path), material_data_files)
+
+    def test_get_parses_each_file_once(self, store, material_data_files):
+        with patch.object(MaterialDataDocumentStore, 'open_and_load_json_data', wraps=MaterialDataDocumentStore.open_and_load_json_data) as mock_load:
+            for _ in range(3):
+                for file in material_data_files:
+                    store.get(file)
+                    store.get_shadow_ramp_type(file)
+
+        assert mock_load.call_count == len(material_data_files)
+
+    @pytest.mark.parametrize("target_filename, expected_shadow_ramp_type", [
+        ('Avatar_Lady_Sword_Ayaka_Mat_Dress.json', 'Body'),
+        ('Avatar_Lady_Sword_Ayaka_Mat_Body.json', 'Dress'),
+        ('Avatar_Lady_Sword_Ayaka_Mat_Hair.json', None),  # No other file shares the shadow ramp
+        ('Avatar_Lady_Sword_Ayaka_Mat_Face.json', None),  # Falsy m_PathID is never matched
+    ])
+    def test_get_shadow_ramp_type(self, store, target_filename, expected_shadow_ramp_type):
+        assert store.get_shadow_ramp_type(MaterialDataFile(target_filename)) == expected_shadow_ramp_type
+
+    def test_get_shadow_ramp_path_id_for_unsupported_formats(self):
+        assert MaterialDataDocumentStore.get_shadow_ramp_path_id({'0 Material Base': {}}) is None
+        assert MaterialDataDocumentStore.get_shadow_ramp_path_id({'m_SavedProperties': {'m_TexEnvs': []}}) is None
+
+    def test_get_parser_reads_from_material_data_cache(self, tmp_path, material_data_files):
+        def material_data_json_parser_resolver(json_material_data):
+            parser = HoyoStudioMaterialDataJsonParser(json_material_data)
+            parser.parse()
+            return parser
+
+        material_data_cache = MaterialDataCache(str(tmp_path / 'cache'))
+        previous_run_store = MaterialDataDocumentStore(str(tmp_path), material_data_files, material_data_json_parser_resolver, material_data_cache)
+        previous_run_store.get_parser(material_data_files[1])
+        previous_run_store.flush()
+        store = MaterialDataDocumentStore(str(tmp_path), material_data_files, material_data_json_parser_resolver, MaterialDataCache(str(tmp_path / 'cache')))
+
+        with patch.object(MaterialDataDocumentStore, 'open_and_load_json_data') as mock_load:
+            parser = store.get_parser(material_data_files[1])
+
+        assert mock_load.call_count == 0
+        assert type(parser) is CachedMaterialDataJsonParser
+        assert parser.m_texEnvs._PackedShadowRampTex == {'m_Texture': {'m_PathID': 2222}}
@@ -0,0 +1,64 @@
+import pytest
+import sys
+from unittest.mock import MagicMock
+
+sys.modules.setdefault('bpy', MagicMock())
+sys.modules.setdefault('bpy.types', sys.modules['bpy'].types)
+
+from setup_wizard.material_data_import_setup import srgb_color_converter as srgb_color_converter_module
+from setup_wizard.material_data_import_setup.material_data_applier import MaterialDataApplier
+from setup_wizard.material_data_import_setup.srgb_color_converter import SRGB_BYTE_TO_LINEAR, SrgbColorConverter
+
+COLORS = [
+    (0.0, 0.0, 0.0, 1.0),
+    (1.0, 1.0, 1.0, 1.0),
+    (1, 0, 1, 0),
+    (0.5, 0.5, 0.5, 0.5),
+    (0.04045, 0.04, 0.041, 1.0),
+    (0.003921568627451, 0.0039215, 0.996078431372549, 1.0),
+    (0.7372549, 0.6431373, 0.6509804, 1.0),
+    (0.9490196, 0.7607843, 0.8352941, 0.1),
+    (1.5, -0.25, 2.0, 1.0),
+    (float('inf'), float('-inf'), 0.2, 1.0),
+    (float('nan'), 0.3, 0.6, 1.0),
+    (0.1 + 0.2, 1 / 3, 2 / 3, 0.75),
+]
+
+
+def reference_convert(color):
+    return MaterialDataApplier.convert_color_srgb_to_hex_to_rgb(MaterialDataApplier, color)
+
+
+@pytest.fixture(params=['python', 'numpy'])
+def srgb_color_converter(request):
+    srgb_color_converter = SrgbColorConverter()
+    if request.param == 'python':
+        srgb_color_converter.srgb_byte_to_linear = None
+    elif srgb_color_converter_module.numpy is None:
+        pytest.skip('numpy is not installed')
+    return srgb_color_converter
+
+
+def test_lookup_table_matches_hex_to_linear():
+    for srgb_byte in range(256):
+        assert SRGB_BYTE_TO_LINEAR[srgb_byte] == MaterialDataApplier.hex_to_linear(f'{srgb_byte:02X}')
+
+
+@pytest.mark.parametrize("color", COLORS)
+def test_convert_is_bit_exact_with_hex_conversion(srgb_color_converter, color):
+    assert repr(srgb_color_converter.convert(color)) == repr(reference_convert(color))
+
+
+def test_convert_many(srgb_color_converter):
+    values = [0.5, None, *COLORS, 'not a color', *COLORS]
+    converted_values = srgb_color_converter.convert_many(values)
+
+    assert repr(converted_values) == repr([
+        reference_convert(value) if type(value) is tuple else value for value in values
+    ])
+
+
+def test_convert_caches_unique_colors(srgb_color_converter):
+    srgb_color_converter.convert_many([(0.5, 0.5, 0.5, 1.0), (0.5, 0.5, 0.5, 1.0), (0.25, 0.5, 0.5, 1.0)])
+
+    assert len(srgb_color_converter.converted_colors) == 2
@@ -0,0 +1,140 @@
+import pytest
+import sys
+from unittest.mock import MagicMock
+
+sys.modules.setdefault('bpy', MagicMock())
+
+from setup_wizard.material_data_import_setup import tooltip_binding_plan
+from setup_wizard.material_data_import_setup.tooltip_binding_plan import TooltipBindingPlan, ValueCoercion
+
+
+class NodeSocketBool:
+    default_value = False
+
+class NodeSocketInt:
+    default_value = 0
+
+class NodeSocketVector:
+    def __init__(self, length):
+        self.default_value = (0.0,) * length
+
+class NodeSocketFloat:
+    default_value = 0.0
+
+
+class InterfaceItem:
+    def __init__(self, name, description, item_type='SOCKET', identifier=None):
+        self.item_type = item_type
+        self.name = name
+        self.description = description
+        self.socket_type = 'NodeSocketFloat'
+        self.identifier = identifier
+
+
+class Interface:
+    def __init__(self, interface_items):
+        self.items_tree = MagicMock()
+        self.items_tree.values.return_value = interface_items
+
+
+class NodeTree:
+    def __init__(self, name, interface_items):
+        self.name = name
+        self.interface = Interface(interface_items)
+
+
+class Node:
+    def __init__(self, node_tree, inputs):
+        self.name = 'Group'
+        self.node_tree = node_tree
+        self.inputs = inputs
+
+
+@pytest.fixture(autouse=True)
+def socket_types(monkeypatch):
+    for socket_type in [NodeSocketBool, NodeSocketInt, NodeSocketVector]:
+        monkeypatch.setattr(tooltip_binding_plan.bpy.types, socket_type.__name__, socket_type, raising=False)
+    for interface_socket_type in ['NodeTreeInterfaceSocketBool', 'NodeTreeInterfaceSocketInt', 'NodeTreeInterfaceSocketVector']:
+        monkeypatch.setattr(tooltip_binding_plan.bpy.types, interface_socket_type, type(interface_socket_type, (), {}), raising=False)
+    TooltipBindingPlan.clear()
+    yield
+    TooltipBindingPlan.clear()
+
+
+@pytest.fixture
+def shader_node():
+    interface_items = [
+        InterfaceItem('Toggle Metallics', '_MetalMaterial'),
+        InterfaceItem('Material ID', ' _MaterialID '),
+        InterfaceItem('NS Scale', '_NSScale'),
+        InterfaceItem('Diffuse Scale', 'm_Scale (_MainTex)'),
+        InterfaceItem('Color', '_Color'),
+        InterfaceItem('Color Alpha', '_ColorAlpha'),
+    ]
+    inputs = {
+        'Toggle Metallics': NodeSocketBool(),
+        'Material ID': NodeSocketInt(),
+        'NS Scale': NodeSocketVector(3),
+        'Diffuse Scale': NodeSocketVector(3),
+        'Color': NodeSocketFloat(),
+        'Color Alpha': NodeSocketFloat(),
+    }
+    return Node(NodeTree('HoYoToon - Genshin Body', interface_items), inputs)
+
+
+def test_compile(shader_node):
+    plan = TooltipBindingPlan.get(shader_node, shader_node)
+
+    assert [(binding.socket_name, binding.material_data_key, binding.m_TexEnvs_key, binding.value_coercion) for binding in plan.bindings] == [
+        ('Toggle Metallics', '_MetalMaterial', None, ValueCoercion.BOOL),
+        ('Material ID', '_MaterialID', None, ValueCoercion.INT),
+        ('NS Scale', '_NSScale', None, ValueCoercion.VECTOR3),
+        ('Diffuse Scale', '_MainTex', 'm_Scale', ValueCoercion.VECTOR3),
+        ('Color', '_Color', None, ValueCoercion.NONE),
+        ('Color Alpha', '_ColorAlpha', None, ValueCoercion.NONE),
+    ]
+    assert plan.color_alpha_socket_name == 'Color Alpha'
+
+
+def test_plan_is_shared_by_nodes_using_the_same_node_tree(shader_node):
+    other_shader_node = Node(shader_node.node_tree, shader_node.inputs)
+
+    assert TooltipBindingPlan.get(shader_node, shader_node) is TooltipBindingPlan.get(other_shader_node, other_shader_node)
+
+
+def test_plan_is_recompiled_when_interface_changes(shader_node):
+    plan = TooltipBindingPlan.get(shader_node, shader_node)
+    shader_node.node_tree.interface.items_tree.values.return_value[0].description = '_UseMaterial2'
+
+    assert TooltipBindingPlan.get(shader_node, shader_node) is not plan
+
+
+def test_modifier_plan_binds_interface_sockets_by_identifier(monkeypatch):
+    NodeTreeInterfaceSocketVector = type('NodeTreeInterfaceSocketVector', (), {'default_value': (0.0, 0.0, 0.0)})
+    monkeypatch.setattr(tooltip_binding_plan.bpy.types, 'NodeTreeInterfaceSocketVector', NodeTreeInterfaceSocketVector)
+    outline_scale = InterfaceItem('Outline Scale', 'm_Scale (_OutlineTex)', identifier='Socket_2')
+    ns_scale = NodeTreeInterfaceSocketVector()
+    ns_scale.__dict__.update(vars(InterfaceItem('NS Scale', '_NSScale', identifier='Socket_3')))
+    node_group = NodeTree('HoYoverse - Outlines', [InterfaceItem('Color', '', item_type='PANEL'), outline_scale, ns_scale])
+
+    plan = TooltipBindingPlan.get_for_modifier(node_group)
+
+    assert [(binding.socket_identifier, binding.material_data_key, binding.m_TexEnvs_key, binding.value_coercion) for binding in plan.bindings] == [
+        ('Socket_2', '_OutlineTex', 'm_Scale', ValueCoercion.NONE),
+        ('Socket_3', '_NSScale', None, ValueCoercion.VECTOR3),
+    ]
+    assert TooltipBindingPlan.get_for_modifier(node_group) is plan
+
+
+@pytest.mark.parametrize("value_coercion, material_json_value, expected_value", [
+    (ValueCoercion.BOOL, 1.0, True),
+    (ValueCoercion.BOOL, 0.0, False),
+    (ValueCoercion.INT, 2.0, 3),  # Shader values are one-based while material data is zero-based indexing
+    (ValueCoercion.VECTOR3, (1.0, 2.0, 3.0, 4.0), (1.0, 2.0, 3.0)),
+    (ValueCoercion.VECTOR3, (1.0, 2.0, 3.0), (1.0, 2.0, 3.0)),
+    (ValueCoercion.NONE, 0.5, 0.5),
+])
+def test_coerce(value_coercion, material_json_value, expected_value):
+    binding = tooltip_binding_plan.TooltipBinding('Socket', '_Key', None, value_coercion)
+
+    assert binding.coerce(material_json_value) == expected_value
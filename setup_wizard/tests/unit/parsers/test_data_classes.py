@@ -0,0 +1,51 @@
+import pytest
+
+from setup_wizard.parsers.data_classes import MaterialData, MaterialDataPropertyIndex
+
+
+class TestMaterialData:
+    def test_attribute_access(self):
+        material_data = MaterialData({'_BumpMap': {'m_Texture': {'Name': 'Normalmap'}}})
+
+        assert material_data._BumpMap == {'m_Texture': {'Name': 'Normalmap'}}
+        assert getattr(material_data, '_Missing', None) is None
+        assert material_data._MTSharpLayerOffset == 1.0  # default value
+
+    @pytest.mark.parametrize("json_m_data", [
+        [{'Key': '_UseMaterial2', 'Value': 1.0}],
+        None,
+    ])
+    def test_unsupported_json_m_data_raises_attribute_error(self, json_m_data):
+        # Parsers rely on the AttributeError to detect an unsupported material data format
+        with pytest.raises(AttributeError):
+            MaterialData(json_m_data)
+
+
+class TestMaterialDataPropertyIndex:
+    @pytest.fixture
+    def property_index(self):
+        m_floats = MaterialData({'_Shared': 1.0, '_FloatOnly': 2.0, '_NoneFloat': None})
+        m_colors = MaterialData({'_Shared': (0.0, 0.0, 0.0, 1.0), '_Color': (1.0, 0.5, 0.25, 1.0), '_NoneFloat': (1.0, 1.0, 1.0, 1.0)})
+        m_texEnvs = MaterialData({'_Color': {'m_Texture': {}}, '_MainTex': {'m_Texture': {'Name': 'Diffuse'}}})
+        return MaterialDataPropertyIndex(m_floats, m_colors, m_texEnvs)
+
+    @pytest.mark.parametrize("key, expected_value", [
+        ('_Shared', 1.0),  # m_Floats takes precedence over m_Colors
+        ('_FloatOnly', 2.0),
+        ('_Color', (1.0, 0.5, 0.25, 1.0)),  # m_Colors takes precedence over m_TexEnvs
+        ('_MainTex', {'m_Texture': {'Name': 'Diffuse'}}),
+        ('_NoneFloat', (1.0, 1.0, 1.0, 1.0)),  # None falls back to the next lower precedence value
+        ('_MTSharpLayerOffset', 1.0),
+        ('_Missing', None),
+    ])
+    def test_get(self, property_index, key, expected_value):
+        assert property_index.get(key) == expected_value
+
+    def test_get_many(self, property_index):
+        assert property_index.get_many(['_FloatOnly', '_Missing', '_Shared']) == [2.0, None, 1.0]
+
+    def test_without_m_texEnvs(self):
+        property_index = MaterialDataPropertyIndex(MaterialData({'_FloatOnly': 2.0}), MaterialData({}))
+
+        assert property_index.get('_FloatOnly') == 2.0
+        assert '_MainTex' not in property_index
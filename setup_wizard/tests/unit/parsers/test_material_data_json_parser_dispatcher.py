@@ -0,0 +1,85 @@
+import pytest
+
+from setup_wizard.exceptions import UnsupportedMaterialDataJsonFormatException
+from setup_wizard.parsers.material_data_json_parser_dispatcher import MaterialDataJsonParserDispatcher
+from setup_wizard.parsers.material_data_json_parsers import HoyoStudioMaterialDataJsonParser, \
+    UABEMaterialDataJsonParser, UnknownHoyoStudioMaterialDataJsonParser
+
+
+PARSERS = [
+    HoyoStudioMaterialDataJsonParser,
+    UnknownHoyoStudioMaterialDataJsonParser,
+    UABEMaterialDataJsonParser,
+]
+
+HOYOSTUDIO_JSON = {
+    'm_SavedProperties': {
+        'm_Floats': {'_UseMaterial2': 1.0},
+        'm_Colors': {'_Color': {'r': 1.0, 'g': 0.5, 'b': 0.25, 'a': 1.0}},
+        'm_TexEnvs': {'_MainTex': {'m_Texture': {'m_PathID': 1234}}},
+    }
+}
+
+UNKNOWN_HOYOSTUDIO_JSON = {
+    'm_SavedProperties': {
+        'm_Floats': [{'Key': '_UseMaterial2', 'Value': 1.0}],
+        'm_Colors': [{'Key': '_Color', 'Value': {'R': 1.0, 'G': 0.5, 'B': 0.25, 'A': 1.0}}],
+        'm_TexEnvs': [{'Key': '_MainTex', 'Value': {'m_Texture': {'m_PathID': 1234}}}],
+    }
+}
+
+UABE_JSON = {
+    '0 Material Base': {
+        '0 UnityPropertySheet m_SavedProperties': {
+            '0 map m_Floats': {'0 Array Array': [
+                {'0 pair data': {'1 string first': '_UseMaterial2', '0 float second': 1.0}},
+            ]},
+            '0 map m_Colors': {'0 Array Array': [
+                {'0 pair data': {'1 string first': '_Color', '0 ColorRGBA second': {
+                    '0 float r': 1.0, '0 float g': 0.5, '0 float b': 0.25, '0 float a': 1.0,
+                }}},
+            ]},
+        }
+    }
+}
+
+
+@pytest.mark.parametrize("json_material_data, expected_parser_class", [
+    (HOYOSTUDIO_JSON, HoyoStudioMaterialDataJsonParser),
+    (UNKNOWN_HOYOSTUDIO_JSON, UnknownHoyoStudioMaterialDataJsonParser),
+    (UABE_JSON, UABEMaterialDataJsonParser),
+    ({'m_SavedProperties': {}}, None),
+    ({}, None),
+    ([], None),
+])
+def test_detect_parser_class(json_material_data, expected_parser_class):
+    assert MaterialDataJsonParserDispatcher.detect_parser_class(json_material_data) is expected_parser_class
+
+
+@pytest.mark.parametrize("json_material_data", [
+    HOYOSTUDIO_JSON,
+    UNKNOWN_HOYOSTUDIO_JSON,
+    UABE_JSON,
+])
+def test_parse(json_material_data):
+    parser = MaterialDataJsonParserDispatcher(PARSERS).parse(json_material_data)
+
+    assert parser.m_floats._UseMaterial2 == 1.0
+    assert parser.m_colors._Color == (1.0, 0.5, 0.25, 1.0)
+
+
+def test_parse_detects_format_of_every_file():
+    dispatcher = MaterialDataJsonParserDispatcher(PARSERS)
+
+    assert type(dispatcher.parse(HOYOSTUDIO_JSON)) is HoyoStudioMaterialDataJsonParser
+    assert type(dispatcher.parse(UABE_JSON)) is UABEMaterialDataJsonParser
+    assert type(dispatcher.parse(UNKNOWN_HOYOSTUDIO_JSON)) is UnknownHoyoStudioMaterialDataJsonParser
+
+
+@pytest.mark.parametrize("json_material_data", [
+    {'m_SavedProperties': {'m_Colors': {}, 'm_Floats': []}},
+    {'unsupported': 'format'},
+])
+def test_parse_unsupported_format(json_material_data):
+    with pytest.raises(UnsupportedMaterialDataJsonFormatException):
+        MaterialDataJsonParserDispatcher(PARSERS).parse(json_material_data)
@@ -0,0 +1,86 @@
+import json
+import os
+import sys
+from unittest.mock import MagicMock
+
+sys.modules.setdefault('bpy', MagicMock())
+
+import pytest
+
+from setup_wizard import import_order
+from setup_wizard.import_order import PipelinePlan, SETUP_WIZARD_CONFIG_FILEPATH, SETUP_WIZARD_UI_CONFIG_FILEPATH
+
+
+@pytest.fixture
+def ui_config_file_path(tmp_path):
+    ui_config_file_path = tmp_path / 'config_ui.json'
+    ui_config_file_path.write_text(json.dumps({
+        'ui_order': {
+            'GENSHIN_OT_set_up_materials': [
+                'IMPORTANT_PLACEHOLDER_VALUE_KEEP_INDEX_ABOVE_0_set_up_materials',
+                'import_materials',
+                'replace_default_materials',
+                'import_character_textures',
+            ],
+        }
+    }))
+    yield str(ui_config_file_path)
+    PipelinePlan.clear()
+
+
+@pytest.mark.parametrize("config_file_path", [SETUP_WIZARD_CONFIG_FILEPATH, SETUP_WIZARD_UI_CONFIG_FILEPATH])
+def test_shipped_configs_compile(config_file_path):
+    plan = PipelinePlan.compile(config_file_path)
+
+    for steps in plan.pipelines.values():
+        assert steps[0].operator is None
+        assert all(step.operator for step in steps[1:])
+
+
+def test_ui_config_steps_are_resolved(ui_config_file_path):
+    steps = PipelinePlan.get(ui_config_file_path).get_steps('GENSHIN_OT_set_up_materials')
+
+    assert [step.component_name for step in steps[1:]] == ['import_materials', 'replace_default_materials', 'import_character_textures']
+    assert all(step.enabled and not step.cache_key for step in steps)
+
+
+def test_plan_is_only_recompiled_when_revalidated_and_changed(ui_config_file_path):
+    plan = PipelinePlan.get(ui_config_file_path)
+    config_file_stat = os.stat(ui_config_file_path)
+    os.utime(ui_config_file_path, ns=(config_file_stat.st_atime_ns, config_file_stat.st_mtime_ns + 1))
+
+    assert PipelinePlan.get(ui_config_file_path) is plan
+    assert PipelinePlan.get(ui_config_file_path, revalidate=True) is not plan
+
+
+def test_step_transitions_use_compiled_plan(ui_config_file_path, monkeypatch):
+    monkeypatch.setattr(import_order, 'SETUP_WIZARD_UI_CONFIG_FILEPATH', ui_config_file_path)
+    monkeypatch.setattr(import_order, 'reload_blender_cache', MagicMock())
+    compile = MagicMock(side_effect=PipelinePlan.compile)
+    monkeypatch.setattr(PipelinePlan, 'compile', compile)
+
+    for step_index in range(3):
+        import_order.invoke_next_step_ui('GENSHIN_OT_set_up_materials', step_index)
+
+    assert compile.call_count == 1
+    steps = PipelinePlan.get(ui_config_file_path).get_steps('GENSHIN_OT_set_up_materials')
+    steps[3].operator.assert_called_with(
+        'EXEC_DEFAULT',
+        next_step_idx=3,
+        invoker_type='invoke_next_step_ui',
+        high_level_step_name='GENSHIN_OT_set_up_materials',
+        game_type='GENSHIN_IMPACT',
+    )
+
+
+def test_blender_cache_is_read_from_disk_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(import_order, 'BLENDER_ADDON_CONFIG_FILEPATH', str(tmp_path / 'character_setup_wizard.json'))
+    import_order.reload_blender_cache()
+
+    import_order.cache_using_cache_key(import_order.get_cache(), 'character_model_folder_file_path', 'C:/Furina')
+    os.remove(tmp_path / 'character_setup_wizard.json')
+
+    assert import_order.get_cache() == {'character_model_folder_file_path': 'C:/Furina'}
+    import_order.reload_blender_cache()
+    assert import_order.get_cache() == {}
+    import_order.reload_blender_cache()
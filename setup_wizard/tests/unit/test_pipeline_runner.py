@@ -0,0 +1,137 @@
+import sys
+from unittest.mock import MagicMock
+
+sys.modules.setdefault('bpy', MagicMock())
+
+import pytest
+
+from setup_wizard import import_order
+from setup_wizard.import_order import NextStepInvoker, PipelinePlan, PipelineRunner, PipelineStep, \
+    PIPELINE_RUNNER_INVOKER_TYPE, STEP_CANCELLED, STEP_FAILED, STEP_FINISHED, STEP_WAITING_FOR_INPUT
+
+HIGH_LEVEL_STEP_NAME = 'GENSHIN_OT_set_up_materials'
+
+
+class FakeOperator:
+    def __init__(self, result='FINISHED', opens_file_browser=False, error=None):
+        self.result = result
+        self.opens_file_browser = opens_file_browser
+        self.error = error
+        self.calls = []
+
+    def __call__(self, execution_context, next_step_idx, invoker_type, high_level_step_name, game_type):
+        self.calls.append(next_step_idx)
+        if self.error:
+            raise self.error
+        if not self.opens_file_browser and self.result == 'FINISHED':
+            NextStepInvoker().invoke(next_step_idx, invoker_type, high_level_step_name=high_level_step_name, game_type=game_type)
+        return {self.result}
+
+
+@pytest.fixture
+def create_pipeline(monkeypatch):
+    bpy = MagicMock()
+    monkeypatch.setattr(import_order, 'bpy', bpy)
+    monkeypatch.setattr(import_order, 'reload_blender_cache', MagicMock())
+
+    def create_pipeline(*operators):
+        steps = [PipelineStep('placeholder', True, '', None)] + \
+            [PipelineStep(f'step_{step_index}', True, '', operator) for step_index, operator in enumerate(operators, 1)]
+        monkeypatch.setattr(PipelinePlan, 'get', MagicMock(return_value=PipelinePlan('config_ui.json', 0, {HIGH_LEVEL_STEP_NAME: steps})))
+        return bpy
+    yield create_pipeline
+    PipelineRunner.active_runner = None
+    PipelineRunner.last_run = None
+
+
+def get_statuses(step_results):
+    return [step_result.status for step_result in step_results.values()]
+
+
+def test_steps_run_in_a_flat_loop(create_pipeline):
+    operators = [FakeOperator(), FakeOperator(), FakeOperator()]
+    bpy = create_pipeline(*operators)
+
+    step_results = PipelineRunner(HIGH_LEVEL_STEP_NAME, undo_grouping=True).run()
+
+    assert get_statuses(step_results) == [STEP_FINISHED] * 3
+    assert [operator.calls for operator in operators] == [[1], [2], [3]]
+    assert PipelineRunner.active_runner is None
+    bpy.ops.ed.undo_push.assert_called_once()
+
+
+def test_run_is_paused_for_file_browser_and_resumed(create_pipeline):
+    operators = [FakeOperator(), FakeOperator(opens_file_browser=True), FakeOperator()]
+    bpy = create_pipeline(*operators)
+    runner = PipelineRunner(HIGH_LEVEL_STEP_NAME, undo_grouping=True)
+
+    assert get_statuses(runner.run()) == [STEP_FINISHED, STEP_WAITING_FOR_INPUT]
+    assert PipelineRunner.active_runner is runner
+    assert operators[2].calls == []
+
+    NextStepInvoker().invoke(2, PIPELINE_RUNNER_INVOKER_TYPE, high_level_step_name=HIGH_LEVEL_STEP_NAME)  # file browser confirmed
+
+    assert get_statuses(runner.step_results) == [STEP_FINISHED] * 3
+    assert PipelineRunner.last_run is runner
+    bpy.ops.ed.undo_push.assert_not_called()  # not from inside the file browser's operator
+
+
+def test_undo_is_not_grouped_by_default(create_pipeline):
+    bpy = create_pipeline(FakeOperator())
+
+    PipelineRunner(HIGH_LEVEL_STEP_NAME).run()
+
+    bpy.ops.ed.undo_push.assert_not_called()
+
+
+def test_run_is_aborted_when_a_step_is_cancelled(create_pipeline):
+    operators = [FakeOperator(result='CANCELLED'), FakeOperator()]
+    bpy = create_pipeline(*operators)
+
+    step_results = PipelineRunner(HIGH_LEVEL_STEP_NAME, undo_grouping=True).run()
+
+    assert get_statuses(step_results) == [STEP_CANCELLED]
+    assert operators[1].calls == []
+    bpy.ops.ed.undo_push.assert_not_called()
+
+
+def test_failed_step_is_recorded_and_raised(create_pipeline):
+    create_pipeline(FakeOperator(), FakeOperator(error=RuntimeError('No armature')), FakeOperator())
+    runner = PipelineRunner(HIGH_LEVEL_STEP_NAME)
+
+    with pytest.raises(RuntimeError):
+        runner.run()
+
+    assert get_statuses(runner.step_results) == [STEP_FINISHED, STEP_FAILED]
+    assert runner.step_results[2].message == 'No armature'
+    assert PipelineRunner.active_runner is None
+
+
+def test_instrumentation_measures_steps_until_file_browser_completes(create_pipeline):
+    create_pipeline(FakeOperator(opens_file_browser=True), FakeOperator(result='CANCELLED'))
+    instrumentation = MagicMock()
+    runner = PipelineRunner(HIGH_LEVEL_STEP_NAME, instrumentation=instrumentation)
+
+    runner.run()
+    step_measurement = instrumentation.measure_step.return_value
+    step_measurement.stop.assert_not_called()
+    assert step_measurement.waited_for_input
+
+    NextStepInvoker().invoke(1, PIPELINE_RUNNER_INVOKER_TYPE, high_level_step_name=HIGH_LEVEL_STEP_NAME)
+
+    assert [call.args[0] for call in step_measurement.stop.call_args_list] == [STEP_FINISHED, STEP_CANCELLED]
+    instrumentation.start.assert_called_once()
+    instrumentation.write_report.assert_called_once()
+
+
+def test_profiler_profiles_steps_until_file_browser_completes(create_pipeline):
+    create_pipeline(FakeOperator(), FakeOperator(opens_file_browser=True))
+    profiler = MagicMock()
+    profiler.start.side_effect = lambda step_index, component_name: component_name
+    runner = PipelineRunner(HIGH_LEVEL_STEP_NAME, profiler=profiler)
+
+    runner.run()
+    assert [call.args[0] for call in profiler.stop.call_args_list] == ['step_1']
+
+    NextStepInvoker().invoke(2, PIPELINE_RUNNER_INVOKER_TYPE, high_level_step_name=HIGH_LEVEL_STEP_NAME)
+    assert [call.args[0] for call in profiler.stop.call_args_list] == ['step_1', 'step_2']
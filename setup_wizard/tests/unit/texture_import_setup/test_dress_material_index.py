@@ -0,0 +1,50 @@
+import sys
+from unittest.mock import MagicMock
+
+sys.modules.setdefault('bpy', MagicMock())
+
+from setup_wizard.texture_import_setup.dress_material_index import DressMaterialIndex
+
+
+def create_material(name, base_color_image_name=None):
+    material = MagicMock()
+    material.name = name
+    material.node_tree.nodes['Principled BSDF'].inputs['Base Color'].links[0].from_node.image.name_full = base_color_image_name
+    return material
+
+
+def test_npc_dress_materials_are_indexed_with_original_material_and_part():
+    shader_dress_material = create_material('HoYoverse - Genshin Dress')
+    original_dress_material = create_material('NPC_Lady_Hair_Dress_Mat')
+    materials = [
+        create_material('HoYoverse - Genshin Body'),
+        create_material('HoYoverse - Genshin Dress Outlines'),
+        shader_dress_material,
+        original_dress_material,
+    ]
+
+    dress_material_index = DressMaterialIndex.build(materials, 'HoYoverse - Genshin ', 'NPC')
+
+    assert dress_material_index.dress_entries == [(shader_dress_material, original_dress_material, 'Body')]
+    assert dress_material_index.cloak_entry is None
+
+
+def test_monster_dress_part_comes_from_original_texture():
+    shader_dress_material = create_material('HoYoverse - Genshin Dress')
+    original_dress_material = create_material(
+        'Monster_Fatuus_Agent_01_Fire_Dress_Mat', 'Monster_Fatuus_Agent_01_Fire_Tex_Diffuse.png'
+    )
+
+    dress_material_index = DressMaterialIndex.build(
+        [shader_dress_material, original_dress_material], 'HoYoverse - Genshin ', 'MONSTER'
+    )
+
+    assert dress_material_index.dress_entries == [(shader_dress_material, original_dress_material, 'Fire')]
+
+
+def test_missing_original_dress_material_is_indexed_as_none():
+    shader_dress_material = create_material('HoYoverse - Genshin Dress2')
+
+    dress_material_index = DressMaterialIndex.build([shader_dress_material], 'HoYoverse - Genshin ', 'NPC')
+
+    assert dress_material_index.dress_entries == [(shader_dress_material, None, None)]
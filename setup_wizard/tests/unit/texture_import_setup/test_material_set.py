@@ -0,0 +1,90 @@
+from unittest.mock import MagicMock
+
+from setup_wizard.domain.shader_material_names import V3_BonnyFestivityGenshinImpactMaterialNames
+from setup_wizard.texture_import_setup.material_set import MaterialSet
+
+
+def create_material(name):
+    material = MagicMock()
+    material.name = name
+    return material
+
+
+class Materials(dict):
+    '''Counts lookups, like a bpy.data.materials that is expensive to search'''
+    def __init__(self, names):
+        super().__init__((name, create_material(name)) for name in names)
+        self.lookups = 0
+
+    def get(self, name):
+        self.lookups += 1
+        return super().get(name)
+
+    def rename(self, name, new_name):
+        material = self.pop(name)
+        material.name = new_name
+        self[new_name] = material
+
+    def remove(self, name):
+        material = self.pop(name)
+        type(material).name = property(RemovedMaterial.name.fget)
+
+
+class RemovedMaterial:
+    '''Like a bpy.types.Material after bpy.data.materials.remove()'''
+    @property
+    def name(self):
+        raise ReferenceError('StructRNA of type Material has been removed')
+
+
+def test_materials_are_resolved_once():
+    materials = Materials(['HoYoverse - Genshin Hair', 'HoYoverse - Genshin Body'])
+    material_set = MaterialSet(materials)
+
+    for _ in range(25):
+        assert material_set.get(V3_BonnyFestivityGenshinImpactMaterialNames.HAIR) is materials['HoYoverse - Genshin Hair']
+        assert material_set.get(V3_BonnyFestivityGenshinImpactMaterialNames.GLASS) is None
+    assert materials.lookups == 2
+
+
+def test_get_returns_first_material_found():
+    materials = Materials(['HoYoverse - Genshin Effect'])
+    material_set = MaterialSet(materials)
+
+    assert material_set.get(
+        V3_BonnyFestivityGenshinImpactMaterialNames.EFFECT_HAIR,
+        V3_BonnyFestivityGenshinImpactMaterialNames.EFFECT,
+    ) is materials['HoYoverse - Genshin Effect']
+
+
+def test_materials_renamed_mid_run_are_resolved():
+    materials = Materials(['HoYoverse - Genshin Body', 'HoYoverse - Genshin Dress'])
+    material_set = MaterialSet(materials)
+    assert material_set.get(V3_BonnyFestivityGenshinImpactMaterialNames.DRESS) is \
+        materials['HoYoverse - Genshin Dress']
+
+    materials.rename('HoYoverse - Genshin Dress', 'Avatar_Lady_Sword_Furina_Mat_Dress')
+
+    assert material_set.get(V3_BonnyFestivityGenshinImpactMaterialNames.DRESS) is None
+
+
+def test_materials_removed_mid_run_are_not_returned():
+    materials = Materials(['HoYoverse - Genshin Hair'])
+    material_set = MaterialSet(materials)
+    assert material_set.get(V3_BonnyFestivityGenshinImpactMaterialNames.HAIR) is materials['HoYoverse - Genshin Hair']
+
+    materials.remove('HoYoverse - Genshin Hair')
+
+    assert material_set.get(V3_BonnyFestivityGenshinImpactMaterialNames.HAIR) is None
+
+
+def test_materials_created_mid_run_are_resolved():
+    materials = Materials([])
+    material_set = MaterialSet(materials)
+    assert material_set.get(V3_BonnyFestivityGenshinImpactMaterialNames.NIGHT_SOUL_OUTLINES) is None
+
+    materials[V3_BonnyFestivityGenshinImpactMaterialNames.NIGHT_SOUL_OUTLINES] = \
+        create_material(V3_BonnyFestivityGenshinImpactMaterialNames.NIGHT_SOUL_OUTLINES)
+
+    assert material_set.get(V3_BonnyFestivityGenshinImpactMaterialNames.NIGHT_SOUL_OUTLINES) is \
+        materials[V3_BonnyFestivityGenshinImpactMaterialNames.NIGHT_SOUL_OUTLINES]
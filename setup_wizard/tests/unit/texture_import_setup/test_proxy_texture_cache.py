@@ -0,0 +1,83 @@
+import sys
+from unittest.mock import MagicMock
+
+sys.modules.setdefault('bpy', MagicMock())
+
+import pytest
+
+from setup_wizard.texture_import_setup import proxy_texture_cache as proxy_texture_cache_module
+from setup_wizard.texture_import_setup.proxy_texture_cache import ProxyTextureCache
+from setup_wizard.texture_import_setup.texture_image_registry import TextureFileHasher
+
+
+class Image(dict):
+    def __init__(self, filepath):
+        super().__init__()
+        self.name = filepath.split('/')[-1]
+        self.filepath = filepath
+        self.filepath_raw = filepath
+        self.size = (2048, 1024)
+        self.alpha_mode = 'CHANNEL_PACKED'
+        self.colorspace_settings = MagicMock()
+        self.colorspace_settings.name = 'Non-Color'
+        self.scaled_size = None
+
+    def copy(self):
+        image = Image(self.filepath)
+        image.size = self.size
+        return image
+
+    def scale(self, width, height):
+        self.scaled_size = (width, height)
+
+    def save(self):
+        with open(self.filepath_raw, 'wb') as proxy_file:
+            proxy_file.write(repr(self.scaled_size).encode())
+
+
+@pytest.fixture
+def proxy_texture_cache(tmp_path, monkeypatch):
+    bpy = MagicMock()
+    bpy.path.abspath = lambda file_path: file_path
+    monkeypatch.setattr(proxy_texture_cache_module, 'bpy', bpy)
+    yield ProxyTextureCache(str(tmp_path / 'proxies'))
+    TextureFileHasher.clear()
+
+
+@pytest.fixture
+def lightmap_image(tmp_path):
+    lightmap_path = tmp_path / 'Avatar_Tex_Body_Lightmap.png'
+    lightmap_path.write_bytes(b'lightmap')
+    return Image(lightmap_path.as_posix())
+
+
+def test_proxy_is_created_once_per_source_and_scale(proxy_texture_cache, lightmap_image):
+    proxy_texture_cache.use_proxy(lightmap_image, 4)
+
+    proxy_file_path = proxy_texture_cache.get_proxy_file_path(lightmap_image['csw_full_resolution_filepath'], 4)
+    assert lightmap_image.filepath == proxy_file_path
+    assert open(proxy_file_path).read() == '(512, 256)'
+    assert proxy_texture_cache.get_proxy_file_path(lightmap_image['csw_full_resolution_filepath'], 2) != proxy_file_path
+
+
+def test_swapping_keeps_image_settings(proxy_texture_cache, lightmap_image):
+    full_resolution_file_path = lightmap_image.filepath
+
+    proxy_texture_cache.use_proxy(lightmap_image, 2)
+    assert proxy_texture_cache.is_proxy(lightmap_image)
+
+    proxy_texture_cache.use_full_resolution(lightmap_image)
+    assert not proxy_texture_cache.is_proxy(lightmap_image)
+    assert lightmap_image.filepath == full_resolution_file_path
+    assert lightmap_image.alpha_mode == 'CHANNEL_PACKED'
+    assert lightmap_image.colorspace_settings.name == 'Non-Color'
+
+    proxy_texture_cache.use_proxy(lightmap_image, 2)
+    assert lightmap_image['csw_full_resolution_filepath'] == full_resolution_file_path
+
+
+def test_only_proxied_images_are_swappable(proxy_texture_cache, lightmap_image, tmp_path):
+    other_image = Image((tmp_path / 'Other.png').as_posix())
+    proxy_texture_cache.use_proxy(lightmap_image, 2)
+
+    assert proxy_texture_cache.get_swappable_images([lightmap_image, other_image]) == [lightmap_image]
@@ -0,0 +1,112 @@
+import pytest
+
+from setup_wizard.tests.benchmarks.benchmark_texture_filename_classifier import TEXTURE_NAMES_BY_CLASSIFIER
+from setup_wizard.texture_import_setup.texture_filename_classifier import TextureClassification, TextureFilenameClassifier, \
+    TextureFilenameRule, TextureKind, UNCLASSIFIED_TEXTURE, genshin_avatar_texture_filename_classifier, \
+    genshin_monster_texture_filename_classifier, genshin_npc_texture_filename_classifier, \
+    honkai_star_rail_avatar_texture_filename_classifier, punishing_gray_raven_avatar_texture_filename_classifier
+
+
+@pytest.mark.parametrize("texture_name, expected_classification", [
+    ('Avatar_Lady_Sword_Furina_Tex_Hair_Diffuse.png', (TextureKind.DIFFUSE, 'Hair')),
+    ('Avatar_Girl_Sword_Skirk_Tex_EffectHair_Diffuse.png', (TextureKind.DIFFUSE, 'EffectHair')),
+    ('Avatar_Girl_Sword_Skirk_Tex_Effect_Diffuse.png', (TextureKind.DIFFUSE, 'Effect')),
+    ('Avatar_Lady_Sword_Furina_Tex_Hair_Normalmap.png', (TextureKind.NORMALMAP, 'Hair')),
+    ('Avatar_Boy_Sword_Kaveh_Tex_Body1_Diffuse.png', (TextureKind.DIFFUSE, 'Body1')),
+    ('Avatar_Boy_Sword_Kaveh_Tex_Body2_Lightmap.png', (TextureKind.LIGHTMAP, 'Body2')),
+    ('Avatar_Boy_Sword_Kaveh_Tex_Body2_Shadow_Ramp.png', (TextureKind.SHADOW_RAMP, 'Body2')),
+    ('Avatar_Boy_Sword_Kaveh_Tex_Body1_Shadow_Ramp.png', (TextureKind.SHADOW_RAMP, 'Body')),
+    ('Avatar_Tex_Specular_Ramp.png', (TextureKind.SPECULAR_RAMP, 'Body')),
+    ('Avatar_Lady_Tex_FaceLightmap.png', (TextureKind.FACE_LIGHTMAP, 'Face')),
+    ('Avatar_Boy_Polearm_Xiao_Tex_Gauntlet_Ligntmap.png', (TextureKind.LIGHTMAP, 'Gauntlet')),
+    ('Avatar_Girl_Claymore_Mualani_Tex_NyxState_Ramp.png', (TextureKind.NYX_RAMP, None)),
+    ('avatar_tex_body_diffuse.png', UNCLASSIFIED_TEXTURE),  # 'Body_Diffuse' is case sensitive
+    ('Avatar_Lady_Sword_Furina_Tex_Unknown.png', UNCLASSIFIED_TEXTURE),
+])
+def test_genshin_avatar_classification(texture_name, expected_classification):
+    assert genshin_avatar_texture_filename_classifier.classify(texture_name) == expected_classification
+
+
+def test_npc_face_lightmap_is_face_shadow_unless_folder_has_face_shadow():
+    texture_name = 'NPC_Lady_Tex_Face_Lightmap.png'
+    classifier = genshin_npc_texture_filename_classifier
+
+    assert classifier.classify(texture_name, classifier.get_folder_context([texture_name])) == \
+        (TextureKind.FACE_SHADOW, 'Face')
+    assert classifier.classify(texture_name, classifier.get_folder_context([texture_name, 'NPC_Tex_Face_Shadow.png'])) == \
+        (TextureKind.FACE_LIGHTMAP, 'Face')
+
+
+@pytest.mark.parametrize("files, expected_classification", [
+    (['Monster_Slime_Tex_Diffuse.png'], (TextureKind.DIFFUSE, 'Body')),
+    (['Monster_Slime_Tex_Diffuse.png', 'Monster_Slime_Tex_Hair_Lightmap.png'], (TextureKind.DIFFUSE, 'Hair')),
+    (['Monster_Slime_Tex_Diffuse.png', 'Monster_Slime_Tex_Hair_Lightmap.png', 'Monster_Slime_Body.png'], UNCLASSIFIED_TEXTURE),
+])
+def test_monster_tex_diffuse_depends_on_folder(files, expected_classification):
+    classifier = genshin_monster_texture_filename_classifier
+
+    assert classifier.classify(files[0], classifier.get_folder_context(files)) == expected_classification
+
+
+@pytest.mark.parametrize("texture_name, expected_classification", [
+    ('Avatar_Kafka_00_Hair_Color.png', (TextureKind.DIFFUSE, 'Hair')),
+    ('Avatar_Kafka_00_Body_Warm_Ramp.png', (TextureKind.WARM_RAMP, 'Body')),
+    ('Avatar_Kafka_00_Weapon_Ramp.png', (TextureKind.RAMP, 'Weapon')),
+    ('Avatar_Kafka_00_Body_Stockings.png', (TextureKind.STOCKINGS, 'Body')),
+    ('Avatar_Firefly_00_Body1_Stockings.png', (TextureKind.STOCKINGS, 'Body1')),
+    ('Avatar_Firefly_00_Stockings.png', (TextureKind.STOCKINGS, None)),
+    ('Avatar_Asta_00_Weapon_LigthMap.png', (TextureKind.LIGHTMAP, 'Weapon')),
+    ('Avatar_Pela_00_Weapon_Screen_Color.png', (TextureKind.DIFFUSE, None)),
+    ('W_140_Maid_FaceMap_00.png', (TextureKind.FACEMAP, 'Face')),
+])
+def test_honkai_star_rail_avatar_classification(texture_name, expected_classification):
+    assert honkai_star_rail_avatar_texture_filename_classifier.classify(texture_name) == expected_classification
+
+
+@pytest.mark.parametrize("texture_name, expected_classification", [
+    ('R3LifuMd019011Eye.png', (TextureKind.EYE, 'Eye')),
+    ('R3LifuMd019011EyeHET.png', UNCLASSIFIED_TEXTURE),
+    ('R3LifuMd019011Eyehet.png', (TextureKind.EYE, 'Eye')),
+    ('R3LifuMd019011Body_AO.png', (TextureKind.AO, None)),
+    ('R3LifuMd019011Face_HEAO.png', (TextureKind.HEAO, 'Face')),
+    ('R3LifuMd019011Face_Skin.png', (TextureKind.LUT, 'Face')),
+])
+def test_punishing_gray_raven_avatar_classification(texture_name, expected_classification):
+    assert punishing_gray_raven_avatar_texture_filename_classifier.classify(texture_name) == expected_classification
+
+
+@pytest.mark.parametrize("classifier, texture_names", TEXTURE_NAMES_BY_CLASSIFIER)
+def test_compiled_rules_match_rule_by_rule_checks(classifier, texture_names):
+    folder_contexts = [frozenset(), classifier.get_folder_context(texture_names)]
+    for folder_context in folder_contexts:
+        for texture_name in texture_names + [texture_name.lower() for texture_name in texture_names]:
+            assert classifier.classify(texture_name, folder_context) == \
+                classifier.classify_sequentially(texture_name, folder_context), texture_name
+
+
+def test_first_matching_rule_wins():
+    classifier = TextureFilenameClassifier([
+        TextureFilenameRule(TextureKind.DIFFUSE, 'Hair', all_of=['Hair', 'Diffuse']),
+        TextureFilenameRule(TextureKind.DIFFUSE, 'Body', all_of=['Diffuse']),
+    ])
+
+    assert classifier.classify('Tex_Hair_Diffuse.png') == TextureClassification(TextureKind.DIFFUSE, 'Hair')
+    assert classifier.classify('Tex_Body_Diffuse.png') == TextureClassification(TextureKind.DIFFUSE, 'Body')
+
+
+def test_identifiers_are_escaped():
+    classifier = TextureFilenameClassifier([TextureFilenameRule(TextureKind.DIFFUSE, all_of=['Tex.Diffuse'])])
+
+    assert classifier.classify('Tex.Diffuse.png') == (TextureKind.DIFFUSE, None)
+    assert classifier.classify('Tex_Diffuse.png') == UNCLASSIFIED_TEXTURE
+
+
+def test_classifications_are_memoized():
+    classifier = TextureFilenameClassifier([TextureFilenameRule(TextureKind.DIFFUSE, all_of=['Diffuse'])])
+    classifier.classify('Tex_Diffuse.png')
+    classifier.classify('Tex_Diffuse.png')
+    classifier.classify('Tex_Lightmap.png')
+
+    assert len(classifier.classifications) == 2
+    classifier.clear()
+    assert not classifier.classifications
@@ -0,0 +1,82 @@
+import struct
+import sys
+import zlib
+from unittest.mock import MagicMock
+
+sys.modules.setdefault('bpy', MagicMock())
+
+import pytest
+
+from setup_wizard.texture_import_setup.texture_header_prefetcher import InvalidTextureHeaderError, TextureHeader, \
+    TextureHeaderPrefetcher, TextureHeaderReader
+
+
+def create_png_chunk(chunk_type, data):
+    return struct.pack('>I', len(data)) + chunk_type + data + struct.pack('>I', zlib.crc32(chunk_type + data))
+
+
+def create_png(width, height, bit_depth, color_type, chunks=()):
+    image_header = struct.pack('>IIBBBBB', width, height, bit_depth, color_type, 0, 0, 0)
+    return b'\x89PNG\r\n\x1a\n' + create_png_chunk(b'IHDR', image_header) + \
+        b''.join(create_png_chunk(chunk_type, data) for chunk_type, data in chunks) + \
+        create_png_chunk(b'IDAT', b'') + create_png_chunk(b'IEND', b'')
+
+
+def create_tga(width, height, pixel_depth, alpha_bits):
+    return bytes([0, 0, 2]) + bytes(9) + struct.pack('<HHBB', width, height, pixel_depth, alpha_bits) + bytes(16)
+
+
+def create_jpg(width, height):
+    application_segment = b'\xff\xe0' + struct.pack('>H', 16) + b'JFIF\x00' + bytes(9)
+    start_of_frame_segment = b'\xff\xc0' + struct.pack('>HBHHB', 17, 8, height, width, 3) + bytes(9)
+    return b'\xff\xd8' + application_segment + start_of_frame_segment + b'\xff\xd9'
+
+
+@pytest.mark.parametrize("file_name, contents, expected_header", [
+    ('Avatar_Tex_Body_Lightmap.png', create_png(2048, 1024, 8, 6), TextureHeader(2048, 1024, 8, 4, True)),
+    ('Avatar_Tex_Body_Normalmap.png', create_png(1024, 1024, 16, 2), TextureHeader(1024, 1024, 16, 3, False)),
+    ('Avatar_Tex_Face_Shadow.png', create_png(256, 256, 8, 3, [(b'PLTE', bytes(6)), (b'tRNS', b'\x00')]), TextureHeader(256, 256, 8, 4, True)),
+    ('R3LifuMd019011Eye.tga', create_tga(512, 256, 32, 8), TextureHeader(512, 256, 8, 4, True)),
+    ('R3LifuMd019011Body.tga', create_tga(512, 256, 24, 0), TextureHeader(512, 256, 8, 3, False)),
+    ('Avatar_Tex_Body_Diffuse.jpg', create_jpg(640, 480), TextureHeader(640, 480, 8, 3, False)),
+])
+def test_texture_headers_are_read(tmp_path, file_name, contents, expected_header):
+    (tmp_path / file_name).write_bytes(contents)
+
+    assert TextureHeaderReader.read(str(tmp_path / file_name)) == expected_header
+
+
+@pytest.mark.parametrize("file_name, contents", [
+    ('Avatar_Tex_Body_Diffuse.png', b'not a png'),
+    ('Avatar_Tex_Body_Diffuse.png', create_png(2048, 1024, 8, 6)[:20]),
+    ('Avatar_Tex_Body_Diffuse.tga', bytes(10)),
+    ('Avatar_Tex_Body_Diffuse.jpg', b'\xff\xd8\xff\xe0\x00'),
+])
+def test_corrupt_textures_are_invalid(tmp_path, file_name, contents):
+    (tmp_path / file_name).write_bytes(contents)
+
+    with pytest.raises(InvalidTextureHeaderError):
+        TextureHeaderPrefetcher().get_header(str(tmp_path / file_name))
+
+
+def test_prefetched_headers_are_cached_until_file_changes(tmp_path):
+    texture_path = tmp_path / 'Avatar_Tex_Body_Lightmap.png'
+    texture_path.write_bytes(create_png(2048, 1024, 8, 6))
+    texture_header_prefetcher = TextureHeaderPrefetcher(max_workers=2)
+
+    texture_header_prefetcher.prefetch([str(texture_path)], warm_page_cache=False)
+    assert texture_header_prefetcher.get_header(str(texture_path)) == TextureHeader(2048, 1024, 8, 4, True)
+    assert texture_header_prefetcher.get_cached_header(str(texture_path)).width == 2048
+
+    texture_path.write_bytes(create_png(1024, 512, 8, 2) + b'resized')
+    assert texture_header_prefetcher.get_cached_header(str(texture_path)) is None
+    assert texture_header_prefetcher.get_header(str(texture_path)) == TextureHeader(1024, 512, 8, 3, False)
+    texture_header_prefetcher.clear()
+
+
+def test_missing_textures_are_invalid(tmp_path):
+    texture_header_prefetcher = TextureHeaderPrefetcher(max_workers=1)
+    texture_header_prefetcher.prefetch([str(tmp_path / 'Missing.png')])
+
+    assert not texture_header_prefetcher.is_valid_texture(str(tmp_path / 'Missing.png'))
+    texture_header_prefetcher.clear()
@@ -0,0 +1,98 @@
+import sys
+from unittest.mock import MagicMock
+
+sys.modules.setdefault('bpy', MagicMock())
+
+import pytest
+
+from setup_wizard.texture_import_setup import texture_image_registry as texture_image_registry_module
+from setup_wizard.texture_import_setup.texture_image_registry import TextureFileHasher, TextureImageRegistry
+
+
+class Image:
+    def __init__(self, name):
+        self.name = name
+        self.size = (256, 256)
+        self.channels = 4
+        self.is_float = False
+
+
+class Images(dict):
+    def __init__(self):
+        super().__init__()
+        self.number_of_loads = 0
+
+    def load(self, filepath, check_existing):
+        self.number_of_loads += 1
+        name = filepath.replace('\\', '/').split('/')[-1]
+        return self.setdefault(name, Image(name))
+
+
+@pytest.fixture
+def images(monkeypatch):
+    images = Images()
+    bpy = MagicMock()
+    bpy.data.images = images
+    monkeypatch.setattr(texture_image_registry_module, 'bpy', bpy)
+    yield images
+    TextureFileHasher.clear()
+
+
+def test_identical_textures_share_one_image(tmp_path, images):
+    (tmp_path / 'Costume').mkdir()
+    (tmp_path / 'Avatar_Tex_Body_Shadow_Ramp.png').write_bytes(b'ramp')
+    (tmp_path / 'Costume' / 'Avatar_Tex_Body_Shadow_Ramp.png').write_bytes(b'ramp')
+    (tmp_path / 'Avatar_Tex_Hair_Shadow_Ramp.png').write_bytes(b'other ramp')
+    texture_image_registry = TextureImageRegistry()
+
+    body_shadow_ramp = texture_image_registry.load(str(tmp_path / 'Avatar_Tex_Body_Shadow_Ramp.png'))
+    costume_body_shadow_ramp = texture_image_registry.load(str(tmp_path / 'Costume' / 'Avatar_Tex_Body_Shadow_Ramp.png'))
+    hair_shadow_ramp = texture_image_registry.load(str(tmp_path / 'Avatar_Tex_Hair_Shadow_Ramp.png'))
+
+    assert costume_body_shadow_ramp is body_shadow_ramp
+    assert hair_shadow_ramp is not body_shadow_ramp
+    assert images.number_of_loads == 2
+    assert texture_image_registry.memory_saved == 256 * 256 * 4
+
+
+def test_identical_textures_with_different_filenames_are_not_shared(tmp_path, images):
+    (tmp_path / 'Avatar_Lady_Sword_Furina_Tex_Body_Lightmap.png').write_bytes(b'lightmap')
+    (tmp_path / 'Avatar_Lady_Sword_Furina_Tex_Dress_Lightmap.png').write_bytes(b'lightmap')
+    texture_image_registry = TextureImageRegistry()
+
+    body_lightmap = texture_image_registry.load(str(tmp_path / 'Avatar_Lady_Sword_Furina_Tex_Body_Lightmap.png'))
+    dress_lightmap = texture_image_registry.load(str(tmp_path / 'Avatar_Lady_Sword_Furina_Tex_Dress_Lightmap.png'))
+
+    assert dress_lightmap is not body_lightmap
+    assert texture_image_registry.get_source_filename(dress_lightmap) == 'Avatar_Lady_Sword_Furina_Tex_Dress_Lightmap.png'
+    assert texture_image_registry.memory_saved == 0
+
+
+def test_removed_images_are_loaded_again(tmp_path, images):
+    (tmp_path / 'Costume').mkdir()
+    (tmp_path / 'Avatar_Tex_Body_Lightmap.png').write_bytes(b'lightmap')
+    (tmp_path / 'Costume' / 'Avatar_Tex_Body_Lightmap.png').write_bytes(b'lightmap')
+    texture_image_registry = TextureImageRegistry()
+
+    body_lightmap = texture_image_registry.load(str(tmp_path / 'Avatar_Tex_Body_Lightmap.png'))
+    del images[body_lightmap.name]
+
+    assert texture_image_registry.load(str(tmp_path / 'Costume' / 'Avatar_Tex_Body_Lightmap.png')) is not body_lightmap
+    assert images.number_of_loads == 2
+    assert texture_image_registry.memory_saved == 0
+
+
+def test_hashes_are_cached_until_file_changes(tmp_path, monkeypatch):
+    texture_path = tmp_path / 'Avatar_Tex_Body_Diffuse.png'
+    texture_path.write_bytes(b'diffuse')
+    compute_hash = MagicMock(side_effect=TextureFileHasher.compute_hash)
+    monkeypatch.setattr(TextureFileHasher, 'compute_hash', compute_hash)
+
+    first_hash = TextureFileHasher.get_hash(str(texture_path))
+    assert TextureFileHasher.get_hash(str(texture_path)) == first_hash
+    assert compute_hash.call_count == 1
+
+    texture_path.write_bytes(b'new diffuse')
+    assert TextureFileHasher.get_hash(str(texture_path)) != first_hash
+    assert compute_hash.call_count == 2
+    TextureFileHasher.clear()
@@ -0,0 +1,114 @@
+import json
+import struct
+import sys
+import zlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+sys.modules.setdefault('bpy', MagicMock())
+
+import pytest
+
+from setup_wizard.texture_import_setup import texture_memory_report as texture_memory_report_module
+from setup_wizard.texture_import_setup.texture_image_registry import TextureFileHasher
+from setup_wizard.texture_import_setup.texture_memory_report import TextureMemoryReporter
+
+
+def create_png(width, height, bit_depth, color_type, image_data=b''):
+    def create_png_chunk(chunk_type, data):
+        return struct.pack('>I', len(data)) + chunk_type + data + struct.pack('>I', zlib.crc32(chunk_type + data))
+
+    image_header = struct.pack('>IIBBBBB', width, height, bit_depth, color_type, 0, 0, 0)
+    return b'\x89PNG\r\n\x1a\n' + create_png_chunk(b'IHDR', image_header) + create_png_chunk(b'IDAT', image_data)
+
+
+class Image(dict):
+    def __init__(self, name, filepath):
+        super().__init__()
+        self.name = name
+        self.filepath = filepath
+
+    def __bool__(self):
+        return True  # an image without custom properties is still an image
+
+
+def create_image_node(name, image):
+    return SimpleNamespace(name=name, type='TEX_IMAGE', image=image)
+
+
+def create_material(name, nodes):
+    return SimpleNamespace(name=name, node_tree=SimpleNamespace(name=f'{name} Node Tree', nodes=nodes))
+
+
+@pytest.fixture
+def images(tmp_path, monkeypatch):
+    bpy = MagicMock()
+    bpy.path.abspath = lambda file_path: file_path
+    monkeypatch.setattr(texture_memory_report_module, 'bpy', bpy)
+
+    (tmp_path / 'Costume').mkdir()
+    texture_files = {
+        'Body_Diffuse': ('Avatar_Tex_Body_Diffuse.png', create_png(4096, 4096, 8, 6, b'body diffuse')),
+        'Body_Lightmap': ('Avatar_Tex_Body_Lightmap.png', create_png(2048, 2048, 8, 6, b'body lightmap')),
+        'Body_Normalmap': ('Avatar_Tex_Body_Normalmap.png', create_png(2048, 2048, 16, 2, b'body normalmap')),
+        'Body_Shadow_Ramp': ('Avatar_Tex_Body_Shadow_Ramp.png', create_png(256, 20, 8, 6, b'ramp')),
+        'Costume_Shadow_Ramp': ('Costume/Avatar_Tex_Body_Shadow_Ramp.png', create_png(256, 20, 8, 6, b'ramp')),
+    }
+    images = {}
+    for image_name, (file_name, contents) in texture_files.items():
+        (tmp_path / file_name).write_bytes(contents)
+        images[image_name] = Image(image_name, str(tmp_path / file_name))
+    yield images
+    TextureFileHasher.clear()
+
+
+def test_report_groups_textures_by_material_and_role(images):
+    shadow_ramp_node_group = SimpleNamespace(name='Body Shadow Ramp', nodes=[
+        create_image_node('Body_Shadow_Ramp', images['Body_Shadow_Ramp']),
+    ])
+    body_material = create_material('HoYoverse - Genshin Body', [
+        create_image_node('Body_Diffuse_UV0', images['Body_Diffuse']),
+        create_image_node('Body_Lightmap_UV0', images['Body_Lightmap']),
+        create_image_node('Body_Normalmap_UV0', images['Body_Normalmap']),
+        SimpleNamespace(name='Body Shadow Ramp', type='GROUP', node_tree=shadow_ramp_node_group),
+    ])
+
+    report = TextureMemoryReporter().create_report([body_material])
+
+    assert report['materials']['HoYoverse - Genshin Body']['textures'] == {
+        'Diffuse': ['Body_Diffuse'],
+        'Lightmap': ['Body_Lightmap'],
+        'Normalmap': ['Body_Normalmap'],
+        'Ramp': ['Body_Shadow_Ramp'],
+    }
+    assert report['images']['Body_Lightmap']['estimated_cpu_bytes'] == 2048 * 2048 * 4
+    assert report['images']['Body_Normalmap']['estimated_cpu_bytes'] == 2048 * 2048 * 4 * 4  # 16-bit is a float buffer
+    assert report['images']['Body_Normalmap']['estimated_gpu_bytes'] == int(2048 * 2048 * 4 * 2 * 4 / 3)
+    assert report['oversized_images'] == ['Body_Diffuse']
+    assert report['total_estimated_cpu_bytes'] == report['materials']['HoYoverse - Genshin Body']['estimated_cpu_bytes']
+
+
+def test_identical_textures_are_flagged_as_duplicates(images):
+    body_material = create_material('HoYoverse - Genshin Body', [
+        create_image_node('Body_Shadow_Ramp', images['Body_Shadow_Ramp']),
+    ])
+    costume_material = create_material('HoYoverse - Genshin Dress', [
+        create_image_node('Body_Shadow_Ramp', images['Costume_Shadow_Ramp']),
+    ])
+
+    report = TextureMemoryReporter().create_report([body_material, costume_material])
+
+    assert report['duplicate_images'] == ['Costume_Shadow_Ramp']
+    assert report['images']['Costume_Shadow_Ramp']['duplicate_of'] == 'Body_Shadow_Ramp'
+
+
+def test_report_is_exported_as_json(images, tmp_path):
+    body_material = create_material('HoYoverse - Genshin Body', [
+        create_image_node('Body_Lightmap_UV0', images['Body_Lightmap']),
+    ])
+    report_file_path = str(tmp_path / 'reports' / 'texture_memory_report.json')
+
+    TextureMemoryReporter.write_json(TextureMemoryReporter().create_report([body_material]), report_file_path)
+
+    with open(report_file_path) as report_file:
+        assert json.load(report_file)['images']['Body_Lightmap']['width'] == 2048
@@ -0,0 +1,73 @@
+import os
+import pytest
+
+from setup_wizard.utils.character_folder_manifest import CharacterFolderManifest
+
+
+@pytest.fixture
+def character_folder(tmp_path):
+    for file_name in [
+        'Furina.fbx',
+        'Avatar_Lady_Sword_Furina_Tex_Body_Diffuse.png',
+        'Avatar_Lady_Sword_Furina_Tex_Body_Lightmap.png',
+        'Avatar_Lady_Sword_Furina_Tex_Hair_Ligntmap.png',
+        'Avatar_Lady_Sword_Furina_Tex_Body_Shadow_Ramp.png',
+    ]:
+        (tmp_path / file_name).touch()
+    (tmp_path / 'Materials').mkdir()
+    (tmp_path / 'Materials' / 'Avatar_Lady_Sword_Furina_Mat_Body.json').touch()
+    (tmp_path / 'Materials' / 'Avatar_Lady_Sword_Furina_Mat_Hair.json').touch()
+    (tmp_path / 'Dress').mkdir()
+    (tmp_path / 'Dress' / 'Avatar_Lady_Sword_Furina_Tex_Dress_Diffuse.png').touch()
+
+    yield tmp_path
+    CharacterFolderManifest.clear()
+
+
+def test_walk_matches_os_walk(character_folder):
+    manifest = CharacterFolderManifest.get(str(character_folder))
+
+    assert [(path, sorted(folder_names), sorted(file_names)) for path, folder_names, file_names in manifest.walk()] == \
+        [(path, sorted(folder_names), sorted(file_names)) for path, folder_names, file_names in os.walk(str(character_folder))]
+
+
+def test_files_are_bucketed_by_role(character_folder):
+    manifest = CharacterFolderManifest.get(str(character_folder))
+
+    assert manifest.fbx_files == [os.path.join(str(character_folder), 'Furina.fbx')]
+    assert len(manifest.texture_files) == 5
+    assert manifest.material_data_directory == os.path.join(str(character_folder), 'Materials')
+    assert sorted(manifest.material_data_files) == [
+        'Avatar_Lady_Sword_Furina_Mat_Body.json',
+        'Avatar_Lady_Sword_Furina_Mat_Hair.json',
+    ]
+
+
+def test_dress_textures_are_flagged_per_folder(character_folder):
+    manifest = CharacterFolderManifest.get(str(character_folder))
+
+    assert manifest.has_dress_textures
+    assert not manifest.get_folder(str(character_folder)).has_dress_textures
+    assert manifest.get_folder(str(character_folder / 'Dress')).has_dress_textures
+
+
+def test_manifest_is_reused_until_a_folder_changes(character_folder):
+    manifest = CharacterFolderManifest.get(str(character_folder))
+
+    assert CharacterFolderManifest.get(str(character_folder)) is manifest
+
+    (character_folder / 'Materials' / 'Avatar_Lady_Sword_Furina_Mat_Face.json').touch()
+    materials_folder_stat = os.stat(character_folder / 'Materials')
+    os.utime(character_folder / 'Materials', ns=(materials_folder_stat.st_atime_ns, materials_folder_stat.st_mtime_ns + 1))
+    rescanned_manifest = CharacterFolderManifest.get(str(character_folder))
+
+    assert rescanned_manifest is not manifest
+    assert 'Avatar_Lady_Sword_Furina_Mat_Face.json' in rescanned_manifest.material_data_files
+
+
+def test_entry_names_fall_back_to_listdir_outside_of_manifest(character_folder, tmp_path_factory):
+    other_folder = tmp_path_factory.mktemp('other')
+    (other_folder / 'Avatar_Lady_Sword_Furina_Mat_Face.json').touch()
+    manifest = CharacterFolderManifest.get(str(character_folder))
+
+    assert manifest.get_entry_names(str(other_folder)) == ['Avatar_Lady_Sword_Furina_Mat_Face.json']
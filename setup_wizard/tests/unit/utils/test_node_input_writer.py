@@ -0,0 +1,64 @@
+import pytest
+
+from setup_wizard.utils.node_input_writer import NodeInputWriter
+
+
+class NodeInput:
+    def __init__(self, default_value):
+        self.default_value = default_value
+        self.number_of_writes = 0
+
+    def __setattr__(self, name, value):
+        if name == 'default_value':
+            self.__dict__['number_of_writes'] = self.__dict__.get('number_of_writes', -1) + 1
+        super().__setattr__(name, value)
+
+
+@pytest.mark.parametrize("current_value, value, expected_write", [
+    (1.0, 1.0, False),
+    (1.0, 1.0 + 1e-9, False),
+    (1.0, 1.1, True),
+    (True, 1.0, False),
+    (False, True, True),
+    (2, 2, False),
+    ([1.0, 0.5, 0.25, 1.0], (1.0, 0.5, 0.25, 1.0), False),
+    ([1.0, 0.5, 0.25, 1.0], (1.0, 0.5, 0.3, 1.0), True),
+    ([1.0, 0.5, 0.25], (1.0, 0.5, 0.25, 1.0), True),
+    ('Emission', 'Emission', False),
+    (None, 1.0, True),
+])
+def test_write_only_on_change(current_value, value, expected_write):
+    node_input = NodeInput(current_value)
+    node_input_writer = NodeInputWriter()
+
+    assert node_input_writer.write(node_input, value, 'Body') is expected_write
+    assert node_input.number_of_writes == int(expected_write)
+    assert node_input.default_value == (value if expected_write else current_value)
+
+
+def test_write_raises_on_missing_input():
+    with pytest.raises(AttributeError):
+        NodeInputWriter().write(None, 1.0, 'Body')
+
+
+def test_write_property():
+    modifier = {'Socket_1': 0.5}
+    node_input_writer = NodeInputWriter()
+
+    assert not node_input_writer.write_property(modifier, 'Socket_1', 0.5, 'Body Outlines')
+    assert node_input_writer.write_property(modifier, 'Socket_2', 1.0, 'Body Outlines')
+    assert modifier == {'Socket_1': 0.5, 'Socket_2': 1.0}
+
+
+def test_statistics_per_material():
+    node_input_writer = NodeInputWriter()
+
+    node_input_writer.write(NodeInput(0.0), 1.0, 'Body')
+    node_input_writer.write(NodeInput(1.0), 1.0, 'Body')
+    node_input_writer.write(NodeInput(1.0), 1.0, 'Hair')
+
+    assert (node_input_writer.get_statistics('Body').written, node_input_writer.get_statistics('Body').skipped) == (1, 1)
+    assert (node_input_writer.get_statistics('Hair').written, node_input_writer.get_statistics('Hair').skipped) == (0, 1)
+
+    node_input_writer.reset_statistics()
+    assert node_input_writer.get_statistics('Body') is None
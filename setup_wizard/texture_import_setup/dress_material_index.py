@@ -0,0 +1,76 @@
+# Author: michael-gh1
+
+from typing import List, NamedTuple
+
+from setup_wizard.import_order import get_actual_material_name_for_dress
+from setup_wizard.texture_import_setup.original_texture_locator_utils import OriginalTextureLocatorUtils
+
+
+class DressMaterialEntry(NamedTuple):
+    shader_material: object  # ex. 'HoYoverse - Genshin Dress1'
+    original_material: object  # ex. 'Avatar_Lady_Pole_Rosaria_Mat_Dress1', None if it could not be found
+    actual_material: str  # ex. 'Hair', the part whose textures are applied onto the shader material
+
+
+class DressMaterialIndex:
+    '''
+    Maps the shader Dress/Arm/Cloak materials to their original material and the part (ex. 'Hair', 'Body') whose
+    textures they use, which is deduced from the original material's base color image name.
+
+    Built once per texture import after the default materials have been replaced, instead of scanning
+    bpy.data.materials and the Principled BSDF links for every texture that is set.
+    '''
+    def __init__(self, dress_entries: List[DressMaterialEntry], cloak_entry: DressMaterialEntry = None):
+        self.dress_entries = dress_entries
+        self.cloak_entry = cloak_entry
+
+    @classmethod
+    def build(cls, materials, material_prefix: str, character_type_name: str):
+        shader_dress_materials = [material for material in materials if
+                                  'Genshin Dress' in material.name and 'Outlines' not in material.name]
+        shader_cloak_materials = [material for material in materials
+                                  if 'Genshin Arm' in material.name or 'Genshin Cloak' in material.name]
+
+        dress_entries = []
+        for shader_dress_material in shader_dress_materials:
+            original_dress_material = cls.get_original_dress_material(materials, material_prefix, shader_dress_material)
+            actual_material = None
+            if original_dress_material:
+                if character_type_name == 'MONSTER':
+                    actual_material = OriginalTextureLocatorUtils.get_monster_original_texture_part(original_dress_material)
+                else:
+                    actual_material = get_actual_material_name_for_dress(original_dress_material.name, character_type_name)
+            dress_entries.append(DressMaterialEntry(shader_dress_material, original_dress_material, actual_material))
+
+        # Specific case for Xiao (the only character with an Arm material)
+        # Specific case for Dainsleif (the only character with a Cloak material)
+        # Technically Paimon has one, but we ignore it
+        cloak_entry = None
+        if shader_cloak_materials:
+            original_cloak_material = next((material for material in materials if material.name.endswith(
+                shader_cloak_materials[0].name.split(' ')[-1]
+            )), None)
+            if original_cloak_material:
+                cloak_entry = DressMaterialEntry(
+                    shader_cloak_materials[0],
+                    original_cloak_material,
+                    get_actual_material_name_for_dress(original_cloak_material.name, character_type_name),
+                )
+        return cls(dress_entries, cloak_entry)
+
+    @staticmethod
+    def get_original_dress_material(materials, material_prefix: str, shader_dress_material):
+        shader_dress_material_part = shader_dress_material.name.split(' ')[-1]
+
+        for material in materials:
+            is_not_original_material = material.name.startswith(material_prefix)
+            if is_not_original_material:
+                continue
+
+            is_playable_character_original_material = material.name.endswith(shader_dress_material_part)
+            # ex. 'Monster_Fatuus_Agent_01_Fire_Dress_Mat' and 'HoYoverse - Genshin Dress'
+            # ex. 'Monster_Eremite_Male_Strong_Katar_01_Rock_Dress_Mat' and 'HoYoverse - Genshin Dress'
+            is_npc_original_material = len(material.name.split('_')) > 2 and material.name.split('_')[-2].endswith(shader_dress_material_part)
+
+            if is_playable_character_original_material or is_npc_original_material:
+                return material  # material that ends with 'Dress', 'Dress1', 'Dress2'
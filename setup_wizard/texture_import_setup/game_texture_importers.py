@@ -9,7 +9,11 @@ from setup_wizard.domain.game_types import GameType
 
 from setup_wizard.domain.shader_configurator import ShaderConfigurator
 from setup_wizard.import_order import CHARACTER_MODEL_FOLDER_FILE_PATH, NextStepInvoker, cache_using_cache_key, get_cache
+from setup_wizard.instrumentation.span_tracer import trace_span
+from setup_wizard.texture_import_setup.proxy_texture_cache import ProxyTextureCache
+from setup_wizard.texture_import_setup.texture_image_registry import texture_image_registry
 from setup_wizard.texture_import_setup.texture_importer_types import GenshinTextureImporter, TextureImporterFactory, TextureImporterType
+from setup_wizard.utils.character_folder_manifest import CharacterFolderManifest
 
 
 class GameTextureImporter(ABC):
@@ -17,6 +21,19 @@ class GameTextureImporter(ABC):
     def import_textures(self):
         raise NotImplementedError()
 
+    def use_proxy_textures(self, directory):
+        window_manager = self.context.window_manager
+        if not window_manager.proxy_textures_enabled:
+            return
+
+        proxy_texture_cache = ProxyTextureCache()
+        proxy_texture_scale = int(window_manager.proxy_texture_scale)
+        texture_file_paths = {os.path.normpath(file_path) for file_path in CharacterFolderManifest.get(directory).texture_files}
+
+        for image in texture_image_registry.get_images():
+            if os.path.normpath(proxy_texture_cache.get_full_resolution_file_path(image)) in texture_file_paths:
+                proxy_texture_cache.use_proxy(image, proxy_texture_scale)
+
 
 class GameTextureImporterFactory:
     def create(game_type: GameType, blender_operator: Operator, context: Context):
@@ -45,6 +62,7 @@ class GenshinImpactTextureImporterFacade(GameTextureImporter):
     This does look odd, but is intended to help with troubleshooting errors that users may encounter.
     The stacktrace will contain the method name (game name).
     '''
+    @trace_span()
     def import_textures(self):
         return self.__import_genshin_impact_textures()
 
@@ -76,13 +94,14 @@ class GenshinImpactTextureImporterFacade(GameTextureImporter):
 
         texture_importer: GenshinTextureImporter = TextureImporterFactory.create(texture_importer_type, GameType.GENSHIN_IMPACT)
         texture_importer.import_textures(directory)
+        self.use_proxy_textures(directory)
 
         '''
             NPCs and Monsters don't typically have shadow ramps. Turn off using shadow ramp if there are no assets for it.
             If an asset does exist, leave it as the default value (1.0).
         '''
         if (texture_importer_type is TextureImporterType.NPC or texture_importer_type is TextureImporterType.MONSTER) and \
-            not [file for file in [file for name, folder, file in os.walk(directory)][0] if 'Shadow_Ramp' in file]:
+            not [file for file in CharacterFolderManifest.get(directory).files if 'Shadow_Ramp' in file]:
             ShaderConfigurator().update_shader_value(
                 materials = [
                     bpy.data.materials.get('miHoYo - Genshin Hair'),
@@ -123,6 +142,7 @@ class HonkaiStarRailTextureImporterFacade(GameTextureImporter):
     This does look odd, but is intended to help with troubleshooting errors that users may encounter.
     The stacktrace will contain the method name (game name).
     '''
+    @trace_span()
     def import_textures(self):
         return self.__import_honkai_star_rail_textures()
 
@@ -146,6 +166,7 @@ class HonkaiStarRailTextureImporterFacade(GameTextureImporter):
         texture_importer_type = TextureImporterType.HSR_AVATAR
         texture_importer: GenshinTextureImporter = TextureImporterFactory.create(texture_importer_type, GameType.HONKAI_STAR_RAIL)
         texture_importer.import_textures(directory)
+        self.use_proxy_textures(directory)
 
         self.blender_operator.report({'INFO'}, 'Imported textures')
         if cache_enabled and directory:
@@ -174,6 +195,7 @@ class PunishingGrayRavenTextureImporterFacade(GameTextureImporter):
     This does look odd, but is intended to help with troubleshooting errors that users may encounter.
     The stacktrace will contain the method name (game name).
     '''
+    @trace_span()
     def import_textures(self):
         return self.__import_punishing_gray_raven_textures()
 
@@ -197,6 +219,7 @@ class PunishingGrayRavenTextureImporterFacade(GameTextureImporter):
         texture_importer_type = TextureImporterType.PGR_AVATAR
         texture_importer: GenshinTextureImporter = TextureImporterFactory.create(texture_importer_type, GameType.PUNISHING_GRAY_RAVEN)
         texture_importer.import_textures(directory)
+        self.use_proxy_textures(directory)
 
         self.blender_operator.report({'INFO'}, 'Imported textures')
         if cache_enabled and directory:
@@ -13,6 +13,7 @@ from setup_wizard.domain.shader_node_names import ShaderNodeNames
 
 from setup_wizard.domain.game_types import GameType
 from setup_wizard.texture_import_setup.texture_node_names import V1_HoYoToonGenshinImpactTextureNodeNames
+from setup_wizard.utils.node_input_writer import node_input_writer
 
 
 class MaterialDefaultValueSetterFactory:
@@ -63,7 +64,7 @@ class MaterialDefaultValueSetter:
         if body_shader_node:
             shader_use_shadow_ramp_input = body_shader_node.inputs.get(self.shader_node_names.USE_SHADOW_RAMP)
             if shader_use_shadow_ramp_input:
-                shader_use_shadow_ramp_input.default_value = default_value
+                node_input_writer.write(shader_use_shadow_ramp_input, default_value, material.name)
 
     def set_up_lightmap_ao_default_value(self, body_part, material, default_missing=0, default_exists=1):
         lightmap_uv0 = material.node_tree.nodes.get(f'{body_part}_Lightmap_UV0')
@@ -82,7 +83,7 @@ class MaterialDefaultValueSetter:
         if body_shader_node:
             shader_use_lightmap_ao_input = body_shader_node.inputs.get(self.shader_node_names.USE_LIGHTMAP_AO)
             if shader_use_lightmap_ao_input:
-                shader_use_lightmap_ao_input.default_value = default_value
+                node_input_writer.write(shader_use_lightmap_ao_input, default_value, material.name)
 
     def set_up_hair_material(self, material):
         raise NotImplementedError("This method should be implemented in subclasses that require hair material setup.")
@@ -116,7 +117,7 @@ class GenshinImpactMaterialDefaultValueSetter(MaterialDefaultValueSetter):
         body_hair_ramp_switch = body_shader.inputs.get(self.shader_node_names.BODY_HAIR_RAMP_SWITCH)
         if body_hair_ramp_switch:
             body_hair_ramp_switch_values: BodyHairRampSwitchValues = BodyHairRampSwitchValues(self.shader_node_names)
-            body_hair_ramp_switch.default_value = body_hair_ramp_switch_values.BODY2
+            node_input_writer.write(body_hair_ramp_switch, body_hair_ramp_switch_values.BODY2, material.name)
 
     def set_up_hair_material(self, material):
         material.name = self.material_names.HAIR
@@ -126,7 +127,7 @@ class GenshinImpactMaterialDefaultValueSetter(MaterialDefaultValueSetter):
         body_hair_ramp_switch = body_shader.inputs.get(self.shader_node_names.BODY_HAIR_RAMP_SWITCH)
         if body_hair_ramp_switch:
             body_hair_ramp_switch_values: BodyHairRampSwitchValues = BodyHairRampSwitchValues(self.shader_node_names)
-            body_hair_ramp_switch.default_value = body_hair_ramp_switch_values.HAIR
+            node_input_writer.write(body_hair_ramp_switch, body_hair_ramp_switch_values.HAIR, material.name)
 
 
 class HonkaiStarRailMaterialDefaultValueSetter(MaterialDefaultValueSetter):
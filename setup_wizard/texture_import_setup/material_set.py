@@ -0,0 +1,50 @@
+# Author: michael-gh1
+
+
+class MaterialSet:
+    '''
+    Resolves the materials of the active ShaderMaterialNames (ex. material_set.get(material_names.HAIR)) once per
+    importer run, instead of looking each one up in bpy.data.materials for every texture file.
+
+    Cached materials are checked cheaply on each lookup, so materials created, removed or renamed mid-run
+    (ex. Night Soul Outlines) are picked up:
+    * A found material is reused while it still exists and still has the name it was looked up by
+    * A missing material is reused while the number of materials is unchanged
+    '''
+    def __init__(self, materials):
+        self.materials = materials
+        self.resolved_materials = {}
+        self.missing_materials = {}
+
+    def get(self, *material_names):
+        '''
+        Returns the first material found for the given material names, otherwise None
+        '''
+        for material_name in material_names:
+            material = self.__get_material(material_name)
+            if material:
+                return material
+        return None
+
+    def __get_material(self, material_name):
+        material = self.resolved_materials.get(material_name)
+        if material is not None and self.__has_name(material, material_name):
+            return material
+        if self.missing_materials.get(material_name) == len(self.materials):
+            return None
+
+        self.resolved_materials.pop(material_name, None)
+        self.missing_materials.pop(material_name, None)
+        material = self.materials.get(material_name)
+        if material:
+            self.resolved_materials[material_name] = material
+        else:
+            self.missing_materials[material_name] = len(self.materials)
+        return material
+
+    @staticmethod
+    def __has_name(material, material_name):
+        try:
+            return material.name == material_name
+        except ReferenceError:  # Material was removed from bpy.data.materials
+            return False
@@ -15,7 +15,10 @@ from setup_wizard.domain.shader_material_names import JaredNytsPunishingGrayRave
 from setup_wizard.domain.shader_material_name_keywords import ShaderMaterialNameKeywords
 
 from setup_wizard.import_order import CHARACTER_MODEL_FOLDER_FILE_PATH, cache_using_cache_key, get_actual_material_name_for_dress, get_cache
+from setup_wizard.instrumentation.span_tracer import trace_span
+from setup_wizard.texture_import_setup.texture_image_registry import texture_image_registry
 from setup_wizard.texture_import_setup.texture_importer_types import TextureImporterFactory, TextureImporterType, TextureType
+from setup_wizard.utils.character_folder_manifest import CharacterFolderManifest
 from setup_wizard.utils.genshin_body_part_deducer import get_npc_mesh_body_part_name
 
 
@@ -86,7 +89,7 @@ class OutlineTextureImporter(ABC):
 
     def assign_texture_to_node(self, node, character_model_folder_file_path, texture_file_name):
         texture_img_path = character_model_folder_file_path + "/" + texture_file_name
-        texture_img = bpy.data.images.load(filepath = texture_img_path, check_existing=True)
+        texture_img = texture_image_registry.load(texture_img_path)
         texture_img.alpha_mode = 'CHANNEL_PACKED'
         node.image = texture_img
 
@@ -156,6 +159,7 @@ class GenshinImpactOutlineTextureImporter(OutlineTextureImporter):
         super().__init__(blender_operator, context, material_names, shader_node_names)
         self.material_names = material_names
 
+    @trace_span()
     def import_textures(self):
         cache_enabled = self.context.window_manager.cache_enabled
         character_model_folder_file_path = self.blender_operator.file_directory \
@@ -173,7 +177,8 @@ class GenshinImpactOutlineTextureImporter(OutlineTextureImporter):
             )
             return {'FINISHED'}
         
-        for name, folder, files in os.walk(character_model_folder_file_path):
+        character_folder_manifest = CharacterFolderManifest.get(character_model_folder_file_path)
+        for name, folder, files in character_folder_manifest.walk():
             diffuse_files = [file for file in files if 'Diffuse'.lower() in file.lower()]
             lightmap_files = [file for file in files if 'Lightmap'.lower() in file.lower() or 'Ligntmap'.lower() in file.lower()]  # Important typo check for: Wrioth
             outline_materials = [material for material in bpy.data.materials.values() if 
@@ -243,6 +248,7 @@ class HonkaiStarRailOutlineTextureImporter(OutlineTextureImporter):
         super().__init__(blender_operator, context, shader_material_names, shader_node_names)
         self.shader_material_names = shader_material_names
 
+    @trace_span()
     def import_textures(self):
         cache_enabled = self.context.window_manager.cache_enabled
         character_model_folder_file_path = self.blender_operator.file_directory \
@@ -260,7 +266,7 @@ class HonkaiStarRailOutlineTextureImporter(OutlineTextureImporter):
             )
             return {'FINISHED'}
 
-        for name, folder, files in os.walk(character_model_folder_file_path):
+        for name, folder, files in CharacterFolderManifest.get(character_model_folder_file_path).walk():
             color_files = [file for file in files if 'Color'.lower() in file.lower()]
             lightmap_files = [file for file in files if 'LightMap'.lower() in file.lower() or 'FaceMap' in file.lower() or 'LigthMap'.lower() in file.lower()]  # that Lightmap typo is on purpose
             outline_materials = [material for material in bpy.data.materials.values() if 'outlines' in material.name.lower() and material.name != self.shader_material_names.OUTLINES]
@@ -302,7 +308,7 @@ class HonkaiStarRailOutlineTextureImporter(OutlineTextureImporter):
         lightmap_filename = lightmap_filenames[0]
 
         texture_img_path = character_model_folder_file_path + "/" + lightmap_filename
-        texture_img = bpy.data.images.load(filepath = texture_img_path, check_existing=True)
+        texture_img = texture_image_registry.load(texture_img_path)
         texture_img.alpha_mode = 'CHANNEL_PACKED'
 
         hsr_texture_importer = TextureImporterFactory.create(TextureImporterType.HSR_AVATAR, GameType.HONKAI_STAR_RAIL)
@@ -320,7 +326,7 @@ class HonkaiStarRailOutlineTextureImporter(OutlineTextureImporter):
         diffuse_filename = diffuse_filenames[0]
 
         texture_img_path = character_model_folder_file_path + "/" + diffuse_filename
-        texture_img = bpy.data.images.load(filepath = texture_img_path, check_existing=True)
+        texture_img = texture_image_registry.load(texture_img_path)
         texture_img.alpha_mode = 'CHANNEL_PACKED'
 
         hsr_texture_importer = TextureImporterFactory.create(TextureImporterType.HSR_AVATAR, GameType.HONKAI_STAR_RAIL)
@@ -331,5 +337,6 @@ class PunishingGrayRavenOutlineTextureImporter(OutlineTextureImporter):
     def __init__(self, blender_operator, context, shader_node_names: ShaderNodeNames):
         super().__init__(blender_operator, context, JaredNytsPunishingGrayRavenShaderMaterialNames, shader_node_names)
 
+    @trace_span()
     def import_textures(self):
         return
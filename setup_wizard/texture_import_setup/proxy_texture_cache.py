@@ -0,0 +1,75 @@
+# Author: michael-gh1
+
+import os
+
+import bpy
+
+from setup_wizard.texture_import_setup.texture_image_registry import TextureFileHasher
+
+PROXY_TEXTURES_DIRECTORY_NAME = 'csw_proxy_textures'
+FULL_RESOLUTION_FILEPATH_PROPERTY = 'csw_full_resolution_filepath'
+PROXY_SCALE_PROPERTY = 'csw_proxy_scale'
+
+
+class ProxyTextureCache:
+    '''
+    Downscaled copies (ex. 1/2 or 1/4 resolution) of imported textures for lighter layout and animation scenes.
+
+    Proxies are saved once per source file content and scale in the cache directory. An image is swapped between
+    its proxy and full resolution texture by changing the image's filepath, so the shader nodes keep using the same
+    image and its colorspace (ex. Non-Color) and alpha mode (ex. Channel Packed) settings are kept.
+    '''
+    def __init__(self, cache_directory=None):
+        self.cache_directory = cache_directory or \
+            os.path.join(bpy.utils.user_resource('CONFIG'), PROXY_TEXTURES_DIRECTORY_NAME)
+
+    def get_proxy_file_path(self, source_file_path, scale: int):
+        source_file_hash = TextureFileHasher.get_hash(source_file_path)
+        return os.path.join(self.cache_directory, f'{source_file_hash}_1-{scale}.png')
+
+    def use_proxy(self, image, scale: int):
+        full_resolution_file_path = self.get_full_resolution_file_path(image)
+        try:
+            proxy_file_path = self.get_proxy_file_path(full_resolution_file_path, scale)
+        except OSError:
+            print(f'WARNING: Unable to find "{full_resolution_file_path}", skipping proxy texture for "{image.name}"')
+            return
+
+        if not os.path.exists(proxy_file_path):
+            self.create_proxy(image, proxy_file_path, scale)
+
+        image[FULL_RESOLUTION_FILEPATH_PROPERTY] = full_resolution_file_path
+        image[PROXY_SCALE_PROPERTY] = scale
+        image.filepath = proxy_file_path
+
+    def use_full_resolution(self, image):
+        if not self.is_proxy(image):
+            return
+        image.filepath = image[FULL_RESOLUTION_FILEPATH_PROPERTY]
+        del image[PROXY_SCALE_PROPERTY]
+
+    def create_proxy(self, image, proxy_file_path, scale: int):
+        width, height = image.size
+        os.makedirs(self.cache_directory, exist_ok=True)
+
+        # Scale a copy, the pixels are not color managed, so Non-Color data and Channel Packed alpha are kept as is
+        proxy_image = image.copy()
+        try:
+            proxy_image.scale(max(width // scale, 1), max(height // scale, 1))
+            proxy_image.filepath_raw = proxy_file_path
+            proxy_image.file_format = 'PNG'
+            proxy_image.save()
+        finally:
+            bpy.data.images.remove(proxy_image)
+
+    @staticmethod
+    def get_full_resolution_file_path(image):
+        return image.get(FULL_RESOLUTION_FILEPATH_PROPERTY) or bpy.path.abspath(image.filepath)
+
+    @staticmethod
+    def is_proxy(image):
+        return image.get(PROXY_SCALE_PROPERTY) is not None
+
+    @staticmethod
+    def get_swappable_images(images):
+        return [image for image in images if image.get(FULL_RESOLUTION_FILEPATH_PROPERTY)]
@@ -0,0 +1,297 @@
+# Author: michael-gh1
+
+import re
+from enum import Enum, auto
+from typing import NamedTuple
+
+from setup_wizard.domain.shader_material_name_keywords import ShaderMaterialNameKeywords
+
+
+class TextureKind(Enum):
+    DIFFUSE = auto()
+    LIGHTMAP = auto()
+    NORMALMAP = auto()
+    SHADOW_RAMP = auto()
+    SPECULAR_RAMP = auto()
+    WARM_RAMP = auto()
+    COOL_RAMP = auto()
+    RAMP = auto()
+    FACE_SHADOW = auto()
+    FACE_LIGHTMAP = auto()
+    FACEMAP = auto()
+    FACE_EXPRESSION_MAP = auto()
+    METALMAP = auto()
+    NYX_RAMP = auto()
+    NIGHT_SOUL_MASK = auto()
+    STOCKINGS = auto()
+    EYE = auto()
+    AO = auto()
+    HEAO = auto()
+    PBR = auto()
+    LUT = auto()
+
+
+class TextureClassification(NamedTuple):
+    texture_kind: TextureKind = None
+    body_part: str = None
+
+
+UNCLASSIFIED_TEXTURE = TextureClassification()
+
+
+class TextureFilenameRule:
+    '''
+    A texture filename matches the rule when it contains all of `all_of`, at least one of `any_of` and none of `none_of`.
+    `unless_in_folder` disables the rule when a file in the same folder contains all of those identifiers
+    (ex. use the NPC Face Lightmap as the Face Shadow, unless there is a Face Shadow texture).
+    '''
+    def __init__(self, texture_kind: TextureKind, body_part: str = None, all_of=(), any_of=(), none_of=(),
+                 ignore_case=False, none_of_ignore_case=None, unless_in_folder=()):
+        self.classification = TextureClassification(texture_kind, body_part)
+        self.all_of = tuple(all_of)
+        self.any_of = tuple(any_of)
+        self.none_of = tuple(none_of)
+        self.ignore_case = ignore_case
+        self.none_of_ignore_case = ignore_case if none_of_ignore_case is None else none_of_ignore_case
+        self.unless_in_folder = tuple(unless_in_folder)
+
+    def matches(self, texture_name: str, folder_context=frozenset()):
+        '''
+        Reference implementation of the rule using string checks, TextureFilenameClassifier compiles the rule to a regex
+        '''
+        if self.unless_in_folder and self.unless_in_folder in folder_context:
+            return False
+        name = texture_name.lower() if self.ignore_case else texture_name
+        none_of_name = texture_name.lower() if self.none_of_ignore_case else texture_name
+
+        return all(self.__normalize(identifier, self.ignore_case) in name for identifier in self.all_of) and \
+            (not self.any_of or any(self.__normalize(identifier, self.ignore_case) in name for identifier in self.any_of)) and \
+            not any(self.__normalize(identifier, self.none_of_ignore_case) in none_of_name for identifier in self.none_of)
+
+    def get_pattern(self):
+        conditions = [self.__case(f'(?=.*?{re.escape(identifier)})', self.ignore_case) for identifier in self.all_of]
+        if self.any_of:
+            any_of_pattern = '|'.join(re.escape(identifier) for identifier in self.any_of)
+            conditions.append(self.__case(f'(?=.*?(?:{any_of_pattern}))', self.ignore_case))
+        conditions.extend(
+            self.__case(f'(?!.*?{re.escape(identifier)})', self.none_of_ignore_case) for identifier in self.none_of
+        )
+        return ''.join(conditions)
+
+    @staticmethod
+    def __normalize(identifier, ignore_case):
+        return identifier.lower() if ignore_case else identifier
+
+    @staticmethod
+    def __case(pattern, ignore_case):
+        return f'(?i:{pattern})' if ignore_case else pattern
+
+
+class TextureFilenameClassifier:
+    '''
+    Classifies texture filenames into a TextureClassification (texture kind, body part) using an ordered rule table.
+    The first matching rule wins, the same as the elif chains the rules were written from.
+
+    All rules are compiled into one regex (one alternative per rule), so a filename is classified in a single match call.
+    Classifications are memoized per filename and folder context.
+    '''
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self.folder_conditions = list(dict.fromkeys(rule.unless_in_folder for rule in self.rules if rule.unless_in_folder))
+        self.automatons = {}
+        self.classifications = {}
+
+    def get_folder_context(self, files):
+        '''
+        Returns which `unless_in_folder` conditions are met by the files in a folder. Compute once per folder.
+        '''
+        if not self.folder_conditions:
+            return frozenset()
+        lowercase_files = [file.lower() for file in files]
+        return frozenset(
+            folder_condition for folder_condition in self.folder_conditions if any(
+                all(identifier.lower() in file for identifier in folder_condition) for file in lowercase_files
+            )
+        )
+
+    def classify(self, texture_name: str, folder_context=frozenset()) -> TextureClassification:
+        cache_key = (texture_name, folder_context)
+        classification = self.classifications.get(cache_key)
+
+        if classification is None:
+            match = self.__get_automaton(folder_context).match(texture_name)
+            classification = self.rules[int(match.lastgroup[1:])].classification if match else UNCLASSIFIED_TEXTURE
+            self.classifications[cache_key] = classification
+        return classification
+
+    def classify_sequentially(self, texture_name: str, folder_context=frozenset()) -> TextureClassification:
+        for rule in self.rules:
+            if rule.matches(texture_name, folder_context):
+                return rule.classification
+        return UNCLASSIFIED_TEXTURE
+
+    def clear(self):
+        self.classifications.clear()
+
+    def __get_automaton(self, folder_context):
+        automaton = self.automatons.get(folder_context)
+        if automaton is None:
+            rule_patterns = [
+                f'(?P<r{rule_index}>{rule.get_pattern()})' for rule_index, rule in enumerate(self.rules)
+                if rule.unless_in_folder not in folder_context
+            ]
+            automaton = re.compile('|'.join(rule_patterns) or '(?!)', re.DOTALL)
+            self.automatons[folder_context] = automaton
+        return automaton
+
+
+GENSHIN_AVATAR_TEXTURE_FILENAME_RULES = [
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Hair', all_of=['Hair_Diffuse'], none_of=['Eff']),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'EffectHair', all_of=['EffectHair_Diffuse']),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Helmet', all_of=['Helmet_Tex_Diffuse']),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'HelmetEmo', all_of=['HelmetEmo_Tex_Diffuse']),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Hair', all_of=['Hair_Lightmap'], none_of=['Eff']),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'EffectHair', all_of=['EffectHair_Lightmap']),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Helmet', all_of=['Helmet_Tex_Lightmap']),
+    TextureFilenameRule(TextureKind.NORMALMAP, 'Hair', all_of=[ShaderMaterialNameKeywords.HAIR, ShaderMaterialNameKeywords.NORMAL_MAP], ignore_case=True),
+    TextureFilenameRule(TextureKind.SHADOW_RAMP, 'Hair', all_of=['Hair_Shadow_Ramp']),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Body', all_of=[ShaderMaterialNameKeywords.BODY_DIFFUSE]),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Body1', all_of=[ShaderMaterialNameKeywords.BODY1_DIFFUSE]),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Body2', all_of=[ShaderMaterialNameKeywords.BODY2_DIFFUSE]),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Body', all_of=[ShaderMaterialNameKeywords.BODY_LIGHTMAP]),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Body1', all_of=[ShaderMaterialNameKeywords.BODY1_LIGHTMAP]),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Body2', all_of=[ShaderMaterialNameKeywords.BODY2_LIGHTMAP]),
+    TextureFilenameRule(TextureKind.NORMALMAP, 'Body', all_of=[ShaderMaterialNameKeywords.BODY, ShaderMaterialNameKeywords.NORMAL_MAP], ignore_case=True),
+    TextureFilenameRule(TextureKind.SHADOW_RAMP, 'Body2', all_of=[ShaderMaterialNameKeywords.BODY2_SHADOW_RAMP]),
+    TextureFilenameRule(TextureKind.SHADOW_RAMP, 'Body', any_of=[ShaderMaterialNameKeywords.BODY_SHADOW_RAMP, ShaderMaterialNameKeywords.BODY1_SHADOW_RAMP]),
+    TextureFilenameRule(TextureKind.SPECULAR_RAMP, 'Body', any_of=['Body_Specular_Ramp', 'Tex_Specular_Ramp']),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Face', all_of=['Face_Diffuse']),
+    TextureFilenameRule(TextureKind.FACE_SHADOW, 'Face', all_of=['Face', 'Shadow'], ignore_case=True),
+    TextureFilenameRule(TextureKind.FACE_LIGHTMAP, 'Face', all_of=['Face', 'Lightmap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.METALMAP, all_of=['MetalMap']),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Glass', all_of=['Glass', 'Diffuse'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Glass', all_of=['Glass', 'Lightmap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Gauntlet', all_of=['Gauntlet_Diffuse']),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Gauntlet', all_of=['Gauntlet_Ligntmap']),
+    TextureFilenameRule(TextureKind.NORMALMAP, 'Gauntlet', all_of=['Gauntlet_Normalmap']),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Tail', all_of=[ShaderMaterialNameKeywords.TAIL, 'Diffuse'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'SkillObj', all_of=[ShaderMaterialNameKeywords.SKILLOBJ, 'Diffuse'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'SkillObj', all_of=[ShaderMaterialNameKeywords.SKILLOBJ, 'Lightmap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Veil', all_of=[ShaderMaterialNameKeywords.VEIL, 'Diffuse'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Veil', all_of=[ShaderMaterialNameKeywords.VEIL, 'Lightmap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Effect', all_of=['Effect_Diffuse']),  # keep at bottom as a last resort check (Skirk support)
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Effect', all_of=['Effect_Lightmap']),  # keep at bottom as a last resort check (Skirk support)
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Dress', all_of=['Dress_Diffuse']),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Dress', all_of=['Dress_Lightmap']),
+    TextureFilenameRule(TextureKind.NYX_RAMP, any_of=['NyxState_Ramp', 'Nyx_Ramp', 'Tex_Ramp']),
+    TextureFilenameRule(TextureKind.NIGHT_SOUL_MASK, all_of=ShaderMaterialNameKeywords.NIGHT_SOUL_MASK_IDENTIFIERS, ignore_case=True),
+    TextureFilenameRule(TextureKind.STOCKINGS, all_of=[ShaderMaterialNameKeywords.STOCKINGS_DETAILMAP], ignore_case=True),
+]
+
+GENSHIN_NPC_TEXTURE_FILENAME_RULES = [
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Hair', all_of=['Hair', 'Diffuse'], none_of=['Eff'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Hair', all_of=['Hair', 'Lightmap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.NORMALMAP, 'Hair', all_of=['Hair', 'Normalmap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.SHADOW_RAMP, 'Hair', all_of=['Hair', 'Shadow_Ramp'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Body', all_of=['Body', 'Diffuse'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Body', all_of=['Body', 'Lightmap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.NORMALMAP, 'Body', all_of=['Body', 'Normalmap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.SHADOW_RAMP, 'Body', all_of=['Body', 'Shadow_Ramp'], ignore_case=True),
+    TextureFilenameRule(TextureKind.SPECULAR_RAMP, 'Body', all_of=['Body', 'Specular_Ramp'], ignore_case=True),
+    TextureFilenameRule(TextureKind.SPECULAR_RAMP, 'Body', all_of=['Tex', 'Specular_Ramp'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Face', all_of=['Face', 'Diffuse'], ignore_case=True),
+    # If Face Shadow does not exist in this folder, use "Face Lightmap" (actually an NPC Face Shadow texture)
+    TextureFilenameRule(TextureKind.FACE_SHADOW, 'Face', all_of=['Face', 'Shadow'], ignore_case=True),
+    TextureFilenameRule(TextureKind.FACE_SHADOW, 'Face', all_of=['NPC', 'Face', 'Lightmap'], ignore_case=True, unless_in_folder=['Face', 'Shadow']),
+    TextureFilenameRule(TextureKind.FACE_LIGHTMAP, 'Face', all_of=['Face', 'Lightmap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.METALMAP, all_of=['MetalMap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Cloak', all_of=['Cloak', 'Diffuse'], ignore_case=True),  # Paimon - VFX support
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Item', all_of=['Item', 'Diffuse'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Item', all_of=['Item', 'Lightmap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Hat', all_of=['Hat', 'Diffuse'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Hat', all_of=['Hat', 'Lightmap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Screw', all_of=['Screw', 'Diffuse'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Screw', all_of=['Screw', 'Lightmap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Others', all_of=['Others', 'Diffuse'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Others', all_of=['Others', 'Lightmap'], ignore_case=True),
+]
+
+GENSHIN_MONSTER_TEXTURE_FILENAME_RULES = [
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Body', all_of=['Body', 'Tex', 'Diffuse'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Body', all_of=['Tex', 'Diffuse'], ignore_case=True, unless_in_folder=['Hair']),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Body', all_of=['Body', 'Tex', 'Lightmap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Body', all_of=['Tex', 'Lightmap'], ignore_case=True, unless_in_folder=['Hair']),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Hair', all_of=['Hair', 'Tex', 'Diffuse'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Hair', all_of=['Tex', 'Diffuse'], ignore_case=True, unless_in_folder=['Body']),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Hair', all_of=['Hair', 'Tex', 'Lightmap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Hair', all_of=['Tex', 'Lightmap'], ignore_case=True, unless_in_folder=['Body']),
+    TextureFilenameRule(TextureKind.SHADOW_RAMP, 'Body', all_of=['Body_Shadow_Ramp'], ignore_case=True),
+    TextureFilenameRule(TextureKind.SHADOW_RAMP, 'Hair', all_of=['Hair_Shadow_Ramp'], ignore_case=True),
+    TextureFilenameRule(TextureKind.SPECULAR_RAMP, 'Body', all_of=['Tex', 'Specular_Ramp'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Face', all_of=['Face', 'Diffuse'], ignore_case=True),
+    # If Face Shadow does not exist in this folder, use "Face Lightmap" (actually an NPC Face Shadow texture)
+    TextureFilenameRule(TextureKind.FACE_SHADOW, 'Face', all_of=['Face', 'Shadow'], ignore_case=True),
+    TextureFilenameRule(TextureKind.FACE_SHADOW, 'Face', all_of=['NPC', 'Face', 'Lightmap'], ignore_case=True, unless_in_folder=['Face', 'Shadow']),
+    TextureFilenameRule(TextureKind.FACE_LIGHTMAP, 'Face', all_of=['Face', 'Lightmap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.METALMAP, all_of=['MetalMap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Hand', all_of=['Hand', 'Tex', 'Eff'], ignore_case=True),  # Asmoday - VFX Support
+]
+
+HONKAI_STAR_RAIL_AVATAR_TEXTURE_FILENAME_RULES = [
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Hair', all_of=['Hair', 'Color'], none_of=['Eff'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Hair', all_of=['Hair', 'LightMap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.WARM_RAMP, 'Hair', all_of=['Hair', 'Warm_Ramp'], ignore_case=True),
+    TextureFilenameRule(TextureKind.COOL_RAMP, 'Hair', all_of=['Hair', 'Cool_Ramp'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Body', all_of=['Body_', 'Color'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Body', all_of=['Body_', 'LightMap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Body1', all_of=['Body1', 'Color'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Body1', all_of=['Body1', 'LightMap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Body2', all_of=['Body2', 'Color'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Body2', all_of=['Body2', 'LightMap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Body3', all_of=['Body3', 'Color'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Body3', all_of=['Body3', 'LightMap'], ignore_case=True),
+    # Not Hair, so ramp must be Body
+    TextureFilenameRule(TextureKind.WARM_RAMP, 'Body', any_of=['Warm_Ramp', 'Body_Ramp'], none_of=['Weapon'], ignore_case=True),
+    TextureFilenameRule(TextureKind.COOL_RAMP, 'Body', all_of=['Cool_Ramp'], ignore_case=True),
+    TextureFilenameRule(TextureKind.RAMP, 'Body', all_of=['Ramp'], none_of=['Weapon'], ignore_case=True),
+    TextureFilenameRule(TextureKind.STOCKINGS, 'Body1', all_of=['Stockings', 'Body1'], ignore_case=True),
+    TextureFilenameRule(TextureKind.STOCKINGS, 'Body2', all_of=['Stockings', 'Body2'], ignore_case=True),
+    TextureFilenameRule(TextureKind.STOCKINGS, 'Body', all_of=['Stockings', 'Body'], ignore_case=True),  # Must be AFTER Body1/Body2
+    TextureFilenameRule(TextureKind.STOCKINGS, all_of=['Stockings'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Coat', all_of=['Coat', 'Color'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Coat', all_of=['Coat', 'LightMap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Face', all_of=['Face', 'Color'], ignore_case=True),
+    # If FaceMap does not exist in this folder, use "Face Lightmap" (actually an NPC Face Shadow texture)
+    TextureFilenameRule(TextureKind.FACEMAP, 'Face', all_of=['FaceMap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.FACEMAP, 'Face', all_of=['NPC', 'Face', 'LightMap'], ignore_case=True, unless_in_folder=['FaceMap']),
+    TextureFilenameRule(TextureKind.FACE_EXPRESSION_MAP, 'Face', all_of=['Face_ExpressionMap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Weapon', all_of=['Weapon', 'Color'], none_of=['Screen'], ignore_case=True),  # Pela, Silverwolf
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Weapon', all_of=['Weapon', 'LightMap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Weapon', all_of=['Weapon', 'LigthMap'], ignore_case=True),  # Yes, intentional typo (Asta)
+    TextureFilenameRule(TextureKind.RAMP, 'Weapon', all_of=['Weapon', 'Ramp'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Handbag', all_of=['Handbag', 'Color'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Handbag', all_of=['Handbag', 'Lightmap'], ignore_case=True),
+    TextureFilenameRule(TextureKind.DIFFUSE, 'Kendama', all_of=['Kendama', 'Color'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, 'Kendama', all_of=['Kendama', 'Lightmap'], ignore_case=True),
+    # Fallback, the body part is guessed from the texture name by the importer
+    TextureFilenameRule(TextureKind.DIFFUSE, all_of=['Color'], ignore_case=True),
+    TextureFilenameRule(TextureKind.LIGHTMAP, all_of=['LightMap'], ignore_case=True),
+]
+
+PUNISHING_GRAY_RAVEN_AVATAR_TEXTURE_FILENAME_RULES = [
+    TextureFilenameRule(TextureKind.EYE, 'Eye', all_of=['Eye'], none_of=['HET'], ignore_case=True, none_of_ignore_case=False),
+    TextureFilenameRule(TextureKind.AO, 'Face', all_of=['AO', 'Face'], none_of=['HEAO']),
+    TextureFilenameRule(TextureKind.AO, all_of=['AO'], none_of=['HEAO']),
+    TextureFilenameRule(TextureKind.HEAO, 'Face', all_of=['HEAO', 'Face']),
+    TextureFilenameRule(TextureKind.HEAO, all_of=['HEAO']),
+    TextureFilenameRule(TextureKind.NORMALMAP, all_of=['NM']),
+    TextureFilenameRule(TextureKind.PBR, all_of=['PBR']),
+    TextureFilenameRule(TextureKind.LUT, 'Face', all_of=['Skin', 'Face']),
+    TextureFilenameRule(TextureKind.LUT, all_of=['Skin']),
+]
+
+genshin_avatar_texture_filename_classifier = TextureFilenameClassifier(GENSHIN_AVATAR_TEXTURE_FILENAME_RULES)
+genshin_npc_texture_filename_classifier = TextureFilenameClassifier(GENSHIN_NPC_TEXTURE_FILENAME_RULES)
+genshin_monster_texture_filename_classifier = TextureFilenameClassifier(GENSHIN_MONSTER_TEXTURE_FILENAME_RULES)
+honkai_star_rail_avatar_texture_filename_classifier = TextureFilenameClassifier(HONKAI_STAR_RAIL_AVATAR_TEXTURE_FILENAME_RULES)
+punishing_gray_raven_avatar_texture_filename_classifier = TextureFilenameClassifier(PUNISHING_GRAY_RAVEN_AVATAR_TEXTURE_FILENAME_RULES)
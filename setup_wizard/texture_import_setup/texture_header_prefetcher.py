@@ -0,0 +1,225 @@
+# Author: michael-gh1
+
+import os
+import struct
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import NamedTuple
+
+from setup_wizard.texture_import_setup.texture_image_registry import TextureFileHasher
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+PNG_COLOR_TYPES_WITH_ALPHA = (4, 6)  # Grayscale + Alpha, RGBA
+PNG_MAX_CHUNKS_BEFORE_IMAGE_DATA = 64
+TGA_HEADER_SIZE = 18
+TGA_SUPPORTED_IMAGE_TYPES = (1, 2, 3, 9, 10, 11)  # Color mapped, Truecolor and Grayscale (uncompressed and RLE)
+JPEG_START_OF_IMAGE = b'\xff\xd8'
+JPEG_START_OF_FRAME_MARKERS = (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF)
+
+
+class TextureHeader(NamedTuple):
+    width: int
+    height: int
+    bit_depth: int  # bits per channel
+    channels: int
+    has_alpha: bool
+
+
+class InvalidTextureHeaderError(Exception):
+    def __init__(self, file_path, reason):
+        super().__init__(f'Invalid texture "{file_path}": {reason}')
+
+
+class TextureHeaderReader:
+    '''
+    Reads the dimensions, bit depth and alpha channel of PNG, TGA and JPG textures from their file header,
+    without decoding any pixels.
+    '''
+    @classmethod
+    def read(cls, file_path):
+        with open(file_path, 'rb') as file:
+            extension = os.path.splitext(file_path)[1].lower()
+            if extension == '.png':
+                return cls.read_png_header(file, file_path)
+            elif extension == '.tga':
+                return cls.read_tga_header(file, file_path)
+            elif extension in ('.jpg', '.jpeg'):
+                return cls.read_jpg_header(file, file_path)
+        raise InvalidTextureHeaderError(file_path, f'Unsupported texture format "{extension}"')
+
+    @staticmethod
+    def read_png_header(file, file_path):
+        if file.read(8) != PNG_SIGNATURE:
+            raise InvalidTextureHeaderError(file_path, 'Missing PNG signature')
+
+        chunk_header = file.read(8)
+        if len(chunk_header) < 8 or chunk_header[4:] != b'IHDR':
+            raise InvalidTextureHeaderError(file_path, 'Missing PNG IHDR chunk')
+        image_header = file.read(13)
+        if len(image_header) < 13:
+            raise InvalidTextureHeaderError(file_path, 'Truncated PNG IHDR chunk')
+        width, height, bit_depth, color_type = struct.unpack('>IIBB', image_header[:10])
+        channels = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}.get(color_type)
+        if channels is None:
+            raise InvalidTextureHeaderError(file_path, f'Unknown PNG color type {color_type}')
+        has_alpha = color_type in PNG_COLOR_TYPES_WITH_ALPHA
+
+        # Transparency of palette and RGB PNGs is stored in a tRNS chunk, which comes before the image data
+        file.seek(4, os.SEEK_CUR)  # IHDR CRC
+        for _ in range(PNG_MAX_CHUNKS_BEFORE_IMAGE_DATA):
+            if has_alpha:
+                break
+            chunk_header = file.read(8)
+            if len(chunk_header) < 8 or chunk_header[4:] == b'IDAT':
+                break
+            chunk_length = struct.unpack('>I', chunk_header[:4])[0]
+            has_alpha = chunk_header[4:] == b'tRNS'
+            file.seek(chunk_length + 4, os.SEEK_CUR)  # chunk data and CRC
+        return TextureHeader(width, height, bit_depth, channels + 1 if has_alpha and channels in (1, 3) else channels, has_alpha)
+
+    @staticmethod
+    def read_tga_header(file, file_path):
+        header = file.read(TGA_HEADER_SIZE)
+        if len(header) < TGA_HEADER_SIZE:
+            raise InvalidTextureHeaderError(file_path, 'Truncated TGA header')
+        image_type = header[2]
+        if image_type not in TGA_SUPPORTED_IMAGE_TYPES:
+            raise InvalidTextureHeaderError(file_path, f'Unknown TGA image type {image_type}')
+
+        width, height, pixel_depth, image_descriptor = struct.unpack('<HHBB', header[12:18])
+        alpha_bits = image_descriptor & 0x0F
+        has_alpha = alpha_bits > 0 or pixel_depth == 32
+        channels = 1 if image_type in (3, 11) else 4 if has_alpha else 3
+        return TextureHeader(width, height, 8, channels, has_alpha)
+
+    @staticmethod
+    def read_jpg_header(file, file_path):
+        if file.read(2) != JPEG_START_OF_IMAGE:
+            raise InvalidTextureHeaderError(file_path, 'Missing JPG start of image marker')
+
+        while True:
+            marker = file.read(2)
+            if len(marker) < 2 or marker[0] != 0xFF:
+                raise InvalidTextureHeaderError(file_path, 'Missing JPG start of frame marker')
+            if marker[1] in (0x01, 0xFF) or 0xD0 <= marker[1] <= 0xD7:
+                file.seek(-1 if marker[1] == 0xFF else 0, os.SEEK_CUR)  # markers without a segment length
+                continue
+
+            segment_length = file.read(2)
+            if len(segment_length) < 2:
+                raise InvalidTextureHeaderError(file_path, 'Truncated JPG segment')
+            segment_length = struct.unpack('>H', segment_length)[0]
+
+            if marker[1] in JPEG_START_OF_FRAME_MARKERS:
+                frame_header = file.read(6)
+                if len(frame_header) < 6:
+                    raise InvalidTextureHeaderError(file_path, 'Truncated JPG start of frame segment')
+                bit_depth, height, width, channels = struct.unpack('>BHHB', frame_header)
+                return TextureHeader(width, height, bit_depth, channels, False)
+            file.seek(segment_length - 2, os.SEEK_CUR)
+
+
+class TextureHeaderPrefetcher:
+    '''
+    Reads texture headers on a thread pool ahead of the texture import step (ex. while the character model is
+    imported), so missing and corrupt textures are found before bpy.data.images.load() is called.
+
+    Optionally, the whole texture file is read as well (hashed for the TextureImageRegistry), which warms the
+    OS page cache for the image loads on the main thread. This helps most with cold disks and network shares.
+
+    Headers are cached by file path until the file's size or modified time changes.
+    '''
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 1) + 4)
+        self.executor = None
+        self.headers = {}  # file path: (file signature, TextureHeader or InvalidTextureHeaderError)
+        self.pending_headers = {}  # file path: Future
+        self.lock = Lock()
+
+    def prefetch(self, file_paths, warm_page_cache=True):
+        with self.lock:
+            if not self.executor:
+                self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='TextureHeaderPrefetcher')
+            for file_path in file_paths:
+                file_path = os.path.normpath(file_path)
+                if file_path not in self.pending_headers:
+                    self.pending_headers[file_path] = self.executor.submit(self.__prefetch, file_path, warm_page_cache)
+
+    def get_header(self, file_path):
+        '''
+        Returns the TextureHeader of a texture, waiting for it if it is being prefetched.
+        Raises an InvalidTextureHeaderError if the texture is missing or corrupt.
+        '''
+        file_path = os.path.normpath(file_path)
+        with self.lock:
+            pending_header = self.pending_headers.pop(file_path, None)
+        if pending_header:
+            pending_header.result()
+
+        header = self.__get_cached_header(file_path)
+        if header is None:
+            header = self.__read_header(file_path)
+        if isinstance(header, InvalidTextureHeaderError):
+            raise header
+        return header
+
+    def get_cached_header(self, file_path):
+        '''
+        Returns the TextureHeader of a texture if it was already read, otherwise None
+        '''
+        header = self.__get_cached_header(os.path.normpath(file_path))
+        return header if isinstance(header, TextureHeader) else None
+
+    def is_valid_texture(self, file_path):
+        try:
+            self.get_header(file_path)
+            return True
+        except InvalidTextureHeaderError as ex:
+            print(f'WARNING: {ex}, skipping texture')
+            return False
+
+    def shutdown(self):
+        with self.lock:
+            if self.executor:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+            self.pending_headers.clear()
+
+    def clear(self):
+        self.shutdown()
+        self.headers.clear()
+
+    def __prefetch(self, file_path, warm_page_cache):
+        header = self.__get_cached_header(file_path) or self.__read_header(file_path)
+        if warm_page_cache and isinstance(header, TextureHeader):
+            try:
+                TextureFileHasher.get_hash(file_path)
+            except OSError:
+                pass
+
+    def __get_cached_header(self, file_path):
+        file_signature, header = self.headers.get(file_path, (None, None))
+        try:
+            return header if file_signature == self.__get_file_signature(file_path) else None
+        except OSError as ex:
+            return InvalidTextureHeaderError(file_path, ex.strerror)
+
+    def __read_header(self, file_path):
+        try:
+            file_signature = self.__get_file_signature(file_path)
+            header = TextureHeaderReader.read(file_path)
+        except OSError as ex:
+            return InvalidTextureHeaderError(file_path, ex.strerror)
+        except (InvalidTextureHeaderError, struct.error) as ex:
+            header = ex if isinstance(ex, InvalidTextureHeaderError) else InvalidTextureHeaderError(file_path, str(ex))
+        self.headers[file_path] = (file_signature, header)
+        return header
+
+    @staticmethod
+    def __get_file_signature(file_path):
+        file_stat = os.stat(file_path)
+        return (file_stat.st_size, file_stat.st_mtime_ns)
+
+
+texture_header_prefetcher = TextureHeaderPrefetcher()
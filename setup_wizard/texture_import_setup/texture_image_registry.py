@@ -0,0 +1,119 @@
+# Author: michael-gh1
+
+import hashlib
+import os
+
+import bpy
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class TextureFileHasher:
+    '''
+    Hashes texture file contents in chunks, so large textures are never read into memory at once.
+
+    Hashes are cached by file path and are reused until the file's size or modified time changes.
+    '''
+    hashes = {}
+
+    @classmethod
+    def get_hash(cls, file_path):
+        file_path = os.path.normpath(file_path)
+        file_stat = os.stat(file_path)
+        file_signature = (file_stat.st_size, file_stat.st_mtime_ns)
+
+        cached_signature, file_hash = cls.hashes.get(file_path, (None, None))
+        if cached_signature != file_signature:
+            file_hash = cls.compute_hash(file_path)
+            cls.hashes[file_path] = (file_signature, file_hash)
+        return file_hash
+
+    @staticmethod
+    def compute_hash(file_path):
+        file_hash = hashlib.sha1()
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b''):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
+
+    @classmethod
+    def clear(cls):
+        cls.hashes.clear()
+
+
+class TextureImageRegistry:
+    '''
+    Loads texture files as images, reusing the image of an identical texture file that was already loaded.
+
+    bpy.data.images.load(check_existing=True) only reuses images with the same file path, but character folders
+    and costume subfolders often contain byte-identical ramps and lightmaps under the same filename in different folders.
+    Each duplicate would otherwise be another image datablock in RAM and VRAM.
+
+    Images are only shared by files with the same content and the same filename. The importers pick a texture's role
+    (and alpha mode/color space) from its filename, so identical files with different filenames (ex. a Body and a Dress
+    lightmap, or another character's ramp) get their own image. Cleared at the start of each texture import.
+    '''
+    def __init__(self):
+        self.images_by_key = {}
+        self.source_filenames_by_image_name = {}
+        self.deduplicated_file_paths = set()
+        self.memory_saved = 0  # bytes
+
+    def load(self, file_path):
+        normalized_file_path = os.path.normpath(file_path)
+        try:
+            file_hash = TextureFileHasher.get_hash(normalized_file_path)
+        except OSError:
+            return bpy.data.images.load(filepath = file_path, check_existing=True)
+
+        texture_filename = os.path.basename(normalized_file_path)
+        image_key = (file_hash, texture_filename)
+        image, image_file_path = self.images_by_key.get(image_key, (None, None))
+        if self.__is_image_loaded(image):
+            # Also reused for the same file path, the image may be showing a proxy texture (see ProxyTextureCache)
+            if image_file_path != normalized_file_path and normalized_file_path not in self.deduplicated_file_paths:
+                print(f'INFO: Reusing image "{image.name}" for identical texture "{file_path}"')
+                self.deduplicated_file_paths.add(normalized_file_path)
+                self.memory_saved += self.estimate_image_memory(image)
+            return image
+
+        image = bpy.data.images.load(filepath = file_path, check_existing=True)
+        self.images_by_key[image_key] = (image, normalized_file_path)
+        self.source_filenames_by_image_name[image.name] = texture_filename
+        return image
+
+    def get_source_filename(self, image):
+        '''
+        Returns the filename of the texture file an image was loaded for, the image name may differ (ex. `.001` suffix)
+        '''
+        return self.source_filenames_by_image_name.get(image.name, image.name)
+
+    def get_images(self):
+        return [image for image, _ in self.images_by_key.values() if self.__is_image_loaded(image)]
+
+    def clear(self):
+        self.images_by_key.clear()
+        self.source_filenames_by_image_name.clear()
+        self.deduplicated_file_paths.clear()
+        self.memory_saved = 0
+
+    @staticmethod
+    def estimate_image_memory(image):
+        '''
+        Estimated size of an image's uncompressed pixel buffer in bytes
+        '''
+        width, height = image.size
+        bytes_per_channel = 4 if image.is_float else 1
+        return width * height * image.channels * bytes_per_channel
+
+    @staticmethod
+    def __is_image_loaded(image):
+        if image is None:
+            return False
+        try:
+            return bpy.data.images.get(image.name) == image
+        except ReferenceError:  # image was removed (ex. reloaded or a new .blend file was opened)
+            return False
+
+
+texture_image_registry = TextureImageRegistry()
@@ -2,7 +2,6 @@ from enum import Enum, auto
 from typing import List
 import bpy
 
-import os
 from setup_wizard.domain.material_identifier_service import PunishingGrayRavenMaterialIdentifierService
 from setup_wizard.domain.game_types import GameType
 from setup_wizard.domain.shader_identifier_service import GenshinImpactShaders, HonkaiStarRailShaders, ShaderIdentifierService, \
@@ -10,11 +9,17 @@ from setup_wizard.domain.shader_identifier_service import GenshinImpactShaders,
 from setup_wizard.domain.shader_material_names import JaredNytsPunishingGrayRavenShaderMaterialNames, StellarToonShaderMaterialNames, V3_BonnyFestivityGenshinImpactMaterialNames, V2_FestivityGenshinImpactMaterialNames, \
     ShaderMaterialNames, Nya222HonkaiStarRailShaderMaterialNames, V1_HoYoToonGenshinImpactMaterialNames
 from setup_wizard.domain.shader_node_names import JaredNyts_PunishingGrayRavenNodeNames, ShaderNodeNames, StellarToonShaderNodeNames
-from setup_wizard.domain.shader_material_name_keywords import ShaderMaterialNameKeywords
 
-from setup_wizard.import_order import get_actual_material_name_for_dress
+from setup_wizard.instrumentation.span_tracer import trace_span
 from setup_wizard.texture_import_setup.texture_node_names import JaredNytsPunishingGrayRavenTextureNodeNames, Nya222HonkaiStarRailTextureNodeNames, StellarToonTextureNodeNames, TextureNodeNames, V1_HoYoToonGenshinImpactTextureNodeNames
-from setup_wizard.texture_import_setup.original_texture_locator_utils import OriginalTextureLocatorUtils
+from setup_wizard.texture_import_setup.dress_material_index import DressMaterialIndex
+from setup_wizard.texture_import_setup.material_set import MaterialSet
+from setup_wizard.texture_import_setup.texture_header_prefetcher import texture_header_prefetcher
+from setup_wizard.texture_import_setup.texture_image_registry import texture_image_registry
+from setup_wizard.texture_import_setup.texture_filename_classifier import TextureKind, \
+    genshin_avatar_texture_filename_classifier, genshin_monster_texture_filename_classifier, genshin_npc_texture_filename_classifier, \
+    honkai_star_rail_avatar_texture_filename_classifier, punishing_gray_raven_avatar_texture_filename_classifier
+from setup_wizard.utils.character_folder_manifest import CharacterFolderManifest
 
 
 class TextureImporterType(Enum):
@@ -90,6 +95,9 @@ class GenshinTextureImporter:
         self.character_type = character_type
         self.shader_identifier_service: ShaderIdentifierService
         self.genshin_shader_version: GenshinImpactShaders
+        self.material_set: MaterialSet
+        self.has_dress_textures = False
+        self.dress_material_index: DressMaterialIndex = None
 
     def import_textures(self, directory):
         raise NotImplementedError()
@@ -232,15 +240,16 @@ class GenshinTextureImporter:
                     ShaderNodeNames.INTERNAL_GLOBAL_PROPERTIES).inputs.get('[Loli/Boy/Girl/Male/Lady]')
 
             if face_lightmap_input:
-                if 'Loli' in img.name:
+                texture_filename = texture_image_registry.get_source_filename(img)
+                if 'Loli' in texture_filename:
                     face_lightmap_input.default_value = 1.0
-                elif 'Boy' in img.name:
+                elif 'Boy' in texture_filename:
                     face_lightmap_input.default_value = 2.0
-                elif 'Girl' in img.name or 'Female' in img.name:
+                elif 'Girl' in texture_filename or 'Female' in texture_filename:
                     face_lightmap_input.default_value = 3.0
-                elif 'Male' in img.name:
+                elif 'Male' in texture_filename:
                     face_lightmap_input.default_value = 4.0
-                elif 'Lady' in img.name:
+                elif 'Lady' in texture_filename:
                     face_lightmap_input.default_value = 5.0
 
     def set_face_shadow_texture(self, face_material, img):
@@ -328,62 +337,32 @@ class GenshinTextureImporter:
         return night_soul_outlines_material
 
     def setup_dress_textures(self, texture_name, texture_img, character_type: TextureImporterType):
-        shader_dress_materials = [material for material in bpy.data.materials if 
-                                  'Genshin Dress' in material.name and 'Outlines' not in material.name]
-        shader_cloak_materials = [material for material in bpy.data.materials
-                                  if 'Genshin Arm' in material.name or 'Genshin Cloak' in material.name]
-
-        # TODO: Refactor this for sure!
-        # Specific case for Xiao (the only character with an Arm material)
-        # Specific case for Dainsleif (the only character with a Cloak material)
-        # Technically Paimon has one, but we ignore it
-        if shader_cloak_materials:
-            original_cloak_material = [material for material in bpy.data.materials if material.name.endswith(
-                shader_cloak_materials[0].name.split(' ')[-1]
-            )][0]  # the material that ends with 'Dress', 'Dress1', 'Dress2'
-            actual_cloak_material = get_actual_material_name_for_dress(original_cloak_material.name, character_type.name)
-            if actual_cloak_material in texture_img.name:
-                material_shader_nodes = bpy.data.materials.get(shader_cloak_materials[0].name).node_tree.nodes
-                if material_shader_nodes.get(texture_name):
-                    material_shader_nodes.get(texture_name).image = texture_img
-
-        for shader_dress_material in shader_dress_materials:
-            original_dress_material = self.get_original_dress_material(shader_dress_material)
+        if not self.dress_material_index:
+            self.dress_material_index = DressMaterialIndex.build(
+                bpy.data.materials, self.material_names.MATERIAL_PREFIX, character_type.name
+            )
+
+        texture_filename = texture_image_registry.get_source_filename(texture_img)
+        cloak_entry = self.dress_material_index.cloak_entry
+        if cloak_entry and cloak_entry.actual_material in texture_filename:
+            material_shader_nodes = cloak_entry.shader_material.node_tree.nodes
+            if material_shader_nodes.get(texture_name):
+                material_shader_nodes.get(texture_name).image = texture_img
+
+        for shader_dress_material, original_dress_material, actual_material in self.dress_material_index.dress_entries:
             if not original_dress_material:
                 print(f'ERROR: Could not find original dress material for "{shader_dress_material.name}", skipping texture import')
                 return
 
-            if character_type == TextureImporterType.MONSTER:
-                actual_material = OriginalTextureLocatorUtils.get_monster_original_texture_part(original_dress_material)
-            else:
-                actual_material = get_actual_material_name_for_dress(original_dress_material.name, character_type.name)
-            if actual_material in texture_img.name:
+            if actual_material in texture_filename:
                 print(f'Importing texture "{texture_name}" onto material "{shader_dress_material.name}"')
-                material_shader_nodes = bpy.data.materials.get(shader_dress_material.name).node_tree.nodes
+                material_shader_nodes = shader_dress_material.node_tree.nodes
                 if material_shader_nodes.get(texture_name):
                     material_shader_nodes.get(texture_name).image = texture_img
                 return
 
-    def get_original_dress_material(self, shader_dress_material):
-        for material in bpy.data.materials:
-            is_not_original_material = material.name.startswith(self.material_names.MATERIAL_PREFIX)
-            if is_not_original_material:
-                continue
-
-            is_playable_character_original_material = material.name.endswith(shader_dress_material.name.split(' ')[-1])
-            # ex. 'Monster_Fatuus_Agent_01_Fire_Dress_Mat' and 'HoYoverse - Genshin Dress'
-            # ex. 'Monster_Eremite_Male_Strong_Katar_01_Rock_Dress_Mat' and 'HoYoverse - Genshin Dress'
-            is_npc_original_material = len(material.name.split('_')) > 2 and material.name.split('_')[-2].endswith(shader_dress_material.name.split(' ')[-1])
-
-            if is_playable_character_original_material or is_npc_original_material:
-                return material  # material that ends with 'Dress', 'Dress1', 'Dress2'
-
     def does_dress_texture_exist_in_directory_files(self):
-        dress_texture_detected = False
-        for file in self.files:
-            if 'Dress' in file and ('Diffuse' in file or 'Lightmap' in file) and '.png' in file:
-                dress_texture_detected = True
-        return dress_texture_detected
+        return self.has_dress_textures
 
     def set_face_material_id(self, face_material, image):
         character_to_face_material_id_map = {
@@ -406,8 +385,9 @@ class GenshinTextureImporter:
 
         # No longer a field in V3 shader
         if shader_has_face_material_id:
+            texture_filename = texture_image_registry.get_source_filename(image)
             for character_name in character_to_face_material_id_map.keys():
-                if character_name in image.name:
+                if character_name in texture_filename:
                     shader_node_names = self.shader_identifier_service.get_shader_node_names(self.genshin_shader_version)
                     if face_material.node_tree.nodes.get(shader_node_names.FACE_SHADER):
                         face_shader_node = face_material.node_tree.nodes[shader_node_names.FACE_SHADER]
@@ -422,9 +402,10 @@ class GenshinTextureImporter:
         shader_has_body_hair_output = self.genshin_shader_version is GenshinImpactShaders.V2_GENSHIN_IMPACT_SHADER
 
         if shader_has_body_hair_output:
+            texture_filename = texture_image_registry.get_source_filename(image)
             for character_name in characters_needing_hair_output:
                 shader_node_names = self.shader_identifier_service.get_shader_node_names(self.genshin_shader_version)
-                if character_name in image.name and face_material.node_tree.nodes.get(shader_node_names.FACE_SHADER):
+                if character_name in texture_filename and face_material.node_tree.nodes.get(shader_node_names.FACE_SHADER):
                     face_shader_node = face_material.node_tree.nodes[shader_node_names.FACE_SHADER]
                     face_shader_node_hair_output = face_shader_node.outputs.get('Hair')
 
@@ -488,6 +469,8 @@ class GenshinTextureImporter:
 
 
 class GenshinAvatarTextureImporter(GenshinTextureImporter):
+    texture_filename_classifier = genshin_avatar_texture_filename_classifier
+
     def __init__(self, material_names: ShaderMaterialNames):
         super().__init__(GameType.GENSHIN_IMPACT, TextureImporterType.AVATAR)
         self.material_names = material_names
@@ -495,76 +478,79 @@ class GenshinAvatarTextureImporter(GenshinTextureImporter):
         self.shader_identifier_service = ShaderIdentifierServiceFactory.create(GameType.GENSHIN_IMPACT.name)
         self.genshin_shader_version = self.shader_identifier_service.identify_shader(bpy.data.materials, bpy.data.node_groups)
 
+    @trace_span()
     def import_textures(self, directory):
-        for folder_name, folder, files in os.walk(directory):
+        self.material_set = MaterialSet(bpy.data.materials)
+
+        character_folder_manifest = CharacterFolderManifest.get(directory)
+        for folder_name, folder, files in character_folder_manifest.walk():
             self.files = files
+            self.has_dress_textures = character_folder_manifest.get_folder(folder_name).has_dress_textures
+            folder_context = self.texture_filename_classifier.get_folder_context(files)
             for file in files:
                 if not self.is_supported_texture(file):
                     continue
                 # load the file with the correct alpha mode
                 img_path = folder_name + "/" + file
-                img = bpy.data.images.load(filepath = img_path, check_existing=True)
+                if not texture_header_prefetcher.is_valid_texture(img_path):
+                    continue
+                img = texture_image_registry.load(img_path)
                 img.alpha_mode = 'CHANNEL_PACKED'
 
-                effect_hair_material = bpy.data.materials.get(f'{self.material_names.EFFECT_HAIR}') or \
-                    bpy.data.materials.get(f'{self.material_names.EFFECT}')
-                hair_material = bpy.data.materials.get(f'{self.material_names.HAIR}')
-                helmet_material = bpy.data.materials.get(f'{self.material_names.HELMET}')
-                helmet_emotion_material = bpy.data.materials.get(f'{self.material_names.HELMET_EMO}')
-                brow_material = bpy.data.materials.get(f'{self.material_names.BROW}')
-                face_material = bpy.data.materials.get(f'{self.material_names.FACE}')
-                body_material = bpy.data.materials.get(f'{self.material_names.BODY}')
-                body1_material = bpy.data.materials.get(f'{self.material_names.BODY1}')
-                body2_material = bpy.data.materials.get(f'{self.material_names.BODY2}')
-                dress_material = bpy.data.materials.get(f'{self.material_names.DRESS}')
-                dress2_material = bpy.data.materials.get(f'{self.material_names.MATERIAL_PREFIX}Dress2')
-                gauntlet_material = bpy.data.materials.get(f'{self.material_names.GAUNTLET}')
-                glass_material = bpy.data.materials.get(f'{self.material_names.GLASS}')
-                glass_eff_material = bpy.data.materials.get(f'{self.material_names.GLASS_EFF}')
-                leather_material = bpy.data.materials.get(f'{self.material_names.LEATHER}')
-                pupil_material = bpy.data.materials.get(f'{self.material_names.PUPIL}')
-                ribbon_material = bpy.data.materials.get(f'{self.material_names.RIBBON}') or bpy.data.materials.get(f'{self.material_names.MATERIAL_PREFIX}Ribbon')  # for older shader version "support"
-                skirt_material = bpy.data.materials.get(f'{self.material_names.SKIRT}')
-                star_cloak_material = bpy.data.materials.get(f'{self.material_names.STAR_CLOAK}')
-                stockings_material = bpy.data.materials.get(f'{self.material_names.STOCKINGS}')
-                veil_material = bpy.data.materials.get(f'{self.material_names.VEILSHADOW}')
+                effect_hair_material = self.material_set.get(self.material_names.EFFECT_HAIR, self.material_names.EFFECT)
+                hair_material = self.material_set.get(self.material_names.HAIR)
+                helmet_material = self.material_set.get(self.material_names.HELMET)
+                helmet_emotion_material = self.material_set.get(self.material_names.HELMET_EMO)
+                brow_material = self.material_set.get(self.material_names.BROW)
+                face_material = self.material_set.get(self.material_names.FACE)
+                body_material = self.material_set.get(self.material_names.BODY)
+                body1_material = self.material_set.get(self.material_names.BODY1)
+                body2_material = self.material_set.get(self.material_names.BODY2)
+                dress_material = self.material_set.get(self.material_names.DRESS)
+                dress2_material = self.material_set.get(f'{self.material_names.MATERIAL_PREFIX}Dress2')
+                gauntlet_material = self.material_set.get(self.material_names.GAUNTLET)
+                glass_material = self.material_set.get(self.material_names.GLASS)
+                glass_eff_material = self.material_set.get(self.material_names.GLASS_EFF)
+                leather_material = self.material_set.get(self.material_names.LEATHER)
+                pupil_material = self.material_set.get(self.material_names.PUPIL)
+                ribbon_material = self.material_set.get(self.material_names.RIBBON, f'{self.material_names.MATERIAL_PREFIX}Ribbon')  # for older shader version "support"
+                skirt_material = self.material_set.get(self.material_names.SKIRT)
+                star_cloak_material = self.material_set.get(self.material_names.STAR_CLOAK)
+                stockings_material = self.material_set.get(self.material_names.STOCKINGS)
+                veil_material = self.material_set.get(self.material_names.VEILSHADOW)
 
                 # Implement the texture in the correct node
                 print(f'Importing texture {file} using {self.__class__.__name__}')
-                if "Hair_Diffuse" in file and "Eff" not in file:
+                texture_kind, body_part = self.texture_filename_classifier.classify(file, folder_context)
+
+                if texture_kind is TextureKind.DIFFUSE and body_part == 'Hair':
                     self.set_diffuse_texture(TextureType.HAIR, hair_material, img)
                     if stockings_material:
                         self.set_diffuse_texture(TextureType.HAIR, stockings_material, img)
-                elif "EffectHair_Diffuse" in file:
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'EffectHair':
                     self.set_diffuse_texture(TextureType.HAIR, effect_hair_material, img)
-                elif 'Helmet_Tex_Diffuse' in file:
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Helmet':
                     self.set_diffuse_texture(TextureType.HAIR, helmet_material, img)
-                elif 'HelmetEmo_Tex_Diffuse' in file:
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'HelmetEmo':
                     self.set_diffuse_texture(TextureType.HAIR, helmet_emotion_material, img)
-                elif "Hair_Lightmap" in file and "Eff" not in file:
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Hair':
                     self.set_lightmap_texture(TextureType.HAIR, hair_material, img)
                     if stockings_material:
                         self.set_lightmap_texture(TextureType.HAIR, stockings_material, img)
-                elif "EffectHair_Lightmap" in file:
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'EffectHair':
                     self.set_lightmap_texture(TextureType.HAIR, effect_hair_material, img)
-                elif 'Helmet_Tex_Lightmap' in file:
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Helmet':
                     self.set_lightmap_texture(TextureType.HAIR, helmet_material, img)
-                elif self.is_texture_identifiers_in_texture_name([ShaderMaterialNameKeywords.HAIR, ShaderMaterialNameKeywords.NORMAL_MAP], file):
+                elif texture_kind is TextureKind.NORMALMAP and body_part == 'Hair':
                     self.set_normalmap_texture(TextureType.HAIR, hair_material, img)
                     if stockings_material:
                         self.set_normalmap_texture(TextureType.HAIR, stockings_material, img)
-                elif "Hair_Shadow_Ramp" in file:
+                elif texture_kind is TextureKind.SHADOW_RAMP and body_part == 'Hair':
                     self.set_shadow_ramp_texture(TextureType.HAIR, img)
-                elif self.is_one_texture_identifier_in_texture_name(
-                    [
-                        ShaderMaterialNameKeywords.BODY_DIFFUSE, 
-                        ShaderMaterialNameKeywords.BODY1_DIFFUSE, 
-                        ShaderMaterialNameKeywords.BODY2_DIFFUSE, 
-                    ], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part in ('Body', 'Body1', 'Body2'):
                     selected_body_material = \
-                        body_material if ShaderMaterialNameKeywords.BODY_DIFFUSE in file else \
-                        body1_material if ShaderMaterialNameKeywords.BODY1_DIFFUSE in file else \
-                        body2_material if ShaderMaterialNameKeywords.BODY2_DIFFUSE in file else body_material
+                        body1_material if body_part == 'Body1' else \
+                        body2_material if body_part == 'Body2' else body_material
                     self.set_diffuse_texture(TextureType.BODY, selected_body_material, img)
                     # Set Face Id in Body_Diffuse because not all Face Diffuse filenames have the full costume name
                     # Ex. Diluc's costume does not have DilucCostumeFlamme, but just Diluc
@@ -580,16 +566,10 @@ class GenshinAvatarTextureImporter(GenshinTextureImporter):
                     self.set_diffuse_texture(TextureType.BODY, glass_material, img, texture_node_names=[V1_HoYoToonGenshinImpactTextureNodeNames.VFX_DIFFUSE]) if glass_material else None
                     if star_cloak_material and self.star_cloak_uses_body_texture(file):
                         self.set_diffuse_texture(TextureType.BODY, star_cloak_material, img)
-                elif self.is_one_texture_identifier_in_texture_name(
-                    [
-                        ShaderMaterialNameKeywords.BODY_LIGHTMAP, 
-                        ShaderMaterialNameKeywords.BODY1_LIGHTMAP, 
-                        ShaderMaterialNameKeywords.BODY2_LIGHTMAP, 
-                    ], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part in ('Body', 'Body1', 'Body2'):
                     selected_body_material = \
-                        body_material if ShaderMaterialNameKeywords.BODY_LIGHTMAP in file else \
-                        body1_material if ShaderMaterialNameKeywords.BODY1_LIGHTMAP in file else \
-                        body2_material if ShaderMaterialNameKeywords.BODY2_LIGHTMAP in file else body_material
+                        body1_material if body_part == 'Body1' else \
+                        body2_material if body_part == 'Body2' else body_material
                     self.set_lightmap_texture(TextureType.BODY, selected_body_material, img)
                     self.set_lightmap_texture(TextureType.BODY, leather_material, img) if leather_material else None
                     self.set_lightmap_texture(TextureType.BODY, pupil_material, img) if pupil_material else None
@@ -597,92 +577,83 @@ class GenshinAvatarTextureImporter(GenshinTextureImporter):
                         V1_HoYoToonGenshinImpactTextureNodeNames.BODY_LIGHTMAP_UV0, 
                         V1_HoYoToonGenshinImpactTextureNodeNames.BODY_LIGHTMAP_UV1
                     ]) if ribbon_material else None  # ONLY FOR OLDER VERSION SUPPORT, was told Columbina's Ribbon is not supposed to have Lightmap set up - b86c72dce5b754bf3ea4953582c962c6b77ccc53
-                elif self.is_texture_identifiers_in_texture_name([ShaderMaterialNameKeywords.BODY, ShaderMaterialNameKeywords.NORMAL_MAP], file):
+                elif texture_kind is TextureKind.NORMALMAP and body_part == 'Body':
                     self.set_normalmap_texture(TextureType.BODY, body_material, img)
                     self.set_normalmap_texture(TextureType.BODY, leather_material, img) if leather_material else None
-                elif self.is_one_texture_identifier_in_texture_name(
-                    [
-                        ShaderMaterialNameKeywords.BODY_SHADOW_RAMP,
-                        ShaderMaterialNameKeywords.BODY1_SHADOW_RAMP,
-                        ShaderMaterialNameKeywords.BODY2_SHADOW_RAMP,
-                    ], file):
-                    if ShaderMaterialNameKeywords.BODY2_SHADOW_RAMP in file:
+                elif texture_kind is TextureKind.SHADOW_RAMP and body_part in ('Body', 'Body2'):
+                    if body_part == 'Body2':
                         self.set_shadow_ramp_texture(TextureType.BODY2, img)
                     else:  # Body/Body1
                         self.set_shadow_ramp_texture(TextureType.BODY, img)
-                elif "Body_Specular_Ramp" in file or "Tex_Specular_Ramp" in file:
+                elif texture_kind is TextureKind.SPECULAR_RAMP:
                     self.set_specular_ramp_texture(TextureType.BODY, img)
-                elif "Face_Diffuse" in file:
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Face':
                     self.set_face_diffuse_texture(brow_material, img) if brow_material else None
                     self.set_face_diffuse_texture(face_material, img)
-                elif self.is_texture_identifiers_in_texture_name(['Face', 'Shadow'], file):
+                elif texture_kind is TextureKind.FACE_SHADOW:
                     self.set_face_shadow_texture(face_material, img)
-                elif self.is_texture_identifiers_in_texture_name(['Face', 'Lightmap'], file):
+                elif texture_kind is TextureKind.FACE_LIGHTMAP:
                     self.set_face_lightmap_texture(img)
-                elif "MetalMap" in file:
+                elif texture_kind is TextureKind.METALMAP:
                     self.set_metalmap_texture(img)
-                elif self.is_texture_identifiers_in_texture_name(['Glass', 'Diffuse'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Glass':
                     if glass_material:
                         self.set_glass_diffuse_texture(glass_material, img)
                     if glass_eff_material:
                         self.set_glass_diffuse_texture(glass_eff_material, img)
-                elif self.is_texture_identifiers_in_texture_name(['Glass', 'Lightmap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Glass':
                     if glass_material:
                         self.set_lightmap_texture(TextureType.BODY, glass_material, img)
                     if glass_eff_material:
                         self.set_lightmap_texture(TextureType.BODY, glass_eff_material, img)
-                elif "Gauntlet_Diffuse" in file:
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Gauntlet':
                     self.set_diffuse_texture(TextureType.BODY, gauntlet_material, img)
-                elif "Gauntlet_Ligntmap" in file:
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Gauntlet':
                     self.set_lightmap_texture(TextureType.BODY, gauntlet_material, img)
-                elif "Gauntlet_Normalmap" in file:
+                elif texture_kind is TextureKind.NORMALMAP and body_part == 'Gauntlet':
                     self.set_normalmap_texture(TextureType.BODY, gauntlet_material, img)
-                elif self.is_texture_identifiers_in_texture_name([ShaderMaterialNameKeywords.TAIL, 'Diffuse'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Tail':
                     if skirt_material:
                         self.set_diffuse_texture(TextureType.BODY, skirt_material, img)
-                elif self.is_texture_identifiers_in_texture_name([ShaderMaterialNameKeywords.SKILLOBJ, 'Diffuse'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'SkillObj':
                     expected_skillobj_identifier = file.split('_')[2]
-                    skillobj_material = bpy.data.materials.get(f'{self.material_names.SKILLOBJ} {expected_skillobj_identifier}')
+                    skillobj_material = self.material_set.get(f'{self.material_names.SKILLOBJ} {expected_skillobj_identifier}')
                     if skillobj_material:
                         self.set_diffuse_texture(TextureType.BODY, skillobj_material, img)
-                elif self.is_texture_identifiers_in_texture_name([ShaderMaterialNameKeywords.SKILLOBJ, 'Lightmap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'SkillObj':
                     expected_skillobj_identifier = file.split('_')[2]
-                    skillobj_material = bpy.data.materials.get(f'{self.material_names.SKILLOBJ} {expected_skillobj_identifier}')
+                    skillobj_material = self.material_set.get(f'{self.material_names.SKILLOBJ} {expected_skillobj_identifier}')
                     if skillobj_material:
                         self.set_lightmap_texture(TextureType.BODY, skillobj_material, img)
-                elif self.is_texture_identifiers_in_texture_name([ShaderMaterialNameKeywords.VEIL, 'Diffuse'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Veil':
                     if veil_material:
                         self.set_diffuse_texture(TextureType.BODY, veil_material, img)
-                elif self.is_texture_identifiers_in_texture_name([ShaderMaterialNameKeywords.VEIL, 'Lightmap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Veil':
                     if veil_material:
                         self.set_lightmap_texture(TextureType.BODY, veil_material, img)
-                elif "Effect_Diffuse" in file:  # keep at bottom as a last resort check (Skirk support)
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Effect':  # keep at bottom as a last resort check (Skirk support)
                     if star_cloak_material:
                         self.set_diffuse_texture(TextureType.HAIR, star_cloak_material, img)
                     else:  # backwards compatible before VFX shader existed, pre-v4.0
                         self.set_diffuse_texture(TextureType.HAIR, dress2_material, img)
-                elif "Effect_Lightmap" in file:  # keep at bottom as a last resort check (Skirk support)
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Effect':  # keep at bottom as a last resort check (Skirk support)
                     if star_cloak_material:  # No lightmap texture node as of this commit
                         self.set_lightmap_texture(TextureType.HAIR, star_cloak_material, img)
                     else:  # backwards compatible before VFX shader existed, pre-v4.0
                         self.set_lightmap_texture(TextureType.HAIR, dress2_material, img)
-                elif "Dress_Diffuse" in file:
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Dress':
                     if dress_material:
                         self.set_diffuse_texture(TextureType.BODY, dress_material, img)
-                elif "Dress_Lightmap" in file:
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Dress':
                     if dress_material:
                         self.set_lightmap_texture(TextureType.BODY, dress_material, img)
-                elif self.is_one_texture_identifier_in_texture_name([  # Nyx Color Ramp
-                    "NyxState_Ramp",
-                    "Nyx_Ramp",
-                    "Tex_Ramp"
-                ], file):
+                elif texture_kind is TextureKind.NYX_RAMP:
                     self.set_nyx_color_ramp_texture(img)
                     self.set_up_night_soul_outlines_material()
-                elif self.is_texture_identifiers_in_texture_name(ShaderMaterialNameKeywords.NIGHT_SOUL_MASK_IDENTIFIERS, file):
+                elif texture_kind is TextureKind.NIGHT_SOUL_MASK:
                     for material in bpy.data.materials.values():
                         self.set_up_night_soul_mask_texture(material, img)
-                elif self.is_texture_identifiers_in_texture_name([ShaderMaterialNameKeywords.STOCKINGS_DETAILMAP], file):
+                elif texture_kind is TextureKind.STOCKINGS:
                     self.set_stocking_texture(img)
                 else:
                     print(f'WARN: Ignoring texture {file}')
@@ -692,6 +663,8 @@ class GenshinAvatarTextureImporter(GenshinTextureImporter):
 
 
 class GenshinNPCTextureImporter(GenshinTextureImporter):
+    texture_filename_classifier = genshin_npc_texture_filename_classifier
+
     def __init__(self, material_names: ShaderMaterialNames):
         super().__init__(GameType.GENSHIN_IMPACT, TextureImporterType.NPC)
         self.material_names = material_names
@@ -700,81 +673,87 @@ class GenshinNPCTextureImporter(GenshinTextureImporter):
         self.genshin_shader_version = self.shader_identifier_service.identify_shader(bpy.data.materials, bpy.data.node_groups)
         self.shader_material_names = self.shader_identifier_service.get_shader_material_names_using_shader(self.genshin_shader_version)
 
+    @trace_span()
     def import_textures(self, directory):
-        for folder_name, folder, files in os.walk(directory):
+        self.material_set = MaterialSet(bpy.data.materials)
+
+        character_folder_manifest = CharacterFolderManifest.get(directory)
+        for folder_name, folder, files in character_folder_manifest.walk():
             self.files = files
+            self.has_dress_textures = character_folder_manifest.get_folder(folder_name).has_dress_textures
+            folder_context = self.texture_filename_classifier.get_folder_context(files)
             for file in files:
                 if not self.is_supported_texture(file):
                     continue
                 # load the file with the correct alpha mode
                 img_path = folder_name + "/" + file
-                img = bpy.data.images.load(filepath = img_path, check_existing=True)
+                if not texture_header_prefetcher.is_valid_texture(img_path):
+                    continue
+                img = texture_image_registry.load(img_path)
                 img.alpha_mode = 'CHANNEL_PACKED'
 
-                hair_material = bpy.data.materials.get(f'{self.material_names.MATERIAL_PREFIX}Hair')
-                face_material = bpy.data.materials.get(f'{self.material_names.MATERIAL_PREFIX}Face')
-                body_material = bpy.data.materials.get(f'{self.material_names.MATERIAL_PREFIX}Body')
-                star_cloak_material = bpy.data.materials.get(f'{self.material_names.STAR_CLOAK}')
+                hair_material = self.material_set.get(f'{self.material_names.MATERIAL_PREFIX}Hair')
+                face_material = self.material_set.get(f'{self.material_names.MATERIAL_PREFIX}Face')
+                body_material = self.material_set.get(f'{self.material_names.MATERIAL_PREFIX}Body')
+                star_cloak_material = self.material_set.get(self.material_names.STAR_CLOAK)
 
                 # Implement the texture in the correct node
                 print(f'Importing texture {file} using {self.__class__.__name__}')
-                if self.is_texture_identifiers_in_texture_name(['Hair', 'Diffuse'], file) and \
-                    not self.is_texture_identifiers_in_texture_name(['Eff'], file):
+                texture_kind, body_part = self.texture_filename_classifier.classify(file, folder_context)
+
+                if texture_kind is TextureKind.DIFFUSE and body_part == 'Hair':
                     self.set_diffuse_texture(TextureType.HAIR, hair_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Hair', 'Lightmap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Hair':
                     self.set_lightmap_texture(TextureType.HAIR, hair_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Hair', 'Normalmap'], file):
+                elif texture_kind is TextureKind.NORMALMAP and body_part == 'Hair':
                     self.set_normalmap_texture(TextureType.HAIR, hair_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Hair', 'Shadow_Ramp'], file):
+                elif texture_kind is TextureKind.SHADOW_RAMP and body_part == 'Hair':
                     self.set_shadow_ramp_texture(TextureType.HAIR, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Body', 'Diffuse'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Body':
                     self.set_diffuse_texture(TextureType.BODY, body_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Body', 'Lightmap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Body':
                     self.set_lightmap_texture(TextureType.BODY, body_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Body', 'Normalmap'], file):
+                elif texture_kind is TextureKind.NORMALMAP and body_part == 'Body':
                     self.set_normalmap_texture(TextureType.BODY, body_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Body', 'Shadow_Ramp'], file):
+                elif texture_kind is TextureKind.SHADOW_RAMP and body_part == 'Body':
                     self.set_shadow_ramp_texture(TextureType.BODY, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Body', 'Specular_Ramp'], file) or \
-                    self.is_texture_identifiers_in_texture_name(['Tex', 'Specular_Ramp'], file):
+                elif texture_kind is TextureKind.SPECULAR_RAMP:
                     self.set_specular_ramp_texture(TextureType.BODY, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Face', 'Diffuse'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Face':
                     self.set_face_diffuse_texture(face_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Face', 'Shadow'], file) or \
-                    (self.is_texture_identifiers_in_texture_name(['NPC', 'Face', 'Lightmap'], file) and
-                        not self.is_texture_identifiers_in_files(['Face', 'Shadow'], files)):
+                elif texture_kind is TextureKind.FACE_SHADOW:
                     # If Face Shadow exists, use that texture
                     # If Face Shadow does not exist in this folder, use "Face Lightmap" (actually an NPC Face Shadow texture)
                     self.set_face_shadow_texture(face_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Face', 'Lightmap'], file):
+                elif texture_kind is TextureKind.FACE_LIGHTMAP:
                     self.set_face_lightmap_texture(img)
 
-                elif self.is_texture_identifiers_in_texture_name(['MetalMap'], file):
+                elif texture_kind is TextureKind.METALMAP:
                     self.set_metalmap_texture(img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Cloak', 'Diffuse'], file):  # Paimon - VFX support
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Cloak':  # Paimon - VFX support
                     if star_cloak_material:
                         self.set_diffuse_texture(TextureType.HAIR, star_cloak_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Item', 'Diffuse'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Item':
                     # Remove the '_Mat' suffix on materials and the MATERIAL_PREFIX, then search if it matches the texture filename
                     item_materials = [material for material in bpy.data.materials if 
                                       material.name.split('_Mat')[0].replace(self.shader_material_names.MATERIAL_PREFIX, '') in file]
                     if item_materials:
                         item_material = item_materials[0]
                         self.set_diffuse_texture(TextureType.BODY, item_material, img)
-                elif self.is_texture_identifiers_in_texture_name(['Item', 'Lightmap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Item':
                     # Remove the '_Mat' suffix on materials and the MATERIAL_PREFIX, then search if it matches the texture filename
                     item_materials = [material for material in bpy.data.materials if 
                                       material.name.split('_Mat')[0].replace(self.shader_material_names.MATERIAL_PREFIX, '') in file]
@@ -782,41 +761,41 @@ class GenshinNPCTextureImporter(GenshinTextureImporter):
                         item_material = item_materials[0]
                         self.set_lightmap_texture(TextureType.BODY, item_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Hat', 'Diffuse'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Hat':
                     hat_materials = [material for material in bpy.data.materials if 'Hat' in material.name and 
                                      self.shader_material_names.MATERIAL_PREFIX in material.name]
                     if hat_materials:
                         hat_material = hat_materials[0]
                         self.set_diffuse_texture(TextureType.BODY, hat_material, img)
-                elif self.is_texture_identifiers_in_texture_name(['Hat', 'Lightmap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Hat':
                     hat_materials = [material for material in bpy.data.materials if 'Hat' in material.name and 
                                      self.shader_material_names.MATERIAL_PREFIX in material.name]
                     if hat_materials:
                         hat_material = hat_materials[0]
                         self.set_lightmap_texture(TextureType.BODY, hat_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Screw', 'Diffuse'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Screw':
                     screw_materials = [material for material in bpy.data.materials if 'Screw' in material.name and 
                                      self.shader_material_names.MATERIAL_PREFIX in material.name]
                     if screw_materials:
                         screw_material = screw_materials[0]
                         self.set_diffuse_texture(TextureType.BODY, screw_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Screw', 'Lightmap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Screw':
                     screw_materials = [material for material in bpy.data.materials if 'Screw' in material.name and 
                                      self.shader_material_names.MATERIAL_PREFIX in material.name]
                     if screw_materials:
                         screw_material = screw_materials[0]
                         self.set_lightmap_texture(TextureType.BODY, screw_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Others', 'Diffuse'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Others':
                     others_materials = [material for material in bpy.data.materials if 'Others' in material.name and 
                                      self.shader_material_names.MATERIAL_PREFIX in material.name]
                     if others_materials:
                         others_material = others_materials[0]
                         self.set_diffuse_texture(TextureType.BODY, others_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Others', 'Lightmap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Others':
                     others_materials = [material for material in bpy.data.materials if 'Others' in material.name and 
                                      self.shader_material_names.MATERIAL_PREFIX in material.name]
                     if others_materials:
@@ -829,6 +808,8 @@ class GenshinNPCTextureImporter(GenshinTextureImporter):
 
 
 class GenshinMonsterTextureImporter(GenshinTextureImporter):
+    texture_filename_classifier = genshin_monster_texture_filename_classifier
+
     def __init__(self, material_names: ShaderMaterialNames):
         super().__init__(GameType.GENSHIN_IMPACT, TextureImporterType.MONSTER)
         self.material_names = material_names
@@ -836,69 +817,68 @@ class GenshinMonsterTextureImporter(GenshinTextureImporter):
         self.shader_identifier_service = ShaderIdentifierServiceFactory.create(GameType.GENSHIN_IMPACT.name)
         self.genshin_shader_version = self.shader_identifier_service.identify_shader(bpy.data.materials, bpy.data.node_groups)
 
+    @trace_span()
     def import_textures(self, directory):
-        for folder_name, folder, files in os.walk(directory):
+        self.material_set = MaterialSet(bpy.data.materials)
+
+        character_folder_manifest = CharacterFolderManifest.get(directory)
+        for folder_name, folder, files in character_folder_manifest.walk():
             self.files = files
+            self.has_dress_textures = character_folder_manifest.get_folder(folder_name).has_dress_textures
+            folder_context = self.texture_filename_classifier.get_folder_context(files)
             for file in files:
                 if not self.is_supported_texture(file):
                     continue
                 # load the file with the correct alpha mode
                 img_path = folder_name + "/" + file
-                img = bpy.data.images.load(filepath = img_path, check_existing=True)
+                if not texture_header_prefetcher.is_valid_texture(img_path):
+                    continue
+                img = texture_image_registry.load(img_path)
                 img.alpha_mode = 'CHANNEL_PACKED'
 
-                hair_material = bpy.data.materials.get(f'{self.material_names.MATERIAL_PREFIX}Hair')
-                face_material = bpy.data.materials.get(f'{self.material_names.MATERIAL_PREFIX}Face')
-                body_material = bpy.data.materials.get(f'{self.material_names.MATERIAL_PREFIX}Body')
-                star_cloak_material = bpy.data.materials.get(f'{self.material_names.STAR_CLOAK}')
+                hair_material = self.material_set.get(f'{self.material_names.MATERIAL_PREFIX}Hair')
+                face_material = self.material_set.get(f'{self.material_names.MATERIAL_PREFIX}Face')
+                body_material = self.material_set.get(f'{self.material_names.MATERIAL_PREFIX}Body')
+                star_cloak_material = self.material_set.get(self.material_names.STAR_CLOAK)
 
                 # Implement the texture in the correct node
                 print(f'Importing texture {file} using {self.__class__.__name__}')
+                texture_kind, body_part = self.texture_filename_classifier.classify(file, folder_context)
 
-                if self.is_texture_identifiers_in_texture_name(['Body', 'Tex', 'Diffuse'], file) or \
-                    (self.is_texture_identifiers_in_texture_name(['Tex', 'Diffuse'], file) and \
-                    not self.is_texture_identifiers_in_files(['Hair'], files)):
+                if texture_kind is TextureKind.DIFFUSE and body_part == 'Body':
                     self.set_diffuse_texture(TextureType.BODY, body_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Body', 'Tex', 'Lightmap'], file) or \
-                    (self.is_texture_identifiers_in_texture_name(['Tex', 'Lightmap'], file) and \
-                    not self.is_texture_identifiers_in_files(['Hair'], files)):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Body':
                     self.set_lightmap_texture(TextureType.BODY, body_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Hair', 'Tex', 'Diffuse'], file) or \
-                    (self.is_texture_identifiers_in_texture_name(['Tex', 'Diffuse'], file) and \
-                    not self.is_texture_identifiers_in_files(['Body'], files)):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Hair':
                     self.set_diffuse_texture(TextureType.HAIR, hair_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Hair', 'Tex', 'Lightmap'], file) or \
-                    (self.is_texture_identifiers_in_texture_name(['Tex', 'Lightmap'], file) and \
-                    not self.is_texture_identifiers_in_files(['Body'], files)):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Hair':
                     self.set_lightmap_texture(TextureType.HAIR, hair_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Body_Shadow_Ramp'], file):
+                elif texture_kind is TextureKind.SHADOW_RAMP and body_part == 'Body':
                     self.set_shadow_ramp_texture(TextureType.BODY, img)
-                elif self.is_texture_identifiers_in_texture_name(['Hair_Shadow_Ramp'], file):
+                elif texture_kind is TextureKind.SHADOW_RAMP and body_part == 'Hair':
                     self.set_shadow_ramp_texture(TextureType.HAIR, img)
-                elif self.is_texture_identifiers_in_texture_name(['Tex', 'Specular_Ramp'], file):
+                elif texture_kind is TextureKind.SPECULAR_RAMP:
                     self.set_specular_ramp_texture(TextureType.BODY, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Face', 'Diffuse'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Face':
                     self.set_face_diffuse_texture(face_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Face', 'Shadow'], file) or \
-                    (self.is_texture_identifiers_in_texture_name(['NPC', 'Face', 'Lightmap'], file) and
-                        not self.is_texture_identifiers_in_files(['Face', 'Shadow'], files)):
+                elif texture_kind is TextureKind.FACE_SHADOW:
                     # If Face Shadow exists, use that texture
                     # If Face Shadow does not exist in this folder, use "Face Lightmap" (actually an NPC Face Shadow texture)
                     self.set_face_shadow_texture(face_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Face', 'Lightmap'], file):
+                elif texture_kind is TextureKind.FACE_LIGHTMAP:
                     self.set_face_lightmap_texture(img)
 
-                elif self.is_texture_identifiers_in_texture_name(['MetalMap'], file):
+                elif texture_kind is TextureKind.METALMAP:
                     self.set_metalmap_texture(img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Hand', 'Tex', 'Eff'], file):  # Asmoday - VFX Support
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Hand':  # Asmoday - VFX Support
                     self.set_diffuse_texture(TextureType.BODY, star_cloak_material, img)
 
                 else:
@@ -989,9 +969,9 @@ class HonkaiStarRailTextureImporter(GenshinTextureImporter):
             face_expression_node.image = img
 
     def set_stocking_texture(self, type: TextureType, material, img):
-        body_material = bpy.data.materials.get(self.material_names.BODY)
-        body1_material = bpy.data.materials.get(self.material_names.BODY1)
-        body2_material = bpy.data.materials.get(self.material_names.BODY2)
+        body_material = self.material_set.get(self.material_names.BODY)
+        body1_material = self.material_set.get(self.material_names.BODY1)
+        body2_material = self.material_set.get(self.material_names.BODY2)
         img.colorspace_settings.name='Non-Color'
 
         # If Body material or Body1 material apply to Body1 Stockings
@@ -1024,6 +1004,8 @@ class HonkaiStarRailTextureImporter(GenshinTextureImporter):
             body_stockings_node_group.nodes[self.texture_node_names.STOCKINGS].image = img
 
 class HonkaiStarRailAvatarTextureImporter(HonkaiStarRailTextureImporter):
+    texture_filename_classifier = honkai_star_rail_avatar_texture_filename_classifier
+
     def __init__(self, material_names: ShaderMaterialNames, texture_node_names: TextureNodeNames):
         super().__init__(
             GameType.HONKAI_STAR_RAIL, 
@@ -1033,52 +1015,58 @@ class HonkaiStarRailAvatarTextureImporter(HonkaiStarRailTextureImporter):
         )
         self.material_names = material_names
 
+    @trace_span()
     def import_textures(self, directory):
-        for folder_name, folder, files in os.walk(directory):
+        self.material_set = MaterialSet(bpy.data.materials)
+
+        for folder_name, folder, files in CharacterFolderManifest.get(directory).walk():
+            folder_context = self.texture_filename_classifier.get_folder_context(files)
             for file in files:
                 if not self.is_supported_texture(file):
                     continue
                 # load the file with the correct alpha mode
                 img_path = folder_name + "/" + file
-                img = bpy.data.images.load(filepath = img_path, check_existing=True)
+                if not texture_header_prefetcher.is_valid_texture(img_path):
+                    continue
+                img = texture_image_registry.load(img_path)
                 img.alpha_mode = 'CHANNEL_PACKED'
 
-                hair_material = bpy.data.materials.get(self.material_names.HAIR)
-                face_material = bpy.data.materials.get(self.material_names.FACE)
-                body_material = bpy.data.materials.get(self.material_names.BODY)
-                body1_material = bpy.data.materials.get(self.material_names.BODY1)
-                body2_material = bpy.data.materials.get(self.material_names.BODY2)
-                body3_material = bpy.data.materials.get(self.material_names.BODY3)
-                body_trans_material = bpy.data.materials.get(self.material_names.BODY_TRANS)
-                body2_trans_material = bpy.data.materials.get(self.material_names.BODY2_TRANS)
-                coat_material = bpy.data.materials.get(self.material_names.COAT)
-                weapon_material = bpy.data.materials.get(self.material_names.WEAPON)
-                weapon1_material = bpy.data.materials.get(self.material_names.WEAPON1)
-                weapon01_material = bpy.data.materials.get(self.material_names.WEAPON01)
-                weapon02_material = bpy.data.materials.get(self.material_names.WEAPON02)
-                weapon_trans_material = bpy.data.materials.get(self.material_names.WEAPON_TRANS)
+                hair_material = self.material_set.get(self.material_names.HAIR)
+                face_material = self.material_set.get(self.material_names.FACE)
+                body_material = self.material_set.get(self.material_names.BODY)
+                body1_material = self.material_set.get(self.material_names.BODY1)
+                body2_material = self.material_set.get(self.material_names.BODY2)
+                body3_material = self.material_set.get(self.material_names.BODY3)
+                body_trans_material = self.material_set.get(self.material_names.BODY_TRANS)
+                body2_trans_material = self.material_set.get(self.material_names.BODY2_TRANS)
+                coat_material = self.material_set.get(self.material_names.COAT)
+                weapon_material = self.material_set.get(self.material_names.WEAPON)
+                weapon1_material = self.material_set.get(self.material_names.WEAPON1)
+                weapon01_material = self.material_set.get(self.material_names.WEAPON01)
+                weapon02_material = self.material_set.get(self.material_names.WEAPON02)
+                weapon_trans_material = self.material_set.get(self.material_names.WEAPON_TRANS)
                 weapon_materials = [weapon_material, weapon1_material, weapon01_material, weapon02_material, weapon_trans_material]
-                handbag_material = bpy.data.materials.get(self.material_names.HANDBAG)
-                kendama_material = bpy.data.materials.get(self.material_names.KENDAMA)
+                handbag_material = self.material_set.get(self.material_names.HANDBAG)
+                kendama_material = self.material_set.get(self.material_names.KENDAMA)
 
                 # Implement the texture in the correct node
                 print(f'INFO: Importing texture {file} using {self.__class__.__name__}')
+                texture_kind, body_part = self.texture_filename_classifier.classify(file, folder_context)
 
-                if self.is_texture_identifiers_in_texture_name(['Hair', 'Color'], file) and \
-                    not self.is_texture_identifiers_in_texture_name(['Eff'], file):  # TODO: Review this line
+                if texture_kind is TextureKind.DIFFUSE and body_part == 'Hair':  # TODO: Review this line
                     self.set_diffuse_texture(TextureType.HAIR, hair_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Hair', 'LightMap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Hair':
                     self.set_lightmap_texture(TextureType.HAIR, hair_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Hair', 'Warm_Ramp'], file):
+                elif texture_kind is TextureKind.WARM_RAMP and body_part == 'Hair':
                     self.set_warm_shadow_ramp_texture(TextureType.HAIR, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Hair', 'Cool_Ramp'], file):
+                elif texture_kind is TextureKind.COOL_RAMP and body_part == 'Hair':
                     self.set_cool_shadow_ramp_texture(TextureType.HAIR, img)
                 
                 # Character has Body and no Body1 or Body2?
-                elif self.is_texture_identifiers_in_texture_name(['Body_', 'Color'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Body':
                     if body_material:
                         self.set_diffuse_texture(TextureType.BODY, body_material, img)
 
@@ -1095,7 +1083,7 @@ class HonkaiStarRailAvatarTextureImporter(HonkaiStarRailTextureImporter):
                         self.set_diffuse_texture(TextureType.BODY, body_trans_material, img)
 
                 # Character has Body and no Body1 or Body2?
-                elif self.is_texture_identifiers_in_texture_name(['Body_', 'LightMap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Body':
                     if body_material:
                         self.set_lightmap_texture(TextureType.BODY, body_material, img)
 
@@ -1111,108 +1099,101 @@ class HonkaiStarRailAvatarTextureImporter(HonkaiStarRailTextureImporter):
                     if body_trans_material:
                         self.set_lightmap_texture(TextureType.BODY, body_trans_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Body1', 'Color'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Body1':
                     self.set_diffuse_texture(TextureType.BODY, body1_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Body1', 'LightMap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Body1':
                     self.set_lightmap_texture(TextureType.BODY, body1_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Body2', 'Color'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Body2':
                     self.set_diffuse_texture(TextureType.BODY, body2_material, img)
 
                     if body2_trans_material:
                         self.set_diffuse_texture(TextureType.BODY, body2_trans_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Body2', 'LightMap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Body2':
                     self.set_lightmap_texture(TextureType.BODY, body2_material, img)
 
                     if body2_trans_material:
                         self.set_lightmap_texture(TextureType.BODY, body2_trans_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Body3', 'Color'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Body3':
                     self.set_diffuse_texture(TextureType.BODY, body3_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Body3', 'LightMap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Body3':
                     self.set_lightmap_texture(TextureType.BODY, body3_material, img)
 
-                elif (self.is_texture_identifiers_in_texture_name(['Warm_Ramp'], file) or \
-                    self.is_texture_identifiers_in_texture_name(['Body_Ramp'], file)) and \
-                        not self.is_texture_identifiers_in_texture_name(['Weapon'], file):  # Not Hair, so ramp must be Body
+                elif texture_kind is TextureKind.WARM_RAMP and body_part == 'Body':  # Not Hair, so ramp must be Body
                     self.set_warm_shadow_ramp_texture(TextureType.BODY, img)
                     self.set_weapon_ramp_texture(img)
 
                 # Not Hair, so ramp must be Body
-                elif self.is_texture_identifiers_in_texture_name(['Cool_Ramp'], file):
+                elif texture_kind is TextureKind.COOL_RAMP and body_part == 'Body':
                     self.set_cool_shadow_ramp_texture(TextureType.BODY, img)
 
                 # Not Hair, so ramp must be Body. Only one ramp texture exists (no specific Warm or Cool ramp)
                 # TODO: Unknown uses, previously this was to handle Svarog, but was updated)
-                elif self.is_texture_identifiers_in_texture_name(['Ramp'], file) and \
-                    not self.is_texture_identifiers_in_texture_name(['Weapon'], file):
+                elif texture_kind is TextureKind.RAMP and body_part == 'Body':
 
                     if self.is_texture_identifiers_in_texture_name(['Warm_Ramp'], file):
                         self.set_warm_shadow_ramp_texture(TextureType.BODY, img)
                     # TODO: RAMPS? Only supporting Warm Ramps for now
                     # self.set_cool_shadow_ramp_texture(TextureType.BODY, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Stockings'], file):
-                    if self.is_texture_identifiers_in_texture_name(['Body1'], file):
+                elif texture_kind is TextureKind.STOCKINGS:
+                    if body_part == 'Body1':
                         self.set_stocking_texture(TextureType.BODY, body1_material, img)
-                    elif self.is_texture_identifiers_in_texture_name(['Body2'], file):
+                    elif body_part == 'Body2':
                         self.set_stocking_texture(TextureType.BODY, body2_material, img)
-                    elif self.is_texture_identifiers_in_texture_name(['Body'], file):  # Must be AFTER Body1/Body2
+                    elif body_part == 'Body':
                         self.set_stocking_texture(TextureType.BODY, body_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Coat', 'Color'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Coat':
                     self.set_diffuse_texture(TextureType.BODY, coat_material, img)
-                elif self.is_texture_identifiers_in_texture_name(['Coat', 'LightMap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Coat':
                     self.set_lightmap_texture(TextureType.BODY, coat_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Face', 'Color'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Face':
                     self.set_diffuse_texture(TextureType.FACE, face_material, img)
 
                 # TODO: Review this whole block, NPC support is borrowed code from GI
-                elif self.is_texture_identifiers_in_texture_name(['FaceMap'], file) or \
-                    (self.is_texture_identifiers_in_texture_name(['NPC', 'Face', 'LightMap'], file) and
-                        not self.is_texture_identifiers_in_files(['FaceMap'], files)):
+                elif texture_kind is TextureKind.FACEMAP:
                     # If Face Shadow exists, use that texture
                     # If Face Shadow does not exist in this folder, use "Face Lightmap" (actually an NPC Face Shadow texture)
                     self.set_facemap_texture(img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Face_ExpressionMap'], file):
+                elif texture_kind is TextureKind.FACE_EXPRESSION_MAP:
                     self.set_face_expression_texture(face_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Weapon', 'Color'], file) and \
-                    not self.is_texture_identifiers_in_texture_name(['Screen'], file):  # Pela, Silverwolf
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Weapon':  # Pela, Silverwolf
                     for weapon_material in weapon_materials:
                         if weapon_material:
                             self.set_diffuse_texture(TextureType.WEAPON, weapon_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Weapon', 'LightMap'], file) or \
-                    self.is_texture_identifiers_in_texture_name(['Weapon', 'LigthMap'], file):  # Yes, intentional typo (Asta)
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Weapon':  # Includes the intentional LigthMap typo (Asta)
 
                     for weapon_material in weapon_materials:
                         if weapon_material:
                             self.set_lightmap_texture(TextureType.WEAPON, weapon_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Weapon', 'Ramp'], file):
+                elif texture_kind is TextureKind.RAMP and body_part == 'Weapon':
                     # Set Weapon Ramp, if none exists use Body Ramp
                     self.set_weapon_ramp_texture(img, override=True)
 
-                elif self.is_texture_identifiers_in_texture_name(['Handbag', 'Color'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Handbag':
                     self.set_diffuse_texture(TextureType.WEAPON, handbag_material, img)
                 
-                elif self.is_texture_identifiers_in_texture_name(['Handbag', 'Lightmap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Handbag':
                     self.set_lightmap_texture(TextureType.WEAPON, handbag_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Kendama', 'Color'], file):
+                elif texture_kind is TextureKind.DIFFUSE and body_part == 'Kendama':
                     self.set_diffuse_texture(TextureType.WEAPON, kendama_material, img)
 
-                elif self.is_texture_identifiers_in_texture_name(['Kendama', 'Lightmap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP and body_part == 'Kendama':
                     self.set_lightmap_texture(TextureType.WEAPON, kendama_material, img)
 
                 # Fallback, best guess attempt by assigning the texture to materials containing the texture name
-                elif self.is_texture_identifiers_in_texture_name(['Color'], file):
+                elif texture_kind is TextureKind.DIFFUSE:
                     try:
                         body_part = file.split('_')[3]
                         body_part_materials = [material for material in bpy.data.materials if body_part in material.name]
@@ -1220,7 +1201,7 @@ class HonkaiStarRailAvatarTextureImporter(HonkaiStarRailTextureImporter):
                             self.set_diffuse_texture(TextureType.BODY, body_part_material, img)
                     except IndexError:
                         print(f'WARN: Unexpected format when trying fallback texture assignment on: {file}')
-                elif self.is_texture_identifiers_in_texture_name(['LightMap'], file):
+                elif texture_kind is TextureKind.LIGHTMAP:
                     try:
                         body_part = file.split('_')[3]
                         body_part_materials = [material for material in bpy.data.materials if body_part in material.name]
@@ -1311,6 +1292,8 @@ class PunishingGrayRavenTextureImporter(GenshinTextureImporter):
 
 
 class PunishingGrayRavenAvatarTextureImporter(PunishingGrayRavenTextureImporter):
+    texture_filename_classifier = punishing_gray_raven_avatar_texture_filename_classifier
+
     def __init__(self, material_names: ShaderMaterialNames, texture_node_names: TextureNodeNames):
         super().__init__(GameType.PUNISHING_GRAY_RAVEN, TextureImporterType.PGR_AVATAR, texture_node_names)
         self.material_names = material_names
@@ -1318,26 +1301,34 @@ class PunishingGrayRavenAvatarTextureImporter(PunishingGrayRavenTextureImporter)
         shader_identifier_service = ShaderIdentifierServiceFactory.create(GameType.PUNISHING_GRAY_RAVEN.name)
         self.genshin_shader_version = shader_identifier_service.identify_shader(bpy.data.materials, bpy.data.node_groups)
 
+    @trace_span()
     def import_textures(self, directory):
-        for folder_name, folder, files in os.walk(directory):
+        self.material_set = MaterialSet(bpy.data.materials)
+
+        character_folder_manifest = CharacterFolderManifest.get(directory)
+        for folder_name, folder, files in character_folder_manifest.walk():
             self.files = files
+            self.has_dress_textures = character_folder_manifest.get_folder(folder_name).has_dress_textures
+            folder_context = self.texture_filename_classifier.get_folder_context(files)
             for file in files:
                 if not self.is_supported_texture(file):
                     continue
                 # load the file with the correct alpha mode
                 img_path = folder_name + "/" + file
-                img = bpy.data.images.load(filepath = img_path, check_existing=True)
+                if not texture_header_prefetcher.is_valid_texture(img_path):
+                    continue
+                img = texture_image_registry.load(img_path)
                 img.alpha_mode = 'CHANNEL_PACKED'
 
-                alpha_material = bpy.data.materials.get(f'{self.material_names.ALPHA}') 
-                eye_material = bpy.data.materials.get(f'{self.material_names.EYE}')
+                alpha_material = self.material_set.get(self.material_names.ALPHA) 
+                eye_material = self.material_set.get(self.material_names.EYE)
 
                 # Implement the texture in the correct node
                 print(f'Importing texture {file} using {self.__class__.__name__}')
+                texture_kind, body_part = self.texture_filename_classifier.classify(file, folder_context)
 
                 # Eyes
-                if self.is_texture_identifiers_in_texture_name(['Eye'], file) and \
-                    not self.is_one_texture_identifier_in_texture_name(['HET'], file):
+                if texture_kind is TextureKind.EYE:
                     self.set_eye_diffuse_texture(eye_material, img)
 
                 else:
@@ -1358,13 +1349,12 @@ class PunishingGrayRavenAvatarTextureImporter(PunishingGrayRavenTextureImporter)
                         materials = [material for material in bpy.data.materials if material.name.replace(JaredNytsPunishingGrayRavenShaderMaterialNames.MATERIAL_PREFIX, '') in texture_body_part_name]
 
                     if materials:
-                        material = bpy.data.materials.get(max([material.name for material in materials], key=len))
+                        material = self.material_set.get(max([material.name for material in materials], key=len))
                         body_part_name = material.name.replace(JaredNytsPunishingGrayRavenShaderMaterialNames.MATERIAL_PREFIX, '')
                         img = self.reload_texture(img, img_path)  # reloads only if the texture already exists
 
-                        if 'AO' in file and \
-                            not self.is_one_texture_identifier_in_texture_name(['HEAO'], file):
-                            if 'Face' in file:
+                        if texture_kind is TextureKind.AO:
+                            if body_part == 'Face':
                                 self.set_face_heao_texture(img)
                             elif 'Cloth' in body_part_name and 'UV' not in file:
                                 cloth_materials = [material for material in bpy.data.materials if 'Cloth' in material.name]
@@ -1372,17 +1362,17 @@ class PunishingGrayRavenAvatarTextureImporter(PunishingGrayRavenTextureImporter)
                                     self.set_lightmap_texture(TextureType.BODY, material, img)
                             else:
                                 self.set_lightmap_texture(TextureType.BODY, material, img)
-                        elif 'HEAO' in file:
-                            if 'Face' in file:
+                        elif texture_kind is TextureKind.HEAO:
+                            if body_part == 'Face':
                                 self.set_face_heao_texture(img)
                             else:
                                 self.set_lightmap_texture(TextureType.BODY, material, img)
-                        elif 'NM' in file:
+                        elif texture_kind is TextureKind.NORMALMAP:
                             self.set_normalmap_texture(TextureType.BODY, material, img)
-                        elif 'PBR' in file:
+                        elif texture_kind is TextureKind.PBR:
                             self.set_pbr_texture(TextureType.BODY, material, img)
-                        elif 'Skin' in file:
-                            if 'Face' in file:
+                        elif texture_kind is TextureKind.LUT:
+                            if body_part == 'Face':
                                 self.set_lut_texture(TextureType.FACE, material, img)
                             else:
                                 self.set_lut_texture(TextureType.BODY, material, img)
@@ -1424,7 +1414,7 @@ class PunishingGrayRavenAvatarTextureImporter(PunishingGrayRavenTextureImporter)
         if image_exists:
             print(f'Reloading texture! {img}')
             bpy.data.images.remove(image_exists[0])
-            img = bpy.data.images.load(filepath = img_path, check_existing=True)
+            img = texture_image_registry.load(img_path)
             img.alpha_mode = 'CHANNEL_PACKED'
         return img
 
@@ -1436,5 +1426,6 @@ class PunishingGrayRavenChibiTextureImporter(PunishingGrayRavenTextureImporter):
         shader_identifier_service = ShaderIdentifierServiceFactory.create(GameType.PUNISHING_GRAY_RAVEN.name)
         self.genshin_shader_version = shader_identifier_service.identify_shader(bpy.data.materials, bpy.data.node_groups)
 
+    @trace_span()
     def import_textures(self, directory):
         pass
\ No newline at end of file
@@ -0,0 +1,153 @@
+# Author: michael-gh1
+
+import json
+import os
+
+from collections import defaultdict
+
+import bpy
+
+from setup_wizard.texture_import_setup.proxy_texture_cache import ProxyTextureCache
+from setup_wizard.texture_import_setup.texture_header_prefetcher import InvalidTextureHeaderError, texture_header_prefetcher
+from setup_wizard.texture_import_setup.texture_image_registry import TextureFileHasher
+
+DEFAULT_OVERSIZED_TEXTURE_SIZE = 2048
+MIPMAP_MEMORY_FACTOR = 4 / 3
+
+TEXTURE_ROLE_KEYWORDS = [
+    # Checked in order, ex. 'Face_Lightmap' is a Lightmap, 'Hair_Shadow_Ramp' is a Ramp
+    ('Normalmap', ['normalmap', 'normal']),
+    ('Ramp', ['ramp']),
+    ('Lightmap', ['lightmap', 'ligntmap', 'ligthmap', 'facemap', 'face_shadow']),
+    ('Diffuse', ['diffuse', 'color', 'basecolor']),
+]
+OTHER_TEXTURE_ROLE = 'Other'
+
+
+class TextureMemoryReporter:
+    '''
+    Estimates the texture memory of materials (ex. a character's materials) without loading any pixels.
+
+    Memory is estimated from the texture file header (resolution, channels and bit depth), as Blender stores them:
+        CPU: RGBA, 8-bit textures as bytes and higher bit depths as 32-bit floats
+        GPU: RGBA, 8-bit textures as bytes and higher bit depths as 16-bit floats, plus mipmaps
+
+    Images in node groups are included (ex. shadow ramps). Duplicates (same texture content in more than one image)
+    and oversized textures are flagged.
+    '''
+    def __init__(self, oversized_texture_size=DEFAULT_OVERSIZED_TEXTURE_SIZE):
+        self.oversized_texture_size = oversized_texture_size
+
+    def create_report(self, materials):
+        images = {}  # image name: image report
+        materials_report = {}
+        image_names_by_content_hash = defaultdict(list)
+
+        for material in materials:
+            if not material or not material.node_tree:
+                continue
+            textures_by_role = defaultdict(list)
+
+            for node in self.__get_image_nodes(material.node_tree):
+                image = node.image
+                if image.name not in images:
+                    images[image.name] = self.create_image_report(image)
+                    content_hash = images[image.name].pop('content_hash')
+                    if content_hash:
+                        image_names_by_content_hash[content_hash].append(image.name)
+
+                texture_role = self.get_texture_role(node.name, image.name)
+                if image.name not in textures_by_role[texture_role]:
+                    textures_by_role[texture_role].append(image.name)
+
+            if textures_by_role:
+                material_image_names = {image_name for image_names in textures_by_role.values() for image_name in image_names}
+                materials_report[material.name] = {
+                    'textures': dict(textures_by_role),
+                    'estimated_cpu_bytes': sum(images[image_name]['estimated_cpu_bytes'] for image_name in material_image_names),
+                    'estimated_gpu_bytes': sum(images[image_name]['estimated_gpu_bytes'] for image_name in material_image_names),
+                }
+
+        for image_names in image_names_by_content_hash.values():
+            for duplicate_image_name in image_names[1:]:
+                images[duplicate_image_name]['duplicate_of'] = image_names[0]
+
+        return {
+            'images': images,
+            'materials': materials_report,
+            'duplicate_images': [image_name for image_name, image in images.items() if image['duplicate_of']],
+            'oversized_images': [image_name for image_name, image in images.items() if image['is_oversized']],
+            'total_estimated_cpu_bytes': sum(image['estimated_cpu_bytes'] for image in images.values()),
+            'total_estimated_gpu_bytes': sum(image['estimated_gpu_bytes'] for image in images.values()),
+        }
+
+    def create_image_report(self, image):
+        file_path = bpy.path.abspath(image.filepath) if image.filepath else ''
+        try:
+            header = texture_header_prefetcher.get_header(file_path)
+            width, height, channels, bit_depth = header.width, header.height, header.channels, header.bit_depth
+        except InvalidTextureHeaderError:  # ex. packed or generated images
+            width, height = image.size
+            channels = image.channels
+            bit_depth = image.depth // max(channels, 1)
+
+        try:
+            content_hash = TextureFileHasher.get_hash(file_path) if file_path else None
+        except OSError:
+            content_hash = None
+
+        bytes_per_channel_cpu = 1 if bit_depth <= 8 else 4
+        bytes_per_channel_gpu = 1 if bit_depth <= 8 else 2
+        return {
+            'file_path': file_path,
+            'width': width,
+            'height': height,
+            'channels': channels,
+            'bit_depth': bit_depth,
+            'is_proxy': ProxyTextureCache.is_proxy(image),
+            'estimated_cpu_bytes': width * height * 4 * bytes_per_channel_cpu,
+            'estimated_gpu_bytes': int(width * height * 4 * bytes_per_channel_gpu * MIPMAP_MEMORY_FACTOR),
+            'is_oversized': max(width, height) > self.oversized_texture_size,
+            'duplicate_of': None,
+            'content_hash': content_hash,
+        }
+
+    @staticmethod
+    def get_texture_role(node_name, image_name):
+        for texture_role, keywords in TEXTURE_ROLE_KEYWORDS:
+            if any(keyword in node_name.lower() for keyword in keywords):
+                return texture_role
+        for texture_role, keywords in TEXTURE_ROLE_KEYWORDS:
+            if any(keyword in image_name.lower() for keyword in keywords):
+                return texture_role
+        return OTHER_TEXTURE_ROLE
+
+    @staticmethod
+    def write_json(report, file_path):
+        os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+        with open(file_path, 'w') as file:
+            json.dump(report, file, indent=4)
+
+    def __get_image_nodes(self, node_tree, visited_node_trees=None):
+        visited_node_trees = visited_node_trees if visited_node_trees is not None else set()
+        if node_tree.name in visited_node_trees:
+            return
+        visited_node_trees.add(node_tree.name)
+
+        for node in node_tree.nodes:
+            if node.type == 'TEX_IMAGE' and node.image:
+                yield node
+            elif node.type == 'GROUP' and node.node_tree:
+                yield from self.__get_image_nodes(node.node_tree, visited_node_trees)
+
+
+def get_character_materials(armature):
+    '''
+    Materials of the meshes parented to the armature
+    '''
+    materials = []
+    for mesh in [child for child in armature.children_recursive if child.type == 'MESH']:
+        for material_slot in mesh.material_slots:
+            if material_slot.material and material_slot.material not in materials:
+                materials.append(material_slot.material)
+    return materials
@@ -36,6 +36,21 @@ class UI_Properties:
             default = False
         )
 
+        bpy.types.WindowManager.proxy_textures_enabled = bpy.props.BoolProperty(
+            name = "Proxy Textures",
+            description = "Imports reduced resolution textures for lighter layout and animation scenes",
+            default = False
+        )
+
+        bpy.types.WindowManager.proxy_texture_scale = bpy.props.EnumProperty(
+            name = "Proxy Resolution",
+            items = [
+                ('2', '1/2', 'Half resolution proxy textures'),
+                ('4', '1/4', 'Quarter resolution proxy textures'),
+            ],
+            default = '2'
+        )
+
 
 class GI_PT_Setup_Wizard_UI_Layout(Panel, GenshinImpactUIRenderChecker):
     bl_label = "Genshin Impact Setup Wizard"
@@ -77,6 +92,16 @@ class GI_PT_Setup_Wizard_UI_Layout(Panel, GenshinImpactUIRenderChecker):
             game_type=GameType.GENSHIN_IMPACT.name,
         )
 
+        row = settings_box.row()
+        row.prop(window_manager, 'proxy_textures_enabled')
+        row.prop(window_manager, 'proxy_texture_scale', text='')
+        OperatorFactory.create(
+            row,
+            'hoyoverse.swap_proxy_textures',
+            'Swap',
+            'IMAGE_DATA',
+        )
+
         if betterfbx_installed:
             row2 = settings_box.row()
             row2.prop(window_manager, 'setup_wizard_betterfbx_enabled')
@@ -302,6 +327,13 @@ class GI_PT_UI_Finish_Setup_Menu(Panel, GenshinImpactUIRenderChecker):
             'GREASEPENCIL',
             game_type=GameType.GENSHIN_IMPACT.name,
         )
+        OperatorFactory.create(
+            sub_layout,
+            'hoyoverse.texture_memory_report',
+            'Texture Memory Report',
+            'TEXTURE',
+            operator_context='INVOKE_DEFAULT'
+        )
 
 
 class GI_PT_UI_Character_Rig_Setup_Menu(Panel, GenshinImpactUIRenderChecker):
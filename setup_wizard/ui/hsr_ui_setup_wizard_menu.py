@@ -49,6 +49,16 @@ class HSR_PT_Setup_Wizard_UI_Layout(Panel, HonkaiStarRailUIRenderChecker):
             game_type=GameType.HONKAI_STAR_RAIL.name,
         )
 
+        row = settings_box.row()
+        row.prop(window_manager, 'proxy_textures_enabled')
+        row.prop(window_manager, 'proxy_texture_scale', text='')
+        OperatorFactory.create(
+            row,
+            'hoyoverse.swap_proxy_textures',
+            'Swap',
+            'IMAGE_DATA',
+        )
+
         # settings_box.prop(window_manager, 'setup_wizard_full_run_rigging_enabled')  # temp disabled, feature preview only
 
 class HSR_PT_Basic_Setup_Wizard_UI_Layout(Panel, HonkaiStarRailUIRenderChecker):
@@ -286,6 +296,13 @@ class HSR_PT_UI_Finish_Setup_Menu(Panel, HonkaiStarRailUIRenderChecker):
             'Set Up ArmTwist Bone Constraints',
             'CONSTRAINT_BONE'
         )
+        OperatorFactory.create(
+            sub_layout,
+            'hoyoverse.texture_memory_report',
+            'Texture Memory Report',
+            'TEXTURE',
+            operator_context='INVOKE_DEFAULT'
+        )
 
 
 class HSR_PT_UI_Character_Rig_Setup_Menu(Panel, HonkaiStarRailUIRenderChecker):
@@ -68,6 +68,16 @@ class PGR_PT_Setup_Wizard_UI_Layout(Panel, PunishingGrayRavenUIRenderChecker):
             game_type=GameType.PUNISHING_GRAY_RAVEN.name,
         )
 
+        row = settings_box.row()
+        row.prop(window_manager, 'proxy_textures_enabled')
+        row.prop(window_manager, 'proxy_texture_scale', text='')
+        OperatorFactory.create(
+            row,
+            'hoyoverse.swap_proxy_textures',
+            'Swap',
+            'IMAGE_DATA',
+        )
+
         if betterfbx_installed:
             row2 = settings_box.row()
             row2.prop(window_manager, 'setup_wizard_betterfbx_enabled')
@@ -330,6 +340,13 @@ class PGR_PT_UI_Finish_Setup_Menu(Panel, PunishingGrayRavenUIRenderChecker):
             'Set Up ArmTwist Bone Constraints',
             'CONSTRAINT_BONE'
         )
+        OperatorFactory.create(
+            sub_layout,
+            'hoyoverse.texture_memory_report',
+            'Texture Memory Report',
+            'TEXTURE',
+            operator_context='INVOKE_DEFAULT'
+        )
         # OperatorFactory.create(
         #     sub_layout,
         #     'hoyoverse.join_meshes_on_armature',
@@ -1,4 +1,5 @@
 import bpy
+import os
 
 from bpy.props import EnumProperty
 from bpy.types import Panel
@@ -6,6 +7,7 @@ from bpy.types import Panel
 from setup_wizard.addon_updater import addon_updater_ops
 from setup_wizard import bl_info
 from setup_wizard.domain.game_types import GameType
+from setup_wizard.instrumentation.step_instrumentation import PipelineInstrumentation
 
 
 class CSW_PT_Unified_Character_Setup_Wizard_UI_Layout(Panel):
@@ -32,6 +34,24 @@ class CSW_PT_Unified_Character_Setup_Wizard_UI_Layout(Panel):
         default = False
     )
 
+    bpy.types.Scene.character_setup_wizard_instrumentation_enabled = bpy.props.BoolProperty(
+        name = "(Debug) Step Instrumentation",
+        description = "Measures the time of each Setup Wizard step and writes a run report to the Addon Config Directory",
+        default = False
+    )
+
+    bpy.types.Scene.character_setup_wizard_allocation_tracing_enabled = bpy.props.BoolProperty(
+        name = "(Debug) Trace Python Allocations",
+        description = "Also measures the peak Python allocations of each step with tracemalloc. Slows down the Setup Wizard considerably",
+        default = False
+    )
+
+    bpy.types.Scene.character_setup_wizard_tracing_enabled = bpy.props.BoolProperty(
+        name = "(Debug) Enable Tracing",
+        description = "Traces the Setup Wizard (importers, appliers, appends, rig phases) and writes Chrome Trace and speedscope files to the Addon Config Directory",
+        default = False
+    )
+
     def draw(self, context):
         layout = self.layout
 
@@ -45,3 +65,36 @@ class CSW_PT_Unified_Character_Setup_Wizard_UI_Layout(Panel):
         sub_layout = layout.box()
         sub_layout.prop(context.scene, 'game_type_dropdown')
         sub_layout.prop(context.scene, 'character_setup_wizard_logging_enabled')
+        sub_layout.prop(context.scene, 'character_setup_wizard_instrumentation_enabled')
+        allocation_tracing_row = sub_layout.row()
+        allocation_tracing_row.enabled = context.scene.character_setup_wizard_instrumentation_enabled
+        allocation_tracing_row.prop(context.scene, 'character_setup_wizard_allocation_tracing_enabled')
+        sub_layout.prop(context.scene, 'character_setup_wizard_tracing_enabled')
+
+
+class CSW_PT_Setup_Wizard_Run_Report(Panel):
+    bl_label = "Last Setup Wizard Run"
+    bl_idname = 'CSW_PT_Setup_Wizard_Run_Report'
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_parent_id = 'CSW_PT_Unified_Character_Setup_Wizard_UI_Layout'
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        instrumentation = PipelineInstrumentation.last_instrumentation
+
+        if not instrumentation or not instrumentation.step_metrics:
+            layout.label(text='No instrumented runs yet')
+            return
+
+        layout.label(text=f'{instrumentation.pipeline_name}: {instrumentation.get_total_wall_time():.2f}s', icon='TIME')
+        col = layout.box().column(align=True)
+        col.label(text='Slowest Steps:')
+        for step_metrics in instrumentation.get_slowest_steps():
+            row = col.row()
+            row.label(text=step_metrics.component_name)
+            row.label(text=f'{step_metrics.wall_time:.2f}s' + (' (file browser)' if step_metrics.waited_for_input else ''))
+            row.label(text=f'{step_metrics.peak_allocated_bytes / (1024 * 1024):.1f} MB, +{step_metrics.created_datablocks}')
+        if instrumentation.report_file_path:
+            layout.label(text=os.path.basename(instrumentation.report_file_path), icon='FILE')
@@ -0,0 +1,140 @@
+# Author: michael-gh1
+
+import os
+from typing import List, NamedTuple
+
+TEXTURE_FILE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.tga')
+MATERIAL_DATA_FOLDER_NAMES = ('Material', 'Materials')
+
+
+class CharacterFolder(NamedTuple):
+    path: str
+    folder_names: List[str]
+    file_names: List[str]
+    entry_names: List[str]  # folders and files, in the order os.listdir() returns them
+    modified_time: int
+    has_dress_textures: bool
+
+
+class CharacterFolderManifest:
+    '''
+    The files of a character folder and its subfolders, scanned once with os.scandir() and shared by every step
+    of a setup run (model, texture, material data and outline texture import).
+
+    Files are also bucketed by role: fbx files, texture files and material data files.
+
+    Manifests are cached per directory. A cached manifest is reused on reruns until the modified time of one of its
+    folders changes (a file was added, removed or renamed), then the directory is scanned again.
+    '''
+    manifests = {}
+
+    def __init__(self, directory: str, folders: List[CharacterFolder]):
+        self.directory = directory
+        self.folders = folders
+        self.folders_by_path = {os.path.normpath(folder.path): folder for folder in folders}
+
+        self.fbx_files = []
+        self.texture_files = []
+        for folder in folders:
+            for file_name in folder.file_names:
+                extension = os.path.splitext(file_name)[1]
+                if '.fbx' in extension:
+                    self.fbx_files.append(os.path.join(folder.path, file_name))
+                if file_name.endswith(TEXTURE_FILE_EXTENSIONS):
+                    self.texture_files.append(os.path.join(folder.path, file_name))
+
+        self.files = folders[0].file_names if folders else []
+        self.material_data_directory = next((
+            os.path.join(directory, folder_name) for folder_name in MATERIAL_DATA_FOLDER_NAMES if
+            self.get_folder(os.path.join(directory, folder_name))
+        ), None)
+        self.material_data_files = self.get_folder(self.material_data_directory).entry_names if \
+            self.material_data_directory else []
+        self.has_dress_textures = any(folder.has_dress_textures for folder in folders)
+
+    @classmethod
+    def get(cls, directory: str):
+        directory = os.path.normpath(directory)
+        manifest = cls.manifests.get(directory)
+
+        if manifest is None or not manifest.is_up_to_date():
+            manifest = cls.scan(directory)
+            cls.manifests[directory] = manifest
+        return manifest
+
+    @classmethod
+    def clear(cls):
+        cls.manifests.clear()
+
+    @classmethod
+    def scan(cls, directory: str):
+        folders = []
+        folder_paths = [directory]
+
+        # Same top-down order as os.walk() and, like os.walk(), symlinked folders are listed but not followed
+        while folder_paths:
+            folder_path = folder_paths.pop()
+            try:
+                modified_time = os.stat(folder_path).st_mtime_ns
+                with os.scandir(folder_path) as entries:
+                    entries = list(entries)
+            except OSError:
+                continue
+
+            folder_names = []
+            file_names = []
+            subfolder_paths = []
+            for entry in entries:
+                try:
+                    is_folder = entry.is_dir()
+                except OSError:
+                    is_folder = False
+                if is_folder:
+                    folder_names.append(entry.name)
+                    if not entry.is_symlink():
+                        subfolder_paths.append(entry.path)
+                else:
+                    file_names.append(entry.name)
+
+            folders.append(CharacterFolder(
+                path=folder_path,
+                folder_names=folder_names,
+                file_names=file_names,
+                entry_names=[entry.name for entry in entries],
+                modified_time=modified_time,
+                has_dress_textures=cls.is_dress_texture_in_files(file_names),
+            ))
+            folder_paths.extend(reversed(subfolder_paths))
+        return cls(directory, folders)
+
+    def is_up_to_date(self):
+        try:
+            return bool(self.folders) and all(
+                os.stat(folder.path).st_mtime_ns == folder.modified_time for folder in self.folders
+            )
+        except OSError:
+            return False
+
+    def walk(self):
+        '''
+        Drop-in replacement for os.walk(directory)
+        '''
+        for folder in self.folders:
+            yield folder.path, folder.folder_names, folder.file_names
+
+    def get_folder(self, folder_path: str):
+        return self.folders_by_path.get(os.path.normpath(folder_path)) if folder_path else None
+
+    def get_entry_names(self, folder_path: str):
+        '''
+        Drop-in replacement for os.listdir(folder_path), falls back to it for folders outside of the manifest
+        '''
+        folder = self.get_folder(folder_path)
+        return folder.entry_names if folder else os.listdir(folder_path)
+
+    @staticmethod
+    def is_dress_texture_in_files(file_names):
+        return any(
+            'Dress' in file_name and ('Diffuse' in file_name or 'Lightmap' in file_name) and '.png' in file_name
+            for file_name in file_names
+        )
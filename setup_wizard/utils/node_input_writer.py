@@ -0,0 +1,89 @@
+# Author: michael-gh1
+
+from numbers import Number
+
+FLOAT_TOLERANCE = 1e-6
+
+
+class NodeInputWriteStatistics:
+    def __init__(self):
+        self.written = 0
+        self.skipped = 0
+
+
+class NodeInputWriter:
+    '''
+    Writes values to node inputs (default_value) and ID properties (ex. geometry nodes modifier inputs)
+    only if the value is different from the current value. Every write tags the material for a depsgraph update
+    and shader recompile, so re-applying the same values (ex. re-running material data import) is skipped.
+
+    Writes done vs. skipped are counted per material.
+    '''
+    def __init__(self, float_tolerance=FLOAT_TOLERANCE):
+        self.float_tolerance = float_tolerance
+        self.statistics = {}
+
+    def write(self, node_input, value, material_name=None):
+        '''
+        Sets node_input.default_value, raises AttributeError if node_input is None (or has no default_value),
+        same as assigning it directly would.
+        '''
+        if self.is_equal(node_input.default_value, value):
+            self.__get_statistics(material_name).skipped += 1
+            return False
+
+        node_input.default_value = value
+        self.__get_statistics(material_name).written += 1
+        return True
+
+    def write_property(self, owner, key, value, material_name=None):
+        try:
+            is_equal = self.is_equal(owner[key], value)
+        except KeyError:
+            is_equal = False
+
+        if is_equal:
+            self.__get_statistics(material_name).skipped += 1
+            return False
+
+        owner[key] = value
+        self.__get_statistics(material_name).written += 1
+        return True
+
+    def is_equal(self, current_value, value):
+        if isinstance(current_value, Number) and isinstance(value, Number):
+            return abs(current_value - value) <= self.float_tolerance
+        if isinstance(current_value, (str, bytes)) or isinstance(value, (str, bytes)):
+            return current_value == value
+
+        try:
+            if len(current_value) != len(value):
+                return False
+            return all(self.is_equal(current_item, item) for current_item, item in zip(current_value, value))
+        except TypeError:  # Not a sequence (ex. Image, Object)
+            pass
+
+        try:
+            return current_value == value
+        except Exception:
+            return False
+
+    def get_statistics(self, material_name):
+        return self.statistics.get(material_name)
+
+    def reset_statistics(self):
+        self.statistics = {}
+
+    def print_statistics(self):
+        for material_name, statistics in self.statistics.items():
+            print(f'INFO: {material_name}: {statistics.written} inputs written, {statistics.skipped} unchanged inputs skipped')
+
+    def __get_statistics(self, material_name) -> NodeInputWriteStatistics:
+        statistics = self.statistics.get(material_name)
+        if statistics is None:
+            statistics = NodeInputWriteStatistics()
+            self.statistics[material_name] = statistics
+        return statistics
+
+
+node_input_writer = NodeInputWriter()